@@ -0,0 +1,44 @@
+"""
+基准测试公共工具
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# 添加 src 目录到Python路径，便于直接运行脚本
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+# 测试目录，语料生成复用测试中的图片生成函数
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+
+def timed(func, *args, **kwargs):
+    """执行函数并计时
+
+    Args:
+        func: 要执行的函数
+
+    Returns:
+        tuple: (函数返回值, 耗时秒数)
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def emit_json(name, results, path=None):
+    """以 JSON 格式输出基准测试结果
+
+    Args:
+        name: 基准测试名称
+        results: 结果列表
+        path: 输出文件路径，为 None 时输出到标准输出
+    """
+    payload = {"benchmark": name, "python": sys.version.split()[0], "results": results}
+    text = json.dumps(payload, ensure_ascii=False, indent=2)
+    if path:
+        Path(path).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+引用块嵌套层级基准测试
+
+生成包含 N 个段落的单个引用块（类似邮件往来导出），测量引用层级解析的
+耗时，验证其随段落数线性增长。
+
+默认使用只记录层级的引用块转换器，以便把层级解析与 python-docx 的段落
+生成开销分开；加上 --emit 则使用真实的转换器生成完整文档。
+
+使用示例:
+  python benchmarks/bench_blockquote.py
+  python benchmarks/bench_blockquote.py --sizes 1000 10000 --json result.json
+  python benchmarks/bench_blockquote.py --sizes 1000 5000 --emit
+"""
+
+import argparse
+
+from _common import emit_json, timed
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.block_index import BlockIndex
+from mddocx.converter.elements.base import ElementConverter
+
+
+class LevelRecorder(ElementConverter):
+    """只记录引用层级、不生成段落的引用块转换器"""
+
+    def __init__(self, base_converter=None):
+        super().__init__(base_converter)
+        self.levels = []
+
+    def convert(self, tokens, level=None):
+        self.levels.append(level)
+
+
+def make_quote_document(paragraphs: int) -> str:
+    """生成引用块文档，每 10 段插入一层嵌套引用"""
+    lines = []
+    for k in range(paragraphs):
+        prefix = ">> " if k % 10 == 9 else "> "
+        lines.append(f"{prefix}第 {k} 段引用内容，**回复**内容")
+        lines.append(prefix.rstrip())
+    return "\n".join(lines) + "\n"
+
+
+def run(sizes, emit=False):
+    """运行基准测试
+
+    Args:
+        sizes: 段落数列表
+        emit: 是否使用真实的引用块转换器生成文档
+
+    Returns:
+        list: 每个规模的测量结果
+    """
+    results = []
+    for size in sizes:
+        text = make_quote_document(size)
+        tokens, parse_time = timed(BaseConverter().md.parse, text)
+        _, index_time = timed(BlockIndex, tokens)
+        converter = BaseConverter()
+        if not emit:
+            converter.register_converter("blockquote", LevelRecorder(converter))
+        _, convert_time = timed(converter.convert, text)
+        results.append(
+            {
+                "paragraphs": size,
+                "tokens": len(tokens),
+                "parse_seconds": round(parse_time, 4),
+                "index_seconds": round(index_time, 4),
+                "convert_seconds": round(convert_time, 4),
+                "us_per_paragraph": round(convert_time / size * 1e6, 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="引用块层级解析基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="引用段落数量 (默认: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--emit", action="store_true", help="使用真实的引用块转换器生成完整文档"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.emit)
+    if args.json:
+        emit_json("blockquote", results, args.json)
+
+    print(
+        f"{'段落数':>10} {'tokens':>10} {'索引(s)':>10} {'转换(s)':>10} {'us/段':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['paragraphs']:>10} {r['tokens']:>10} {r['index_seconds']:>10} "
+            f"{r['convert_seconds']:>10} {r['us_per_paragraph']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+DOCX 压缩配置基准测试
+
+对每种压缩配置（default、store、fast、max、store-media）保存同一份文档，
+报告保存耗时（多次取中位数）和输出文件大小，用于在保存速度和文件大小之间
+取舍。语料分别为纯文本、代码块，以及文本加不可压缩的大图片（模拟照片）。
+
+使用示例:
+  python benchmarks/bench_compression.py
+  python benchmarks/bench_compression.py --cases text photos --size 5000 --json result.json
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from _common import emit_json
+from corpora import code, paragraphs, write_noise_png
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.package import COMPRESSION_PROFILES, save_docx
+
+CASES = ["text", "code", "photos"]
+
+
+class CountingSink:
+    """只统计写入字节数的不可 seek 输出流"""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def build_text(case, size):
+    """生成语料 Markdown 文本"""
+    if case == "text":
+        return paragraphs(size)
+    if case == "code":
+        return code(size)
+    image_dir = Path(tempfile.mkdtemp(prefix="mddocx-bench-"))
+    parts = [paragraphs(size)]
+    for k in range(4):
+        path = image_dir / f"photo_{k}.png"
+        write_noise_png(path, 4)
+        parts.append(f"![照片 {k}]({path.as_posix()})")
+    return "\n\n".join(parts)
+
+
+def measure(document, profile, repeat):
+    """按指定配置保存若干次，返回 (耗时中位数秒, 输出字节数)"""
+    seconds = []
+    for _ in range(repeat):
+        sink = CountingSink()
+        start = time.perf_counter()
+        save_docx(document, sink, profile)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds), sink.size
+
+
+def run(cases, size, repeat):
+    """运行基准测试
+
+    Args:
+        cases: 语料名称列表
+        size: 语料规模
+        repeat: 每种配置的保存次数
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for case in cases:
+        document = BaseConverter(fast_xml=True).convert(build_text(case, size))
+        baseline = None
+        for profile in COMPRESSION_PROFILES:
+            seconds, size_bytes = measure(document, profile, repeat)
+            if baseline is None:
+                baseline = (seconds, size_bytes)
+            results.append(
+                {
+                    "case": case,
+                    "size": size,
+                    "profile": profile,
+                    "save_s": round(seconds, 4),
+                    "output_kb": round(size_bytes / 1024, 1),
+                    "time_vs_default": round(seconds / baseline[0], 2),
+                    "size_vs_default": round(size_bytes / baseline[1], 3),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOCX 压缩配置基准测试")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=CASES,
+        default=CASES,
+        help="要运行的语料 (默认: text code photos)",
+    )
+    parser.add_argument("--size", type=int, default=2000, help="语料规模 (默认: 2000)")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="每种配置的保存次数 (默认: 3)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.cases, args.size, args.repeat)
+    if args.json:
+        emit_json("compression", results, args.json)
+
+    for r in results:
+        print(
+            f"{r['case']:<8} {r['profile']:<12} save {r['save_s']:>8.4f} s "
+            f"(x{r['time_vs_default']:.2f})  size {r['output_kb']:>10.1f} KB "
+            f"(x{r['size_vs_default']:.3f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
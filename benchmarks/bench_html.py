@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+HTML 块基准测试
+
+转换由 HTML 无序/有序列表块组成的文档，给出默认输出和快速输出的整体耗时
+以及每个块的耗时：每块耗时保持不变即为线性扩展。同时比较在转换结果上用
+``document.paragraphs[-1]`` 与正文游标取最后一个段落的耗时。
+
+使用示例:
+  python benchmarks/bench_html.py
+  python benchmarks/bench_html.py --sizes 1000 20000 --json result.json
+"""
+
+import argparse
+import time
+
+from _common import emit_json, timed
+from corpora import _sentence
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.cursor import get_body_cursor
+
+# 每种方式取最后一个段落的次数
+LOOKUPS = 100
+
+
+def html_lists(size):
+    """size 个 HTML 列表块，无序和有序列表交替，每块 3 项"""
+    blocks = []
+    for k in range(size):
+        tag = "ol" if k % 2 else "ul"
+        items = "".join(
+            f"<li>项目 {k}.{j} <strong>{_sentence(k + j, 2)}</strong></li>\n"
+            for j in range(3)
+        )
+        blocks.append(f"<{tag}>\n{items}</{tag}>\n")
+    return "\n".join(blocks)
+
+
+def lookup_time(document, cursor):
+    """取 LOOKUPS 次最后一个段落，返回每次的平均耗时（秒）"""
+    start = time.perf_counter()
+    if cursor:
+        body_cursor = get_body_cursor(document)
+        for _ in range(LOOKUPS):
+            body_cursor.last_paragraph()
+    else:
+        for _ in range(LOOKUPS):
+            document.paragraphs[-1]
+    return (time.perf_counter() - start) / LOOKUPS
+
+
+def run(sizes):
+    """运行基准测试
+
+    Args:
+        sizes: HTML 块数量列表
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for size in sizes:
+        text = html_lists(size)
+        for fast_xml in (False, True):
+            document, seconds = timed(BaseConverter(fast_xml=fast_xml).convert, text)
+            result = {
+                "size": size,
+                "fast_xml": fast_xml,
+                "convert_s": round(seconds, 4),
+                "us_per_block": round(seconds / size * 1e6, 2),
+            }
+            if not fast_xml:
+                result["paragraphs_lookup_us"] = round(
+                    lookup_time(document, cursor=False) * 1e6, 2
+                )
+                result["cursor_lookup_us"] = round(
+                    lookup_time(document, cursor=True) * 1e6, 2
+                )
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 块基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[2000, 5000, 20000],
+        help="HTML 列表块数量 (默认: 2000 5000 20000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    if args.json:
+        emit_json("html", results, args.json)
+
+    for r in results:
+        mode = "fast_xml" if r["fast_xml"] else "default "
+        line = (
+            f"{r['size']:>6} blocks  {mode} convert {r['convert_s']:>8.4f} s "
+            f"({r['us_per_block']:>8.2f} us/block)"
+        )
+        if "cursor_lookup_us" in r:
+            line += (
+                f"  last paragraph: paragraphs[-1] {r['paragraphs_lookup_us']:>9.2f} us"
+                f"  cursor {r['cursor_lookup_us']:>6.2f} us"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
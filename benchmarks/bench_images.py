@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+图片存储基准测试
+
+比较 python-docx 的 ``run.add_picture`` 与 ImageStore 在不同图片数量下插入
+图片的耗时：每个文档只有少量不同的图片（图标、标志），其余都是重复出现。
+同时给出图片密集语料的整体转换耗时和去重节省的字节数。
+
+使用示例:
+  python benchmarks/bench_images.py
+  python benchmarks/bench_images.py --sizes 500 2000 10000 --json result.json
+"""
+
+import argparse
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+from _common import emit_json, timed
+from corpora import images, write_png
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.image_store import get_image_store
+from mddocx.converter.template import new_document
+
+
+def logos(count, image_dir):
+    """生成 count 张尺寸不同的图片，返回图片数据列表"""
+    blobs = []
+    for k in range(count):
+        path = Path(image_dir) / f"logo_{k}.png"
+        write_png(path, width=16 + k, height=16)
+        blobs.append(path.read_bytes())
+    return blobs
+
+
+def insert_time(blobs, count, stored):
+    """在新文档中插入 count 张图片（轮流使用 blobs），返回耗时（秒）"""
+    document = new_document()
+    start = time.perf_counter()
+    if stored:
+        store = get_image_store(document)
+        for k in range(count):
+            entry = store.get(str(k % len(blobs)))
+            if entry is None:
+                entry = store.add(blobs[k % len(blobs)], str(k % len(blobs)))
+            store.add_picture(document.add_paragraph().add_run(), entry)
+    else:
+        for k in range(count):
+            run = document.add_paragraph().add_run()
+            run.add_picture(BytesIO(blobs[k % len(blobs)]))
+    return time.perf_counter() - start
+
+
+def run(sizes, distinct, python_docx_limit):
+    """运行基准测试
+
+    Args:
+        sizes: 图片数量列表
+        distinct: 不同图片的数量
+        python_docx_limit: 超过该数量时不再测量 python-docx（平方复杂度太慢）
+
+    Returns:
+        list: 测量结果
+    """
+    image_dir = tempfile.mkdtemp(prefix="mddocx-bench-")
+    blobs = logos(distinct, image_dir)
+    results = []
+    for size in sizes:
+        stored = insert_time(blobs, size, stored=True)
+        result = {
+            "size": size,
+            "distinct": distinct,
+            "store_s": round(stored, 4),
+            "store_us_per_image": round(stored / size * 1e6, 2),
+        }
+        if size <= python_docx_limit:
+            baseline = insert_time(blobs, size, stored=False)
+            result["add_picture_s"] = round(baseline, 4)
+            result["add_picture_us_per_image"] = round(baseline / size * 1e6, 2)
+        converter = BaseConverter(fast_xml=True, profile=True)
+        _, seconds = timed(converter.convert, images(size, image_dir))
+        stats = converter.get_stats()
+        result["convert_images_s"] = round(seconds, 4)
+        result["image_bytes_deduplicated"] = stats.image_bytes_deduplicated
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="图片存储基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[500, 2000, 5000],
+        help="图片数量 (默认: 500 2000 5000)",
+    )
+    parser.add_argument(
+        "--distinct", type=int, default=8, help="不同图片的数量 (默认: 8)"
+    )
+    parser.add_argument(
+        "--python-docx-limit",
+        type=int,
+        default=2000,
+        help="python-docx add_picture 的最大测量规模 (默认: 2000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.distinct, args.python_docx_limit)
+    if args.json:
+        emit_json("images", results, args.json)
+
+    for r in results:
+        baseline = (
+            f"add_picture {r['add_picture_s']:>8.4f} s "
+            f"({r['add_picture_us_per_image']:>8.2f} us/image)"
+            if "add_picture_s" in r
+            else "add_picture       (skipped)"
+        )
+        print(
+            f"{r['size']:>6} images  store {r['store_s']:>8.4f} s "
+            f"({r['store_us_per_image']:>6.2f} us/image)  {baseline}  "
+            f"convert {r['convert_images_s']:>8.4f} s  "
+            f"dedup {r['image_bytes_deduplicated']} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
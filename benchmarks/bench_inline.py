@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+内联格式基准测试
+
+对比逐个调用 python-docx 属性设置文本块格式（``run.bold``、``run.italic``、
+``run.font.strike`` 等）与复制格式位对应的 rPr 模板的耗时，并给出格式密集
+文本（每段多处粗体、斜体、删除线、行内代码）的生成阶段（emit）耗时。
+
+使用示例:
+  python benchmarks/bench_inline.py
+  python benchmarks/bench_inline.py --sizes 1000 5000 --json result.json
+"""
+
+import argparse
+import time
+
+from _common import emit_json
+from corpora import _sentence
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.inline import BOLD, CODE, ITALIC, STRIKE, apply_format, format_run
+from mddocx.converter.template import new_document
+
+MASKS = [0, BOLD, ITALIC, BOLD | ITALIC, STRIKE, CODE, BOLD | CODE]
+
+
+def formatted(size):
+    """格式密集的段落，每段十几处强调和行内代码"""
+    return "\n".join(
+        " ".join(
+            f"{_sentence(k + j, 3)} **{_sentence(k, 2)}** *{_sentence(j, 2)}* "
+            f"~~{_sentence(k + 1, 1)}~~ `c{j}` ***{_sentence(j + 1, 1)}***"
+            for j in range(3)
+        )
+        + "\n"
+        for k in range(size)
+    )
+
+
+def format_time(size, cached):
+    """为 size 个文本块设置格式，返回耗时（秒）"""
+    paragraph = new_document().add_paragraph()
+    runs = [paragraph.add_run("文本") for _ in range(size)]
+    start = time.perf_counter()
+    for k, run in enumerate(runs):
+        mask = MASKS[k % len(MASKS)]
+        if cached:
+            format_run(run, mask)
+        else:
+            apply_format(run, mask)
+    return time.perf_counter() - start
+
+
+def emit_time(text, fast_xml):
+    """转换一次，返回生成阶段耗时（秒）"""
+    converter = BaseConverter(profile=True, fast_xml=fast_xml)
+    converter.convert(text)
+    return converter.get_stats().emit_time
+
+
+def run(sizes):
+    """运行基准测试
+
+    Args:
+        sizes: 规模列表（文本块数量 / 段落数量）
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for size in sizes:
+        setter_seconds = format_time(size * 10, cached=False)
+        template_seconds = format_time(size * 10, cached=True)
+        results.append(
+            {
+                "case": "format_runs",
+                "size": size * 10,
+                "setters_s": round(setter_seconds, 4),
+                "template_s": round(template_seconds, 4),
+                "speedup": round(setter_seconds / template_seconds, 2),
+            }
+        )
+        text = formatted(size)
+        for fast_xml in (False, True):
+            results.append(
+                {
+                    "case": "formatted_emit",
+                    "size": size,
+                    "fast_xml": fast_xml,
+                    "emit_s": round(emit_time(text, fast_xml), 4),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="内联格式基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[500, 2000],
+        help="段落数量，文本块数量为其 10 倍 (默认: 500 2000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    if args.json:
+        emit_json("inline", results, args.json)
+
+    for r in results:
+        if r["case"] == "format_runs":
+            print(
+                f"{r['size']:>7} runs        setters {r['setters_s']:>8.4f} s  "
+                f"template {r['template_s']:>8.4f} s  x{r['speedup']}"
+            )
+        else:
+            mode = "fast_xml" if r["fast_xml"] else "default "
+            print(f"{r['size']:>7} paragraphs  {mode} emit {r['emit_s']:>8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+超链接关系索引基准测试
+
+比较 python-docx 的 ``part.relate_to`` 与 RelationshipIndex 在不同链接数量下
+建立超链接关系的耗时（一半是新地址，一半是重复地址），并给出链接密集语料的
+整体转换耗时。单个链接的耗时保持不变即为线性扩展。
+
+使用示例:
+  python benchmarks/bench_links.py
+  python benchmarks/bench_links.py --sizes 1000 10000 50000 --json result.json
+"""
+
+import argparse
+import time
+
+from _common import emit_json, timed
+from corpora import links
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.relations import get_relationship_index
+from mddocx.converter.template import new_document
+
+
+def urls(count):
+    """生成 count 个链接地址，其中一半与前面的地址重复"""
+    return [f"https://example.com/api/{k // 2 if k % 2 else k}" for k in range(count)]
+
+
+def relate_time(count, indexed):
+    """为 count 个链接建立关系，返回耗时（秒）"""
+    document = new_document()
+    targets = urls(count)
+    start = time.perf_counter()
+    if indexed:
+        index = get_relationship_index(document)
+        for url in targets:
+            index.external(url)
+    else:
+        part = document.part
+        for url in targets:
+            part.relate_to(url, RT.HYPERLINK, is_external=True)
+    return time.perf_counter() - start
+
+
+def run(sizes, python_docx_limit):
+    """运行基准测试
+
+    Args:
+        sizes: 链接数量列表
+        python_docx_limit: 超过该数量时不再测量 python-docx（平方复杂度太慢）
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for size in sizes:
+        indexed = relate_time(size, indexed=True)
+        result = {
+            "size": size,
+            "index_s": round(indexed, 4),
+            "index_us_per_link": round(indexed / size * 1e6, 2),
+        }
+        if size <= python_docx_limit:
+            baseline = relate_time(size, indexed=False)
+            result["relate_to_s"] = round(baseline, 4)
+            result["relate_to_us_per_link"] = round(baseline / size * 1e6, 2)
+        # 语料每段 3 个链接
+        _, seconds = timed(BaseConverter(fast_xml=True).convert, links(size // 3))
+        result["convert_links_s"] = round(seconds, 4)
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="超链接关系索引基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000, 50000],
+        help="链接数量 (默认: 1000 5000 20000 50000)",
+    )
+    parser.add_argument(
+        "--python-docx-limit",
+        type=int,
+        default=5000,
+        help="python-docx relate_to 的最大测量规模 (默认: 5000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.python_docx_limit)
+    if args.json:
+        emit_json("links", results, args.json)
+
+    for r in results:
+        baseline = (
+            f"relate_to {r['relate_to_s']:>9.4f} s ({r['relate_to_us_per_link']:>8.2f} us/link)"
+            if "relate_to_s" in r
+            else "relate_to       (skipped)"
+        )
+        print(
+            f"{r['size']:>7} links  index {r['index_s']:>8.4f} s "
+            f"({r['index_us_per_link']:>6.2f} us/link)  {baseline}  "
+            f"convert {r['convert_links_s']:>8.4f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+图片内存缓存基准测试
+
+模拟长期运行、复用同一个转换器的服务：依次转换多篇文档，每篇引用几张新的
+本地图片，并重复引用上一篇文档中的一张图片。比较不限大小的缓存与按字节数
+限制大小的 LRU 缓存在全部文档转换完之后占用的内存，以及命中、淘汰次数和
+每篇文档的平均转换耗时。
+
+使用示例:
+  python benchmarks/bench_memory_cache.py
+  python benchmarks/bench_memory_cache.py --documents 100 --budget 8 --json result.json
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from _common import emit_json, timed
+from corpora import write_noise_png
+
+from mddocx.converter.base import BaseConverter
+
+MB = 1024 * 1024
+
+
+def documents(image_dir, count, per_document):
+    """count 篇文档，每篇 per_document 张新图片，并引用上一篇的第一张图片"""
+    texts = []
+    for d in range(count):
+        paths = []
+        for k in range(per_document):
+            path = Path(image_dir) / f"doc{d}_{k}.png"
+            write_noise_png(path, 1)
+            paths.append(path)
+        if d:
+            paths.append(Path(image_dir) / f"doc{d - 1}_0.png")
+        texts.append("".join(f"![图]({p})\n\n" for p in paths))
+    return texts
+
+
+def run(count, per_document, budget):
+    """运行基准测试
+
+    Args:
+        count: 文档数量
+        per_document: 每篇文档的新图片数量
+        budget: 受限缓存的大小上限（字节）
+
+    Returns:
+        list: 测量结果
+    """
+    texts = documents(tempfile.mkdtemp(prefix="mddocx-bench-"), count, per_document)
+    results = []
+    for mode, max_bytes in (("unbounded", 1 << 62), ("bounded", budget)):
+        converter = BaseConverter(profile=True, image_memory_max_bytes=max_bytes)
+        hits = misses = evictions = 0
+        total = 0.0
+        for text in texts:
+            converter.reset()
+            _, seconds = timed(converter.convert, text)
+            total += seconds
+            stats = converter.get_stats()
+            hits += stats.memory_cache_hits
+            misses += stats.memory_cache_misses
+            evictions += stats.memory_cache_evictions
+        results.append(
+            {
+                "documents": count,
+                "mode": mode,
+                "max_bytes": max_bytes if mode == "bounded" else None,
+                "cache_bytes": stats.memory_cache_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+                "per_document_ms": round(total / count * 1000, 3),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="图片内存缓存基准测试")
+    parser.add_argument("--documents", type=int, default=60, help="文档数量 (默认: 60)")
+    parser.add_argument(
+        "--images", type=int, default=2, help="每篇文档的新图片数量 (默认: 2)"
+    )
+    parser.add_argument(
+        "--budget", type=int, default=16, help="受限缓存的大小上限，MB (默认: 16)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.documents, args.images, args.budget * MB)
+    if args.json:
+        emit_json("memory_cache", results, args.json)
+
+    for r in results:
+        print(
+            f"{r['documents']:>5} docs  {r['mode']:<9}  "
+            f"cache {r['cache_bytes'] / MB:>8.1f} MB  hits {r['hits']:>4}  "
+            f"misses {r['misses']:>4}  evictions {r['evictions']:>4}  "
+            f"{r['per_document_ms']:>8.3f} ms/doc"
+        )
+
+
+if __name__ == "__main__":
+    main()
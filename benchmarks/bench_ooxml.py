@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+OOXML 快速输出基准测试
+
+分别使用 python-docx 代理对象和 OoxmlWriter（``BaseConverter(fast_xml=True)``）
+转换同一份语料，比较生成阶段（emit）的耗时。解析和保存两种方式相同，不计入。
+
+使用示例:
+  python benchmarks/bench_ooxml.py
+  python benchmarks/bench_ooxml.py --cases paragraphs headings --sizes 1000 5000 --json result.json
+"""
+
+import argparse
+
+from _common import emit_json
+from corpora import CORPORA
+
+from mddocx.converter.base import BaseConverter
+
+DEFAULT_CASES = ["paragraphs", "headings", "deep_lists", "task_lists"]
+
+
+def emit_time(text, fast_xml):
+    """转换一次，返回生成阶段耗时（秒）"""
+    converter = BaseConverter(profile=True, fast_xml=fast_xml)
+    converter.convert(text)
+    return converter.get_stats().emit_time
+
+
+def run(cases, sizes):
+    """运行基准测试
+
+    Args:
+        cases: 语料名称列表
+        sizes: 规模列表
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for case in cases:
+        for size in sizes:
+            text = CORPORA[case](size)
+            docx_seconds = emit_time(text, fast_xml=False)
+            fast_seconds = emit_time(text, fast_xml=True)
+            results.append(
+                {
+                    "case": case,
+                    "size": size,
+                    "python_docx_s": round(docx_seconds, 4),
+                    "fast_xml_s": round(fast_seconds, 4),
+                    "speedup": round(docx_seconds / fast_seconds, 2),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OOXML 快速输出基准测试")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=sorted(CORPORA),
+        default=DEFAULT_CASES,
+        help="要运行的语料 (默认: paragraphs headings deep_lists task_lists)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[200, 1000],
+        help="语料规模 (默认: 200 1000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.cases, args.sizes)
+    if args.json:
+        emit_json("ooxml", results, args.json)
+
+    for r in results:
+        print(
+            f"{r['case']:<12} {r['size']:>7} python-docx {r['python_docx_s']:>9.4f} s  "
+            f"fast_xml {r['fast_xml_s']:>9.4f} s  x{r['speedup']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
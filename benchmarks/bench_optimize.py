@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+图片优化基准测试
+
+生成若干张相机照片尺寸的 JPEG（像素为放大后的随机噪声，接近照片的压缩率），
+文档中按 ``|宽x高`` 指定较小的显示尺寸。比较原样嵌入与按显示尺寸缩小、
+重新压缩后的转换和保存耗时、DOCX 大小，以及不同处理线程数的耗时。
+
+需要安装 Pillow：``pip install mddocx[images]``。
+
+使用示例:
+  python benchmarks/bench_optimize.py
+  python benchmarks/bench_optimize.py --images 16 --size 4000x3000 --json result.json
+"""
+
+import argparse
+import os
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+from _common import emit_json, timed
+from PIL import Image
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.optimize import DEFAULT_OPTIMIZE_WORKERS, ImageOptimizer
+
+
+def write_photo(path, width, height):
+    """写入一张接近照片压缩率的 JPEG"""
+    small = (width // 2, height // 2)
+    noise = Image.frombytes("RGB", small, os.urandom(small[0] * small[1] * 3))
+    noise.resize((width, height)).save(path, "JPEG", quality=95)
+
+
+def run(count, width, height, workers):
+    """运行基准测试
+
+    Args:
+        count: 图片数量
+        width: 图片宽度（像素）
+        height: 图片高度（像素）
+        workers: 处理线程数列表
+
+    Returns:
+        list: 测量结果
+    """
+    image_dir = Path(tempfile.mkdtemp(prefix="mddocx-bench-"))
+    paths = []
+    for k in range(count):
+        path = image_dir / f"photo_{k}.jpg"
+        write_photo(path, width, height)
+        paths.append(path)
+    original = sum(p.stat().st_size for p in paths)
+    text = "".join(f"![照片 {k}|400x300]({p})\n\n" for k, p in enumerate(paths))
+
+    results = []
+    for mode, max_workers in [("original", None)] + [("optimize", n) for n in workers]:
+        converter = BaseConverter(profile=True)
+        if max_workers is not None:
+            converter.image_optimizer = ImageOptimizer(max_workers=max_workers)
+        _, convert_s = timed(converter.convert, text)
+        out = BytesIO()
+        _, save_s = timed(converter.save, out)
+        stats = converter.get_stats()
+        results.append(
+            {
+                "images": count,
+                "mode": mode,
+                "workers": max_workers,
+                "original_bytes": original,
+                "convert_s": round(convert_s, 4),
+                "optimize_s": round(stats.optimize_time, 4),
+                "save_s": round(save_s, 4),
+                "docx_bytes": len(out.getvalue()),
+                "bytes_saved": stats.image_bytes_saved,
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="图片优化基准测试")
+    parser.add_argument("--images", type=int, default=8, help="图片数量 (默认: 8)")
+    parser.add_argument(
+        "--size", default="3000x2000", help="图片像素尺寸 宽x高 (默认: 3000x2000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, DEFAULT_OPTIMIZE_WORKERS}),
+        help="处理线程数 (默认: 1 和 CPU 核心数，最多 4)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    results = run(args.images, width, height, args.workers)
+    if args.json:
+        emit_json("optimize", results, args.json)
+
+    for r in results:
+        workers = r["workers"] or "-"
+        print(
+            f"{r['images']:>4} images  {r['mode']:<8}  workers {workers:>2}  "
+            f"convert {r['convert_s']:>7.3f} s  save {r['save_s']:>7.3f} s  "
+            f"docx {r['docx_bytes'] / 1e6:>8.2f} MB  saved {r['bytes_saved'] / 1e6:>8.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+DOCX 流式打包基准测试
+
+分别用 python-docx 的 ``Document.save`` 和 ``save_docx`` 把同一份文档写入
+一个丢弃数据的不可 seek 输出流，比较耗时和打包期间 Python 内存分配的峰值
+（tracemalloc，不含文档本身已占用的内存）。文档由长段落和若干张随机噪声
+（不可压缩）的大图片组成。
+
+使用示例:
+  python benchmarks/bench_package.py
+  python benchmarks/bench_package.py --paragraphs 50000 --images 8 --image-mb 8 --json result.json
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from _common import emit_json
+from corpora import paragraphs, write_noise_png
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.package import save_docx
+
+
+class NullSink:
+    """丢弃写入数据的不可 seek 输出流"""
+
+    def write(self, data):
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def build_document(paragraph_count, image_count, image_mb):
+    """生成包含长段落和大图片的文档"""
+    image_dir = Path(tempfile.mkdtemp(prefix="mddocx-bench-"))
+    text = [paragraphs(paragraph_count)]
+    for k in range(image_count):
+        path = image_dir / f"image_{k}.png"
+        write_noise_png(path, image_mb)
+        text.append(f"![图 {k}]({path.as_posix()})")
+    return BaseConverter(fast_xml=True).convert("\n\n".join(text))
+
+
+def measure(save, document):
+    """保存两次，分别测量耗时和分配峰值，返回 (耗时秒, 分配峰值 MB)
+
+    tracemalloc 本身会拖慢大量小对象的分配，计时单独进行。
+    """
+    start = time.perf_counter()
+    save(document, NullSink())
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    save(document, NullSink())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024
+
+
+def run(paragraph_count, image_count, image_mb):
+    """运行基准测试
+
+    Args:
+        paragraph_count: 段落数量
+        image_count: 图片数量
+        image_mb: 每张图片的大小（MB）
+
+    Returns:
+        list: 测量结果
+    """
+    document = build_document(paragraph_count, image_count, image_mb)
+    results = []
+    for name, save in [
+        ("python_docx", lambda doc, target: doc.save(target)),
+        ("save_docx", save_docx),
+    ]:
+        seconds, peak_mb = measure(save, document)
+        results.append(
+            {
+                "writer": name,
+                "paragraphs": paragraph_count,
+                "images": image_count,
+                "image_mb": image_mb,
+                "seconds": round(seconds, 4),
+                "peak_mb": round(peak_mb, 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOCX 流式打包基准测试")
+    parser.add_argument(
+        "--paragraphs", type=int, default=20000, help="段落数量 (默认: 20000)"
+    )
+    parser.add_argument("--images", type=int, default=4, help="图片数量 (默认: 4)")
+    parser.add_argument(
+        "--image-mb", type=int, default=8, help="每张图片的大小 MB (默认: 8)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.paragraphs, args.images, args.image_mb)
+    if args.json:
+        emit_json("package", results, args.json)
+
+    for r in results:
+        print(f"{r['writer']:<12} {r['seconds']:>9.4f} s  peak {r['peak_mb']:>9.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+多进程转换基准测试
+
+生成一个包含标题、带格式段落、链接、列表、代码块和表格的大型文档，
+分别测量串行转换以及 1、2、4、8 个工作进程时的总耗时（墙钟时间）。
+加速比受 CPU 核心数限制，结果中会一并记录当前机器的核心数。
+
+切分输入、接收片段（反序列化）和拼接只在主进程中进行，不随进程数增加而
+缩短。脚本还在当前进程中逐块测量这两部分的耗时，按 Amdahl 定律给出各进程
+数下加速比的上限（不计进程启动和通信开销），核心数不足时可以据此估计。
+
+使用示例:
+  python benchmarks/bench_parallel.py
+  python benchmarks/bench_parallel.py --sections 2000 --workers 1 2 4 8 --json result.json
+"""
+
+import argparse
+import os
+import pickle
+
+from _common import emit_json, timed
+
+from mddocx.converter import parallel
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.streaming import iter_chunks
+
+
+def make_document(sections: int) -> str:
+    """生成包含多种块级元素的文档"""
+    parts = []
+    for k in range(sections):
+        parts.append(f"## 第 {k} 节\n")
+        parts.append(
+            f"这是第 {k} 节的正文，包含 **加粗**、*斜体*、~~删除线~~ 和 "
+            f"[链接](https://example.com/{k % 50})。\n"
+        )
+        parts.append("- 第一项\n- 第二项\n  - 嵌套项\n")
+        if k % 4 == 0:
+            parts.append(f"```python\nvalue = {k}\nprint(value)\n```\n")
+        if k % 5 == 0:
+            parts.append("| 列 1 | 列 2 |\n| --- | --- |\n| a | b |\n")
+    return "\n".join(parts)
+
+
+def measure_phases(text, chunk_size):
+    """在当前进程中逐块测量主进程和工作进程各自的耗时
+
+    Args:
+        text: Markdown 文本
+        chunk_size: 块大小（字符数）
+
+    Returns:
+        tuple: (主进程耗时, 工作进程耗时)，单位为秒
+    """
+    parallel._init_worker(False)
+    chunks, main = timed(list, iter_chunks(text.splitlines(keepends=True), chunk_size))
+    worker = 0.0
+    document = BaseConverter().document
+    had_code = False
+    for chunk in chunks:
+        # 工作进程：转换并序列化
+        payload, seconds = timed(
+            lambda c: pickle.dumps(parallel._convert_chunk(c)), chunk
+        )
+        worker += seconds
+        # 主进程：反序列化并拼接
+        fragment, seconds = timed(pickle.loads, payload)
+        main += seconds
+        _, seconds = timed(parallel._splice, document, fragment, had_code)
+        main += seconds
+        had_code = had_code or fragment.first_code is not None
+    return main, worker
+
+
+def run(sections, workers_list, chunk_size=None):
+    """运行基准测试
+
+    Args:
+        sections: 文档的节数
+        workers_list: 工作进程数量列表
+        chunk_size: 块大小（字符数），为 None 时按文档大小和进程数自动选择
+
+    Returns:
+        list: 测量结果
+    """
+    text = make_document(sections)
+    _, serial = timed(BaseConverter().convert, text)
+    results = [
+        {
+            "case": "serial",
+            "workers": 0,
+            "chars": len(text),
+            "seconds": round(serial, 4),
+            "speedup": 1.0,
+        }
+    ]
+
+    for workers in workers_list:
+        # 默认每个进程分到约 4 个块
+        size = chunk_size or max(1, len(text) // (workers * 4))
+        _, seconds = timed(
+            BaseConverter().convert_parallel, text, workers=workers, chunk_size=size
+        )
+        results.append(
+            {
+                "case": "parallel",
+                "workers": workers,
+                "chars": len(text),
+                "seconds": round(seconds, 4),
+                "speedup": round(serial / seconds, 2),
+            }
+        )
+
+    for workers in workers_list:
+        size = chunk_size or max(1, len(text) // (workers * 4))
+        main, worker = measure_phases(text, size)
+        results.append(
+            {
+                "case": "bound",
+                "workers": workers,
+                "chars": len(text),
+                "seconds": round(main + worker / workers, 4),
+                "speedup": round(serial / (main + worker / workers), 2),
+                "main_seconds": round(main, 4),
+                "worker_seconds": round(worker, 4),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多进程转换基准测试")
+    parser.add_argument(
+        "--sections", type=int, default=500, help="文档的节数 (默认: 500)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="工作进程数量 (默认: 1 2 4 8)",
+    )
+    parser.add_argument("--chunk-size", type=int, help="块大小（字符数）")
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sections, args.workers, args.chunk_size)
+    if args.json:
+        emit_json("parallel", results, args.json)
+
+    print(f"CPU 核心数: {os.cpu_count()}")
+    for r in results:
+        line = (
+            f"{r['case']:<10} workers={r['workers']:<3} "
+            f"{r['seconds']:>9.3f} s  x{r['speedup']:.2f}"
+        )
+        if r["case"] == "bound":
+            line += (
+                f"  (主进程 {r['main_seconds']:.3f} s, "
+                f"工作进程 {r['worker_seconds']:.3f} s)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
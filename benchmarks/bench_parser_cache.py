@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+解析器缓存基准测试
+
+比较每次构建 MarkdownIt 规则链与使用进程内解析器缓存的开销，
+以及 BaseConverter 在缓存冷/热两种情况下的构建耗时。
+
+使用示例:
+  python benchmarks/bench_parser_cache.py
+  python benchmarks/bench_parser_cache.py --instances 500 --json result.json
+"""
+
+import argparse
+
+from _common import emit_json, timed
+from markdown_it import MarkdownIt
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.parser import clear_parser_cache, get_converter_parser
+
+
+def build_uncached():
+    """按原先的方式构建转换器解析器"""
+    return (
+        MarkdownIt("commonmark", {"breaks": True, "html": True})
+        .enable("strikethrough")
+        .enable("emphasis")
+        .enable("table")
+    )
+
+
+def per_call(func, count):
+    """执行 count 次，返回平均耗时（毫秒）"""
+
+    def loop():
+        for _ in range(count):
+            func()
+
+    _, seconds = timed(loop)
+    return seconds / count * 1000
+
+
+def run(instances):
+    """运行基准测试
+
+    Args:
+        instances: 每项测量重复的次数
+
+    Returns:
+        list: 测量结果
+    """
+    clear_parser_cache()
+    _, cold = timed(get_converter_parser)
+
+    uncached_ms = per_call(build_uncached, instances)
+    cached_ms = per_call(get_converter_parser, instances)
+
+    def cold_converter():
+        clear_parser_cache()
+        BaseConverter()
+
+    cold_converter_ms = per_call(cold_converter, instances)
+    warm_converter_ms = per_call(BaseConverter, instances)
+
+    return [
+        {"case": "parser_first_build", "ms": round(cold * 1000, 4)},
+        {"case": "parser_uncached", "ms_per_instance": round(uncached_ms, 4)},
+        {"case": "parser_cached", "ms_per_instance": round(cached_ms, 4)},
+        {
+            "case": "converter_cold_cache",
+            "ms_per_instance": round(cold_converter_ms, 4),
+        },
+        {
+            "case": "converter_warm_cache",
+            "ms_per_instance": round(warm_converter_ms, 4),
+        },
+        {
+            "case": "saving_per_converter",
+            "ms_per_instance": round(cold_converter_ms - warm_converter_ms, 4),
+        },
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="解析器缓存基准测试")
+    parser.add_argument(
+        "--instances", type=int, default=200, help="每项测量重复次数 (默认: 200)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.instances)
+    if args.json:
+        emit_json("parser_cache", results, args.json)
+
+    for r in results:
+        value = r.get("ms_per_instance", r.get("ms"))
+        print(f"{r['case']:<24} {value:>10.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+在线图片预取基准测试
+
+启动一个本地 HTTP 服务器，每个请求固定延迟若干毫秒以模拟网络往返，比较
+生成阶段逐个下载（``prefetch_images=False``）与生成之前并发预取在线图片
+的整体转换耗时，并给出服务器收到的连接数。磁盘缓存已有全部图片时（再次运行
+同一文档），每张图片只需一次返回 304 的条件请求。
+
+使用示例:
+  python benchmarks/bench_prefetch.py
+  python benchmarks/bench_prefetch.py --sizes 50 200 --latency 50 --json result.json
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from _common import emit_json, timed
+from corpora import write_png
+
+from mddocx.converter.base import BaseConverter
+
+# 所有图片共用的 ETag
+ETAG = '"bench"'
+
+
+class ImageServer(ThreadingHTTPServer):
+    """按路径返回同一张图片的本地服务器，每个请求延迟 latency 秒"""
+
+    daemon_threads = True
+
+    def __init__(self, image, latency):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.image = image
+        self.latency = latency
+        self.clients = set()
+        self.lock = threading.Lock()
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.clients.add(self.client_address)
+        time.sleep(server.latency)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(server.image)))
+        self.end_headers()
+        self.wfile.write(server.image)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def remote_images(size, port):
+    """size 张地址不同的在线图片，每段一张"""
+    return "\n".join(
+        f"![图 {k}](http://127.0.0.1:{port}/image_{k}.png)\n" for k in range(size)
+    )
+
+
+def run(sizes, latency, workers):
+    """运行基准测试
+
+    Args:
+        sizes: 在线图片数量列表
+        latency: 每个请求的延迟（秒）
+        workers: 预取线程数
+
+    Returns:
+        list: 测量结果
+    """
+    path = Path(tempfile.mkdtemp(prefix="mddocx-bench-")) / "image.png"
+    write_png(path, width=64, height=64)
+    server = ImageServer(path.read_bytes(), latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    results = []
+    try:
+        for size in sizes:
+            text = remote_images(size, server.server_address[1])
+            cache_dir = tempfile.mkdtemp(prefix="mddocx-cache-")
+            # cold_cache 下载并填充磁盘缓存，warm_cache 重新验证缓存中的全部图片
+            for mode in ("sequential", "prefetch", "cold_cache", "warm_cache"):
+                server.clients.clear()
+                converter = BaseConverter(
+                    profile=True,
+                    prefetch_images=mode != "sequential",
+                    image_workers=workers,
+                    image_cache_dir=cache_dir if mode.endswith("cache") else None,
+                )
+                _, seconds = timed(converter.convert, text)
+                stats = converter.get_stats()
+                results.append(
+                    {
+                        "size": size,
+                        "mode": mode,
+                        "convert_s": round(seconds, 4),
+                        "connections": len(server.clients),
+                        "bytes_fetched": stats.bytes_fetched,
+                        "image_cache_hits": stats.image_cache_hits,
+                    }
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="在线图片预取基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[50, 200],
+        help="在线图片数量 (默认: 50 200)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=20, help="每个请求的延迟，毫秒 (默认: 20)"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="预取线程数 (默认: 8)")
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.latency / 1000, args.workers)
+    if args.json:
+        emit_json("prefetch", results, args.json)
+
+    for r in results:
+        print(
+            f"{r['size']:>5} images  {r['mode']:<10}  convert {r['convert_s']:>8.4f} s  "
+            f"connections {r['connections']:>4}  fetched {r['bytes_fetched']:>8} B  "
+            f"cache hits {r['image_cache_hits']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
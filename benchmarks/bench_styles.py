@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+样式注册表基准测试
+
+对比每个段落都通过 python-docx 查找并设置样式（``name in styles``、
+``styles[name]``、``paragraph.style = ...``）与使用 StyleRegistry 缓存的
+耗时，并给出列表、引用密集文档的生成阶段（emit）耗时。
+
+使用示例:
+  python benchmarks/bench_styles.py
+  python benchmarks/bench_styles.py --sizes 1000 5000 --json result.json
+"""
+
+import argparse
+import time
+
+from _common import emit_json
+from corpora import CORPORA
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.styles import get_style_registry
+from mddocx.converter.template import new_document
+
+STYLE_NAMES = ["List Bullet", "List Bullet 2", "List Number 3", "Heading 2"]
+
+
+def quotes(size):
+    """多层引用块语料"""
+    return "\n\n".join(">" * (k % 3 + 1) + f" 第 {k} 段引用内容" for k in range(size))
+
+
+def lookup_time(size, cached):
+    """为 size 个段落查找并设置样式，返回耗时（秒）"""
+    document = new_document()
+    paragraphs = [document.add_paragraph() for _ in range(size)]
+    registry = get_style_registry(document)
+    start = time.perf_counter()
+    for k, paragraph in enumerate(paragraphs):
+        name = STYLE_NAMES[k % len(STYLE_NAMES)]
+        if cached:
+            if name in registry:
+                registry.apply_paragraph_style(paragraph, name)
+        elif name in document.styles:
+            paragraph.style = document.styles[name]
+    return time.perf_counter() - start
+
+
+def emit_time(text, fast_xml):
+    """转换一次，返回生成阶段耗时（秒）"""
+    converter = BaseConverter(profile=True, fast_xml=fast_xml)
+    converter.convert(text)
+    return converter.get_stats().emit_time
+
+
+def run(sizes):
+    """运行基准测试
+
+    Args:
+        sizes: 规模列表
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    for size in sizes:
+        docx_seconds = lookup_time(size, cached=False)
+        cached_seconds = lookup_time(size, cached=True)
+        results.append(
+            {
+                "case": "lookup",
+                "size": size,
+                "python_docx_s": round(docx_seconds, 4),
+                "registry_s": round(cached_seconds, 4),
+                "speedup": round(docx_seconds / cached_seconds, 2),
+            }
+        )
+        for case, make in [("deep_lists", CORPORA["deep_lists"]), ("quotes", quotes)]:
+            text = make(size)
+            results.append(
+                {
+                    "case": case,
+                    "size": size,
+                    "emit_s": round(emit_time(text, fast_xml=False), 4),
+                    "emit_fast_xml_s": round(emit_time(text, fast_xml=True), 4),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="样式注册表基准测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 5000],
+        help="段落数量 (默认: 1000 5000)",
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    if args.json:
+        emit_json("styles", results, args.json)
+
+    for r in results:
+        if r["case"] == "lookup":
+            print(
+                f"{r['case']:<12} {r['size']:>7} python-docx {r['python_docx_s']:>9.4f} s  "
+                f"registry {r['registry_s']:>9.4f} s  x{r['speedup']:.2f}"
+            )
+        else:
+            print(
+                f"{r['case']:<12} {r['size']:>7} emit {r['emit_s']:>9.4f} s  "
+                f"fast_xml {r['emit_fast_xml_s']:>9.4f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+文档模板缓存基准测试
+
+比较每个新文档的创建方式：``docx.Document()`` 重新解析内置模板、
+从序列化字节重新打开，以及从进程内模板复制；同时测量 BaseConverter
+的构建和 reset 耗时（批量转换和 Web 服务中每个文件都要付出的开销），
+以及复用转换器转换并保存一个小文件的总耗时。
+
+使用示例:
+  python benchmarks/bench_template.py
+  python benchmarks/bench_template.py --instances 200 --json result.json
+"""
+
+import argparse
+from io import BytesIO
+
+from _common import emit_json, timed
+from docx import Document
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.elements import CodeConverter, LinkConverter
+from mddocx.converter.template import get_default_template, new_document
+
+# 小文件：标题、带格式和链接的段落、列表、代码块和表格
+SMALL_FILE = (
+    "# 标题\n\n段落 **加粗** [链接](https://example.com)\n\n- 第一项\n- 第二项\n\n"
+    "```\ncode\n```\n\n| a | b |\n| --- | --- |\n| 1 | 2 |\n"
+)
+
+
+def per_call(func, count):
+    """执行 count 次，返回平均耗时（毫秒）"""
+
+    def loop():
+        for _ in range(count):
+            func()
+
+    _, seconds = timed(loop)
+    return seconds / count * 1000
+
+
+def run(instances):
+    """运行基准测试
+
+    Args:
+        instances: 每项测量重复的次数
+
+    Returns:
+        list: 测量结果
+    """
+    _, first_build = timed(get_default_template)
+
+    stream = BytesIO()
+    new_document().save(stream)
+    data = stream.getvalue()
+
+    def styled_document():
+        # 缓存前的做法：Document() 之后由转换器添加 Code、Hyperlink 样式
+        document = Document()
+        CodeConverter().set_document(document)
+        LinkConverter().set_document(document)
+        return document
+
+    converter = BaseConverter()
+    small = BaseConverter()
+
+    def small_file():
+        # 批量转换中的一个小文件：reset、转换、保存
+        small.reset()
+        small.convert(SMALL_FILE)
+        small.save(BytesIO())
+
+    cases = [
+        ("document_parse", Document),
+        ("document_parse_styled", styled_document),
+        ("document_from_bytes", lambda: Document(BytesIO(data))),
+        ("template_copy", new_document),
+        ("converter_init", BaseConverter),
+        ("converter_reset", converter.reset),
+        ("small_file", small_file),
+    ]
+    results = [{"case": "template_first_build", "ms": round(first_build * 1000, 4)}]
+    for name, func in cases:
+        results.append(
+            {"case": name, "ms_per_instance": round(per_call(func, instances), 4)}
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="文档模板缓存基准测试")
+    parser.add_argument(
+        "--instances", type=int, default=100, help="每项测量重复次数 (默认: 100)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    results = run(args.instances)
+    if args.json:
+        emit_json("template", results, args.json)
+
+    for r in results:
+        value = r.get("ms_per_instance", r.get("ms"))
+        print(f"{r['case']:<24} {value:>10.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
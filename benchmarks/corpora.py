@@ -0,0 +1,170 @@
+"""
+基准测试语料生成
+
+每个生成函数接收规模参数 ``size``（元素数量），返回 Markdown 文本，
+分别覆盖一种元素转换器。图片语料需要的本地图片由 ``write_png`` 生成。
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+# 添加 src 和 tests 目录到路径
+import _common  # noqa: F401
+from conftest import png_bytes
+
+_WORDS = "转换 文档 Markdown 段落 性能 测试 python docx 表格 列表 代码 链接".split()
+
+
+def _sentence(k, words=12):
+    """生成一句由固定词表组成的文本"""
+    return " ".join(_WORDS[(k + i) % len(_WORDS)] for i in range(words))
+
+
+def write_png(path, width=16, height=16):
+    """写入一张纯色 PNG 图片
+
+    Args:
+        path: 输出路径
+        width: 宽度（像素）
+        height: 高度（像素）
+    """
+    Path(path).write_bytes(png_bytes(width, height))
+
+
+def write_noise_png(path, megabytes):
+    """写入一张像素为随机噪声的 PNG 图片，数据不可压缩，模拟照片等已压缩图片
+
+    Args:
+        path: 输出路径
+        megabytes: 大致的文件大小（MB）
+    """
+    width = 1024
+    height = megabytes * 1024 * 1024 // (width * 3)
+    raw = b"".join(b"\x00" + os.urandom(width * 3) for _ in range(height))
+    Path(path).write_bytes(png_bytes(width, height, raw, level=0))
+
+
+def headings(size):
+    """各级标题"""
+    return "\n".join(
+        f"{'#' * (k % 6 + 1)} 标题 {k} {_sentence(k, 4)}\n" for k in range(size)
+    )
+
+
+def paragraphs(size):
+    """带行内格式的长段落"""
+    return "\n".join(
+        f"{_sentence(k, 40)} **{_sentence(k + 1, 3)}** *{_sentence(k + 2, 3)}* "
+        f"~~{_sentence(k + 3, 2)}~~ `code_{k}` {_sentence(k + 4, 40)}\n"
+        for k in range(size)
+    )
+
+
+def deep_lists(size):
+    """交替的有序/无序多层嵌套列表"""
+    lines = []
+    for k in range(size):
+        depth = k % 6
+        marker = "1." if depth % 2 else "-"
+        lines.append(f"{'   ' * depth}{marker} 第 {k} 项 **{_sentence(k, 3)}**")
+    return "\n".join(lines) + "\n"
+
+
+def task_lists(size):
+    """任务列表"""
+    return (
+        "\n".join(
+            f"- [{'x' if k % 3 == 0 else ' '}] 任务 {k} {_sentence(k, 6)}"
+            for k in range(size)
+        )
+        + "\n"
+    )
+
+
+def tables(size):
+    """一个 size 行、6 列的大表格"""
+    header = "| " + " | ".join(f"列 {c}" for c in range(6)) + " |"
+    align = "| :--- | :---: | ---: | --- | --- | --- |"
+    rows = [
+        "| "
+        + " | ".join(
+            f"**{k}**" if c == 0 else f"{_sentence(k + c, 2)}" for c in range(6)
+        )
+        + " |"
+        for k in range(size)
+    ]
+    return "\n".join([header, align] + rows) + "\n"
+
+
+def code(size):
+    """十行一块的代码围栏"""
+    blocks = []
+    for k in range(size):
+        body = "\n".join(
+            f"value_{i} = compute({k}, {i})  # {_sentence(i, 3)}" for i in range(10)
+        )
+        blocks.append(f"```python\n{body}\n```\n")
+    return "\n".join(blocks)
+
+
+def links(size):
+    """每段包含多个链接的文本"""
+    return "\n".join(
+        f"{_sentence(k, 4)} [链接 {k}](https://example.com/{k}) 和 "
+        f"[另一个](https://example.org/{k % 97}?q={k}) 以及 **[加粗链接](https://example.net/{k})**\n"
+        for k in range(size)
+    )
+
+
+def images(size, image_dir=None):
+    """独立图片和段落内图片交替出现"""
+    image_dir = Path(image_dir or tempfile.mkdtemp(prefix="mddocx-bench-"))
+    paths = []
+    for k in range(4):
+        path = image_dir / f"image_{k}.png"
+        if not path.exists():
+            write_png(path, width=16 + k * 8)
+        paths.append(path.as_posix())
+    parts = []
+    for k in range(size):
+        src = paths[k % len(paths)]
+        if k % 2:
+            parts.append(f"段落内图片 ![图 {k}]({src}) {_sentence(k, 4)}\n")
+        else:
+            parts.append(f'![图 {k}|64x64]({src} "标题 {k}")\n')
+    return "\n".join(parts)
+
+
+def html(size):
+    """HTML 块"""
+    blocks = []
+    for k in range(size):
+        kind = k % 3
+        if kind == 0:
+            blocks.append(
+                f"<div>\n<p>HTML 段落 {k} <b>{_sentence(k, 3)}</b></p>\n</div>\n"
+            )
+        elif kind == 1:
+            blocks.append(
+                f"<ul>\n<li>项目 {k}</li>\n<li>{_sentence(k, 3)}</li>\n</ul>\n"
+            )
+        else:
+            blocks.append(
+                f'<p><a href="https://example.com/{k}">链接 {k}</a> <i>{_sentence(k, 2)}</i></p>\n'
+            )
+    return "\n".join(blocks)
+
+
+# 语料名称 -> 生成函数
+CORPORA = {
+    "headings": headings,
+    "paragraphs": paragraphs,
+    "deep_lists": deep_lists,
+    "task_lists": task_lists,
+    "tables": tables,
+    "code": code,
+    "links": links,
+    "images": images,
+    "html": html,
+}
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+按元素类型的基准测试套件
+
+对 ``corpora.py`` 中的每种语料在多个规模下测量转换性能：
+吞吐量（MB/s、tokens/s）、延迟分位数（p50/p90/p99）以及峰值内存（RSS）。
+每个 (语料, 规模) 组合在独立的子进程中运行，保证峰值内存互不影响。
+
+使用示例:
+  python benchmarks/run_suite.py
+  python benchmarks/run_suite.py --cases tables code --sizes 100 1000 --repeat 5
+  python benchmarks/run_suite.py --json suite.json
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+
+from _common import emit_json, timed
+from corpora import CORPORA
+
+from mddocx.converter.base import BaseConverter
+
+DEFAULT_SIZES = [50, 200, 1000]
+
+
+def peak_rss_mb():
+    """当前进程的峰值常驻内存（MB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 返回 KB，macOS 返回字节
+    if sys.platform == "darwin":
+        peak /= 1024
+    return peak / 1024
+
+
+def percentile(values, pct):
+    """最近秩法计算分位数"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def count_tokens(tokens):
+    """统计块级 token 及其行内子 token 的总数"""
+    return len(tokens) + sum(len(token.children or ()) for token in tokens)
+
+
+def measure(case, size, repeat, image_dir):
+    """在当前进程中测量一个 (语料, 规模) 组合
+
+    Args:
+        case: 语料名称
+        size: 语料规模
+        repeat: 重复转换次数
+        image_dir: 图片语料使用的目录
+
+    Returns:
+        dict: 测量结果
+    """
+    generate = CORPORA[case]
+    text = generate(size, image_dir) if case == "images" else generate(size)
+    size_bytes = len(text.encode("utf-8"))
+
+    converter = BaseConverter()
+    tokens = count_tokens(converter.md.parse(text))
+    rss_before = peak_rss_mb()
+
+    latencies = []
+    for _ in range(repeat):
+        converter.reset()
+        _, seconds = timed(converter.convert, text)
+        latencies.append(seconds)
+
+    median = percentile(latencies, 50)
+    return {
+        "case": case,
+        "size": size,
+        "bytes": size_bytes,
+        "tokens": tokens,
+        "repeat": repeat,
+        "mb_per_s": round(size_bytes / median / 1e6, 4),
+        "tokens_per_s": round(tokens / median, 1),
+        "latency_s": {
+            "min": round(min(latencies), 6),
+            "p50": round(median, 6),
+            "p90": round(percentile(latencies, 90), 6),
+            "p99": round(percentile(latencies, 99), 6),
+            "max": round(max(latencies), 6),
+        },
+        "rss_before_mb": round(rss_before, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_case(case, size, repeat, image_dir):
+    """在子进程中运行一个组合，返回其测量结果"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", case, str(size), str(repeat), image_dir],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(cases, sizes, repeat):
+    """运行基准测试套件
+
+    Args:
+        cases: 语料名称列表
+        sizes: 规模列表
+        repeat: 每个组合重复转换的次数
+
+    Returns:
+        list: 测量结果
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="mddocx-bench-") as image_dir:
+        for case in cases:
+            for size in sizes:
+                result = run_case(case, size, repeat, image_dir)
+                results.append(result)
+                print(
+                    f"{case:<12} {size:>7} {result['bytes'] / 1e6:>8.3f} MB "
+                    f"{result['mb_per_s']:>8.3f} MB/s {result['tokens_per_s']:>11.0f} tok/s "
+                    f"p50={result['latency_s']['p50']:.4f}s p99={result['latency_s']['p99']:.4f}s "
+                    f"rss={result['peak_rss_mb']:.0f} MB",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        case, size, repeat, image_dir = sys.argv[2:6]
+        print(json.dumps(measure(case, int(size), int(repeat), image_dir)))
+        return
+
+    parser = argparse.ArgumentParser(description="按元素类型的基准测试套件")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=sorted(CORPORA),
+        default=list(CORPORA),
+        help="要运行的语料 (默认: 全部)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="语料规模 (默认: 50 200 1000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="每个组合重复转换次数 (默认: 3)"
+    )
+    parser.add_argument("--json", help="将结果写入 JSON 文件（默认输出到标准输出）")
+    args = parser.parse_args()
+
+    results = run(args.cases, args.sizes, args.repeat)
+    emit_json("suite", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
 from mddocx.converter.base import BaseConverter
+from mddocx.converter.package import COMPRESSION_PROFILES
+from mddocx.log import add_debug_file_handler
 
 
 def setup_logging(log_file, verbose=False):
@@ -32,7 +34,7 @@ def setup_logging(log_file, verbose=False):
     return logging.getLogger(__name__)
 
 
-def convert_file(input_file, output_file, debug=False, logger=None):
+def convert_file(input_file, output_file, debug=False, logger=None, converter=None):
     """
     转换单个 Markdown 文件为 DOCX 文件
 
@@ -41,6 +43,7 @@ def convert_file(input_file, output_file, debug=False, logger=None):
         output_file: 输出文件路径
         debug: 是否启用调试模式
         logger: 日志记录器
+        converter: 可复用的转换器实例，提供时复用其解析器和元素转换器
 
     Returns:
         bool: 转换是否成功
@@ -59,15 +62,18 @@ def convert_file(input_file, output_file, debug=False, logger=None):
 
         logger.info(f"文件大小: {len(content)} 字节")
 
-        # 创建转换器
+        # 创建转换器，或复用已有转换器开始新文档
         start_time = time.time()
-        converter = BaseConverter(debug=debug)
+        if converter is None:
+            converter = BaseConverter(debug=debug)
+        else:
+            converter.reset()
 
         # 转换文档
-        doc = converter.convert(content)
+        converter.convert(content)
 
-        # 保存文档
-        doc.save(output_file)
+        # 保存文档（流式打包）
+        converter.save(output_file)
 
         end_time = time.time()
         duration = end_time - start_time
@@ -128,6 +134,9 @@ def parse_args():
         "--output-file", help="指定单个输出文件路径（仅在使用--file时有效）"
     )
     parser.add_argument("--log-file", help="指定日志文件路径（默认自动生成）")
+    parser.add_argument(
+        "--debug-log", help="将转换器的调试日志单独写入指定文件（隐含 --debug）"
+    )
     parser.add_argument(
         "--recursive",
         action="store_true",
@@ -135,6 +144,12 @@ def parse_args():
         help="递归查找子目录中的文件 (默认: True)",
     )
     parser.add_argument("--pattern", default="*.md", help="文件匹配模式 (默认: *.md)")
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_PROFILES),
+        default="default",
+        help="输出文件的压缩配置，批量任务可用 fast 或 store 缩短保存时间 (默认: default)",
+    )
 
     return parser.parse_args()
 
@@ -155,10 +170,15 @@ def main():
 
     logger = setup_logging(log_file, args.verbose)
 
-    # 设置调试模式
-    debug = args.debug
+    # 设置调试模式，指定调试日志文件时转换器的调试信息只写入该文件
+    debug = args.debug or bool(args.debug_log)
+    if args.debug_log:
+        add_debug_file_handler(args.debug_log, propagate=False)
     logger.info(f"调试模式: {'启用' if debug else '禁用'}")
     logger.info(f"日志文件: {log_file}")
+    logger.info(f"压缩配置: {args.compression}")
+    if args.debug_log:
+        logger.info(f"调试日志文件: {args.debug_log}")
 
     # 检查是否指定了单个文件
     if args.file:
@@ -172,7 +192,10 @@ def main():
             output_file = Path(output_dir) / f"{Path(input_file).stem}.docx"
 
         logger.info(f"单文件模式: {input_file} -> {output_file}")
-        success = convert_file(input_file, output_file, debug=debug, logger=logger)
+        converter = BaseConverter(debug=debug, compression=args.compression)
+        success = convert_file(
+            input_file, output_file, debug=debug, logger=logger, converter=converter
+        )
 
         if success:
             logger.info("✅ 转换成功")
@@ -215,6 +238,9 @@ def main():
     # 转换结果统计
     results = {"success": 0, "failed": 0, "files": []}
 
+    # 所有文件共用一个转换器，每个文件开始前重置文档状态
+    converter = BaseConverter(debug=debug, compression=args.compression)
+
     # 批量转换
     for md_file in md_files:
         # 构建输出文件路径
@@ -229,7 +255,11 @@ def main():
 
         logger.info("=" * 80)
         success = convert_file(
-            str(md_file), str(output_file), debug=debug, logger=logger
+            str(md_file),
+            str(output_file),
+            debug=debug,
+            logger=logger,
+            converter=converter,
         )
 
         if success:
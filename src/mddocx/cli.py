@@ -3,27 +3,67 @@
 """
 
 import argparse
+import json
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 from . import __version__
 from .converter import BaseConverter
 from .converter.base import MD2DocxError
-
-
-def convert_file(input_file: str, output_file: str, debug: bool = False) -> None:
+from .converter.disk_cache import DEFAULT_MAX_BYTES
+from .converter.optimize import DEFAULT_DPI, DEFAULT_QUALITY
+from .converter.package import COMPRESSION_PROFILES, get_compression_profile
+from .converter.parallel import default_workers
+from .converter.stats import ConversionStats
+from .log import enable_debug_output
+
+# 命令行中的缓存大小以 MB 为单位
+MB = 1024 * 1024
+
+
+def convert_file(
+    input_file: str,
+    output_file: str,
+    debug: bool = False,
+    converter: Optional[BaseConverter] = None,
+    stream: bool = False,
+    workers: Optional[int] = None,
+    profile: bool = False,
+    compression: Optional[str] = None,
+    image_cache: Optional[str] = None,
+    image_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    optimize_images: bool = False,
+    image_dpi: int = DEFAULT_DPI,
+    image_quality: int = DEFAULT_QUALITY,
+) -> Optional[ConversionStats]:
     """转换文件
 
     Args:
         input_file: 输入的 Markdown 文件路径
-        output_file: 输出的 DOCX 文件路径
+        output_file: 输出的 DOCX 文件路径，为 "-" 时写到标准输出（可以是管道）
         debug: 是否显示调试信息
+        converter: 可复用的转换器实例，提供时会先调用 reset() 开始新文档
+        stream: 是否按块流式读取和转换输入，适合体积很大的文件
+        workers: 并行转换使用的进程数量，为 None 时在当前进程中转换
+        profile: 是否收集转换统计
+        compression: 输出文件的压缩配置名称，为 None 时使用转换器的设置
+        image_cache: 在线图片的磁盘缓存目录，为 None 时使用转换器的设置
+        image_cache_max_bytes: 磁盘缓存的大小上限（字节）
+        optimize_images: 是否按显示尺寸缩小并重新压缩图片，需要安装 Pillow
+        image_dpi: 优化图片时的目标分辨率（每英寸像素数）
+        image_quality: 优化图片时的 JPEG 压缩质量（1-95）
+
+    Returns:
+        Optional[ConversionStats]: 转换统计，未开启统计时返回 None
 
     Raises:
         FileNotFoundError: 输入文件不存在
         PermissionError: 文件权限错误
         MD2DocxError: 转换过程中的错误
+        ValueError: 未知的压缩配置，或图片优化的分辨率、质量无效
+        ImportError: 开启图片优化但没有安装 Pillow
     """
     try:
         # 检查输入文件是否存在
@@ -34,22 +74,49 @@ def convert_file(input_file: str, output_file: str, debug: bool = False) -> None
         if not input_path.is_file():
             raise ValueError(f"输入路径不是文件: {input_file}")
 
-        # 读取输入文件
-        with open(input_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        # 读取输入文件（流式和并行模式下在转换时逐行读取）
+        if not stream and not workers:
+            with open(input_file, "r", encoding="utf-8") as f:
+                content = f.read()
 
     except (OSError, IOError) as e:
         raise FileNotFoundError(f"无法读取输入文件 {input_file}: {e}")
 
     try:
-        # 初始化转换器并执行转换
-        converter = BaseConverter(debug=debug)
-        doc = converter.convert(content)
+        # 初始化转换器（或复用已有转换器）并执行转换
+        if converter is None:
+            converter = BaseConverter(debug=debug, profile=profile)
+        else:
+            if profile:
+                converter.set_profile(True)
+            converter.reset()
+        if compression is not None:
+            get_compression_profile(compression)
+            converter.compression = compression
+        if image_cache is not None:
+            converter.set_image_cache(image_cache, image_cache_max_bytes)
+        if optimize_images:
+            converter.set_image_optimization(True, image_dpi, image_quality)
+        if workers:
+            with open(input_file, "r", encoding="utf-8") as f:
+                converter.convert_parallel(f, workers)
+        elif stream:
+            with open(input_file, "r", encoding="utf-8") as f:
+                converter.convert_stream(f)
+        else:
+            converter.convert(content)
 
     except MD2DocxError:
         # 转换器自定义错误，直接重新抛出
         raise
 
+    # 写到标准输出：流式打包，不需要可 seek 的输出；提示信息改写到标准错误
+    if output_file == "-":
+        converter.save(sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+        print("转换完成: <stdout>", file=sys.stderr)
+        return converter.get_stats()
+
     # 检查输出文件是否被占用，如果是则添加时间戳后缀
     output_path = Path(output_file)
     final_output_file = output_file
@@ -58,9 +125,9 @@ def convert_file(input_file: str, output_file: str, debug: bool = False) -> None
     while attempt < 5:  # 最多尝试5次
         try:
             # 尝试保存文件
-            doc.save(final_output_file)
+            converter.save(final_output_file)
             print(f"转换完成: {final_output_file}")
-            return
+            return converter.get_stats()
         except PermissionError:
             # 文件被占用，添加时间戳后缀
             timestamp = int(time.time())
@@ -107,10 +174,30 @@ Markdown to DOCX 转换工具 v{0}
                 __version__
             ),
             "input_help": "输入的 Markdown 文件路径",
-            "output_help": "输出的 DOCX 文件路径",
+            "output_help": "输出的 DOCX 文件路径 (- 表示写到标准输出)",
             "debug_help": "显示调试信息和详细的转换过程",
             "version_help": "显示版本信息 (-v, -V)",
             "lang_help": "选择帮助信息的语言 (zh/en, 默认: zh)",
+            "stream_help": "按块流式读取和转换输入，降低大文件的内存占用 "
+            "(先扫描一遍输入收集引用式链接定义，在所有块中生效)",
+            "workers_help": "使用 N 个进程并行转换大型文档 (0 表示 CPU 核心数)",
+            "stats_help": "转换完成后显示各阶段耗时和文档内容统计",
+            "stats_json_help": "以 JSON 格式输出转换统计到文件 (PATH 为 - 时输出到标准输出，"
+            "输出文件为 - 时改为标准错误)",
+            "compression_help": "输出文件的压缩配置: default 与 python-docx 相同, store 不压缩, "
+            "fast/max 为最快/最高压缩, store-media 对 PNG/JPEG 等图片不再压缩",
+            "image_cache_help": "在线图片的磁盘缓存目录，可在多次运行和多个进程之间共用，"
+            "已缓存的图片通过 ETag/Last-Modified 重新验证",
+            "image_cache_size_help": "磁盘缓存的大小上限，单位 MB，超过时淘汰最久未用的图片 "
+            "(默认: {0})".format(DEFAULT_MAX_BYTES // MB),
+            "optimize_images_help": "嵌入之前按显示尺寸缩小并重新压缩图片 (需要安装 Pillow: "
+            "pip install mddocx[images])",
+            "image_dpi_help": "图片优化的目标分辨率，每英寸像素数 (默认: {0})".format(
+                DEFAULT_DPI
+            ),
+            "image_quality_help": "图片优化的 JPEG 压缩质量 1-95 (默认: {0})".format(
+                DEFAULT_QUALITY
+            ),
         },
         "en": {
             "description": """\
@@ -137,10 +224,29 @@ Usage examples:
                 __version__
             ),
             "input_help": "Path to input Markdown file",
-            "output_help": "Path to output DOCX file",
+            "output_help": "Path to output DOCX file (- writes to stdout)",
             "debug_help": "Show debug information and detailed conversion process",
             "version_help": "Show version information (-v, -V)",
             "lang_help": "Choose language for help information (zh/en, default: zh)",
+            "stream_help": "Read and convert the input in chunks to reduce memory use on large files "
+            "(reference link definitions are collected in a first pass and apply to every chunk)",
+            "workers_help": "Convert a large document with N worker processes (0 means one per CPU core)",
+            "stats_help": "Show per-phase timings and document statistics after conversion",
+            "stats_json_help": "Write conversion statistics as JSON to PATH (- for stdout, "
+            "or stderr when the document itself is written to stdout)",
+            "compression_help": "Output compression profile: default matches python-docx, store is "
+            "uncompressed, fast/max are fastest/smallest deflate, store-media keeps PNG/JPEG uncompressed",
+            "image_cache_help": "Directory for a persistent cache of remote images, shared across runs "
+            "and processes; cached images are revalidated with ETag/Last-Modified",
+            "image_cache_size_help": "Size cap of the image cache in MB, least recently used images "
+            "are evicted beyond it (default: {0})".format(DEFAULT_MAX_BYTES // MB),
+            "optimize_images_help": "Downscale images to their displayed size and recompress them "
+            "before embedding (requires Pillow: pip install mddocx[images])",
+            "image_dpi_help": "Target resolution of optimized images in pixels per inch "
+            "(default: {0})".format(DEFAULT_DPI),
+            "image_quality_help": "JPEG quality of optimized images, 1-95 (default: {0})".format(
+                DEFAULT_QUALITY
+            ),
         },
     }
 
@@ -197,6 +303,63 @@ def main() -> None:
         action="store_true",
         help=texts["debug_help"],
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=texts["stream_help"],
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help=texts["workers_help"],
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help=texts["stats_help"],
+    )
+    parser.add_argument(
+        "--stats-json",
+        metavar="PATH",
+        help=texts["stats_json_help"],
+    )
+
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_PROFILES),
+        help=texts["compression_help"],
+    )
+
+    parser.add_argument(
+        "--image-cache",
+        metavar="DIR",
+        help=texts["image_cache_help"],
+    )
+    parser.add_argument(
+        "--image-cache-size",
+        type=int,
+        metavar="MB",
+        help=texts["image_cache_size_help"],
+    )
+
+    parser.add_argument(
+        "--optimize-images",
+        action="store_true",
+        help=texts["optimize_images_help"],
+    )
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        metavar="DPI",
+        help=texts["image_dpi_help"],
+    )
+    parser.add_argument(
+        "--image-quality",
+        type=int,
+        metavar="Q",
+        help=texts["image_quality_help"],
+    )
 
     # 添加版本信息
     parser.add_argument(
@@ -213,16 +376,62 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    if args.image_cache_size is not None and not args.image_cache:
+        parser.error("--image-cache-size 需要与 --image-cache 一起使用")
+    for name in ("image_dpi", "image_quality"):
+        if getattr(args, name) is not None and not args.optimize_images:
+            option = "--" + name.replace("_", "-")
+            parser.error(f"{option} 需要与 --optimize-images 一起使用")
+
+    # 文档写到标准输出时，错误、调试和统计信息都改写到标准错误
+    to_stdout = args.output == "-"
+    out = sys.stderr if to_stdout else sys.stdout
+    if args.debug and to_stdout:
+        enable_debug_output(sys.stderr)
+
     if not Path(args.input).exists():
-        print(f"错误: 输入文件不存在: {args.input}")
+        print(f"错误: 输入文件不存在: {args.input}", file=out)
         sys.exit(1)
 
+    # 只传递用户显式开启的选项
+    options = {}
+    if args.stream:
+        options["stream"] = True
+    if args.workers is not None:
+        options["workers"] = args.workers or default_workers()
+    if args.stats or args.stats_json:
+        options["profile"] = True
+    if args.compression:
+        options["compression"] = args.compression
+    if args.image_cache:
+        options["image_cache"] = args.image_cache
+        if args.image_cache_size is not None:
+            options["image_cache_max_bytes"] = args.image_cache_size * MB
+    if args.optimize_images:
+        options["optimize_images"] = True
+        options["image_dpi"] = (
+            DEFAULT_DPI if args.image_dpi is None else args.image_dpi
+        )
+        options["image_quality"] = (
+            DEFAULT_QUALITY if args.image_quality is None else args.image_quality
+        )
+
     try:
-        convert_file(args.input, args.output, args.debug)
+        stats = convert_file(args.input, args.output, args.debug, **options)
     except Exception as e:
-        print(f"错误: {str(e)}")
+        print(f"错误: {str(e)}", file=out)
         sys.exit(1)
 
+    if stats is not None:
+        if args.stats:
+            print(stats.format(), file=out)
+        if args.stats_json:
+            report = json.dumps(stats.to_dict(), ensure_ascii=False, indent=2)
+            if args.stats_json == "-":
+                print(report, file=out)
+            else:
+                Path(args.stats_json).write_text(report + "\n", encoding="utf-8")
+
 
 if __name__ == "__main__":
     main()
@@ -9,6 +9,9 @@ from .base import (
     MD2DocxError,
     ParseError,
 )
+from .cursor import BodyCursor, get_body_cursor
+from .disk_cache import DiskImageCache
+from .dispatch import TokenDispatcher
 from .elements import (
     BlockquoteConverter,
     CodeConverter,
@@ -22,6 +25,18 @@ from .elements import (
     TaskListConverter,
     TextConverter,
 )
+from .image_store import ImageEntry, ImageStore, get_image_store
+from .inline import InlineRenderer
+from .memory_cache import ImageMemoryCache
+from .ooxml import OoxmlWriter
+from .optimize import ImageOptimizer
+from .package import COMPRESSION_PROFILES, iter_docx, save_docx
+from .parser import clear_parser_cache, get_parser
+from .prefetch import ImagePrefetcher
+from .relations import RelationshipIndex, get_relationship_index
+from .stats import ConversionStats
+from .styles import StyleRegistry, get_style_registry
+from .template import DocumentTemplate, get_default_template, new_document
 
 __all__ = [
     "BaseConverter",
@@ -29,6 +44,31 @@ __all__ = [
     "MD2DocxError",
     "ParseError",
     "ConvertError",
+    "TokenDispatcher",
+    "OoxmlWriter",
+    "InlineRenderer",
+    "save_docx",
+    "iter_docx",
+    "COMPRESSION_PROFILES",
+    "ConversionStats",
+    "StyleRegistry",
+    "get_style_registry",
+    "RelationshipIndex",
+    "get_relationship_index",
+    "BodyCursor",
+    "get_body_cursor",
+    "ImageStore",
+    "ImageEntry",
+    "get_image_store",
+    "ImagePrefetcher",
+    "DiskImageCache",
+    "ImageMemoryCache",
+    "ImageOptimizer",
+    "get_parser",
+    "clear_parser_cache",
+    "DocumentTemplate",
+    "get_default_template",
+    "new_document",
     "HeadingConverter",
     "TextConverter",
     "BlockquoteConverter",
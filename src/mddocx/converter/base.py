@@ -2,11 +2,17 @@
 基础转换器模块，处理 Markdown 到 DOCX 的核心转换逻辑
 """
 
-from typing import Any, Dict, List, Tuple
+import logging
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from docx import Document
-from markdown_it import MarkdownIt
 
+from ..log import debug_output
+from .block_index import BlockIndex
+from .disk_cache import DEFAULT_MAX_BYTES, DiskImageCache
+from .dispatch import HandlerStats, TokenDispatcher
 from .elements import (
     BlockquoteConverter,
     CodeConverter,
@@ -21,6 +27,19 @@ from .elements import (
     TextConverter,
 )
 from .elements.base import ElementConverter
+from .image_store import get_image_store
+from .memory_cache import DEFAULT_MEMORY_MAX_BYTES
+from .ooxml import OoxmlWriter
+from .optimize import DEFAULT_DPI, DEFAULT_QUALITY, ImageOptimizer
+from .package import DEFAULT_COMPRESSION, get_compression_profile, save_docx
+from .parallel import MIN_PARALLEL_CHUNK_SIZE, convert_parallel
+from .parser import get_converter_parser
+from .prefetch import DEFAULT_WORKERS, ImagePrefetcher
+from .stats import ConversionStats
+from .streaming import DEFAULT_CHUNK_SIZE, collect_link_definitions, iter_chunks
+from .template import DocumentTemplate, get_default_template
+
+logger = logging.getLogger(__name__)
 
 
 class MD2DocxError(Exception):
@@ -44,32 +63,96 @@ class ConvertError(MD2DocxError):
 class BaseConverter:
     """基础转换器，处理文档结构"""
 
-    def __init__(self, debug: bool = False) -> None:
+    def __init__(
+        self,
+        debug: bool = False,
+        profile: bool = False,
+        template: Optional[DocumentTemplate] = None,
+        fast_xml: bool = False,
+        compression: str = DEFAULT_COMPRESSION,
+        prefetch_images: bool = True,
+        image_workers: int = DEFAULT_WORKERS,
+        image_cache_dir: Optional[Union[str, Path]] = None,
+        image_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        image_memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+        optimize_images: bool = False,
+        image_dpi: int = DEFAULT_DPI,
+        image_quality: int = DEFAULT_QUALITY,
+    ) -> None:
         """初始化转换器
 
         Args:
             debug: 是否显示调试信息
+            profile: 是否收集转换统计（各阶段耗时、处理函数调用次数等），
+                通过 get_stats() 获取
+            template: 新文档使用的模板，为 None 时使用进程内共享的默认模板
+            fast_xml: 是否使用 OoxmlWriter 直接输出段落和文本块，
+                跳过 python-docx 的代理对象（输出的 XML 结构相同）
+            compression: save() 使用的压缩配置名称（default、store、fast、max、
+                store-media）
+            prefetch_images: 是否在生成之前并发下载文档中的全部在线图片
+            image_workers: 预取在线图片的最大线程数
+            image_cache_dir: 预取在线图片时使用的磁盘缓存目录，可由多个进程
+                共用，为 None 时不使用磁盘缓存
+            image_cache_max_bytes: 磁盘缓存的大小上限（字节）
+            image_memory_max_bytes: 图片内存缓存的大小上限（字节），复用转换器
+                时缓存的图片数据不超过此大小
+            optimize_images: 是否按显示尺寸缩小并重新压缩图片后再嵌入，
+                需要安装 Pillow
+            image_dpi: 优化图片时的目标分辨率（每英寸像素数）
+            image_quality: 优化图片时的 JPEG 压缩质量（1-95）
+
+        Raises:
+            ValueError: 未知的压缩配置，下载线程数小于 1，缓存大小上限小于 0，
+                或图片优化的分辨率、质量无效
+            ImportError: 开启图片优化但没有安装 Pillow
         """
         # 调试模式
         self.debug = debug
-
-        # 启用所有需要的插件
-        self.md = (
-            MarkdownIt("commonmark", {"breaks": True, "html": True})  # 启用HTML支持
-            .enable("strikethrough")
-            .enable("emphasis")
-            .enable("table")
-        )  # 启用表格支持
-        self.document = Document()
+        # 转换统计，未开启时为 None
+        self.stats: Optional[ConversionStats] = ConversionStats() if profile else None
+
+        # 进程内共享的解析器（启用HTML、删除线、表格支持）
+        self.md = get_converter_parser()
+        # 文档模板，新文档从模板复制而不是重新解析 default.docx
+        self.template = template or get_default_template()
+        self.document = self.template.new_document()
+        # 快速输出器，未开启 fast_xml 时为 None
+        self.fast_xml = fast_xml
+        self.writer: Optional[OoxmlWriter] = (
+            OoxmlWriter(self.document) if fast_xml else None
+        )
+        # 保存时使用的压缩配置，提前校验名称
+        get_compression_profile(compression)
+        self.compression = compression
+        # 在线图片预取器，未开启预取时为 None
+        self.prefetcher: Optional[ImagePrefetcher] = (
+            ImagePrefetcher(image_workers) if prefetch_images else None
+        )
+        self.image_cache: Optional[DiskImageCache] = None
+        self.set_image_cache(image_cache_dir, image_cache_max_bytes)
+        self.image_memory_max_bytes = image_memory_max_bytes
+        # 图片优化器，未开启图片优化时为 None
+        self.image_optimizer: Optional[ImageOptimizer] = None
+        self.set_image_optimization(optimize_images, image_dpi, image_quality)
         self.converters: Dict[str, Any] = {}
         self._list_stack: List[Tuple[str, int]] = []  # [(list_type, level), ...]
+        # 本次转换是否输出调试日志，每次转换开始时由 debug 和日志级别确定
+        self._trace = False
+        # 当前 token 流的块级索引，每次解析后构建
+        self._index: Optional[BlockIndex] = None
 
         # 自动注册所有转换器
         self._register_default_converters()
 
+        # 构建 token 分发表
+        self.dispatcher = TokenDispatcher(instrument=profile)
+        self._register_default_handlers()
+
         # 调试信息
         if self.debug:
-            print(f"转换器注册完成: {self.converters.keys()}")
+            with debug_output():
+                logger.debug("转换器注册完成: %s", list(self.converters))
 
     def _register_default_converters(self) -> None:
         """注册默认的转换器"""
@@ -79,12 +162,37 @@ class BaseConverter:
         self.register_converter("list", ListConverter(self))
         self.register_converter("code", CodeConverter(self))
         self.register_converter("link", LinkConverter(self))
-        self.register_converter("image", ImageConverter(self))
+        self.register_converter(
+            "image", ImageConverter(self, self.image_memory_max_bytes)
+        )
         self.register_converter("table", TableConverter(self))
         self.register_converter("hr", HRConverter(self))
         self.register_converter("task_list", TaskListConverter(self))
         self.register_converter("html", HtmlConverter(self))  # 注册HTML转换器
 
+    def _register_default_handlers(self) -> None:
+        """注册默认的 token 处理函数"""
+        register = self.dispatcher.register
+        register("heading", ("heading_open",), self._handle_heading)
+        register("blockquote", ("blockquote_open",), self._handle_blockquote)
+        register(
+            "list_open",
+            ("bullet_list_open", "ordered_list_open"),
+            self._handle_list_open,
+        )
+        register("list_item", ("list_item_open",), self._handle_list_item)
+        register(
+            "list_close",
+            ("bullet_list_close", "ordered_list_close"),
+            self._handle_list_close,
+        )
+        register("code", ("fence",), self._handle_fence)
+        register("image", ("image",), self._handle_image)
+        register("hr", ("hr",), self._handle_hr)
+        register("table", ("table_open",), self._handle_table)
+        register("html", ("html_block", "html_inline"), self._handle_html)
+        register("paragraph", ("paragraph_open",), self._handle_paragraph)
+
     def register_converter(
         self, element_type: str, converter: ElementConverter
     ) -> None:
@@ -97,9 +205,187 @@ class BaseConverter:
         converter.set_document(self.document)
         self.converters[element_type] = converter
 
+    def reset(self, document: Optional[Document] = None) -> Document:
+        """开始一个新文档，以便复用同一个转换器
+
+        解析器和各个元素转换器保持不变，只替换目标文档并清除与文档相关的
+        状态（列表栈、列表编号、代码块状态等）。图片缓存是否保留由
+        ``ImageConverter.keep_cache`` 决定。
+
+        Args:
+            document: 新的目标文档，为 None 时从模板复制一个空白文档
+
+        Returns:
+            Document: 新的目标文档
+        """
+        self.document = (
+            document if document is not None else self.template.new_document()
+        )
+        if self.fast_xml:
+            self.writer = OoxmlWriter(self.document)
+        self._list_stack = []
+        self._index = None
+        for converter in self.converters.values():
+            converter.reset()
+            converter.set_document(self.document)
+        if self.stats is not None:
+            self.stats = ConversionStats()
+            self.dispatcher.reset_stats()
+        return self.document
+
+    def set_image_cache(
+        self,
+        directory: Optional[Union[str, Path]],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """设置预取在线图片时使用的磁盘缓存
+
+        Args:
+            directory: 缓存目录，为 None 时不使用磁盘缓存
+            max_bytes: 缓存的大小上限（字节）
+
+        Raises:
+            ValueError: 大小上限小于 0
+            OSError: 无法创建缓存目录
+        """
+        self.image_cache = (
+            DiskImageCache(directory, max_bytes) if directory is not None else None
+        )
+        if self.prefetcher is not None:
+            self.prefetcher.cache = self.image_cache
+
+    def set_image_optimization(
+        self,
+        enabled: bool,
+        dpi: int = DEFAULT_DPI,
+        quality: int = DEFAULT_QUALITY,
+    ) -> None:
+        """开启或关闭嵌入之前的图片优化（按显示尺寸缩小并重新压缩）
+
+        Args:
+            enabled: 是否优化图片
+            dpi: 目标分辨率（每英寸像素数）
+            quality: JPEG 压缩质量（1-95）
+
+        Raises:
+            ImportError: 开启优化但没有安装 Pillow
+            ValueError: 分辨率或质量无效
+        """
+        self.image_optimizer = ImageOptimizer(dpi, quality) if enabled else None
+
+    def set_profile(self, enabled: bool) -> None:
+        """开启或关闭转换统计
+
+        Args:
+            enabled: 是否收集统计
+        """
+        if enabled and self.stats is None:
+            self.stats = ConversionStats()
+        elif not enabled:
+            self.stats = None
+        self.dispatcher.set_instrument(enabled)
+
+    def get_stats(self) -> Optional[ConversionStats]:
+        """获取当前文档的转换统计
+
+        Returns:
+            Optional[ConversionStats]: 统计信息，未开启统计时返回 None
+        """
+        stats = self.stats
+        if stats is None:
+            return None
+        stats.handlers = {}
+        for name, stat in self.dispatcher.stats.items():
+            copied = stats.handlers[name] = HandlerStats(name)
+            copied.calls = stat.calls
+            copied.total_time = stat.total_time
+        image_converter = self.converters.get("image")
+        stats.bytes_fetched = getattr(image_converter, "bytes_fetched", 0)
+        stats.bytes_read = getattr(image_converter, "bytes_read", 0)
+        stats.image_cache_hits = getattr(image_converter, "images_cached", 0)
+        stats.images_optimized = getattr(image_converter, "images_optimized", 0)
+        stats.image_bytes_saved = getattr(image_converter, "bytes_saved", 0)
+        memory_cache = getattr(image_converter, "memory_cache", None)
+        if memory_cache is not None:
+            stats.memory_cache_hits = memory_cache.hits
+            stats.memory_cache_misses = memory_cache.misses
+            stats.memory_cache_evictions = memory_cache.evictions
+            stats.memory_cache_bytes = memory_cache.nbytes
+        images = get_image_store(self.document)
+        stats.images_deduplicated = images.duplicates
+        stats.image_bytes_deduplicated = images.duplicate_bytes
+        stats.count_elements(self.document)
+        return stats
+
+    def save(self, target: Union[str, IO[bytes]]) -> None:
+        """流式保存当前文档，开启统计时记录保存耗时
+
+        Args:
+            target: 文件路径或可写的二进制流，流可以不支持 seek（管道、套接字等）
+        """
+        if self.stats is None:
+            save_docx(self.document, target, self.compression)
+            return
+        start = time.perf_counter()
+        try:
+            save_docx(self.document, target, self.compression)
+        finally:
+            self.stats.save_time += time.perf_counter() - start
+
+    def _prefetch_images(self, tokens: List[Any]) -> None:
+        """通过图片转换器预取 token 流中的在线图片，开启统计时记录下载耗时
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+        """
+        prefetch = getattr(self.converters.get("image"), "prefetch", None)
+        if prefetch is None:
+            return
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        try:
+            prefetch(tokens, self.prefetcher)
+        except OSError as e:
+            # 预取失败不影响转换，未取得的图片在生成阶段逐个下载
+            if self._trace:
+                logger.debug("预取在线图片失败: %s", e)
+        if stats is not None:
+            stats.fetch_time += time.perf_counter() - start
+
+    def _optimize_images(self, tokens: List[Any]) -> None:
+        """通过图片转换器并行优化 token 流中的图片，开启统计时记录优化耗时
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+        """
+        optimize = getattr(self.converters.get("image"), "optimize", None)
+        if optimize is None:
+            return
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        optimize(tokens, self.image_optimizer)
+        if stats is not None:
+            stats.optimize_time += time.perf_counter() - start
+
+    def _resolve_debug(self) -> bool:
+        """确定本次转换是否输出调试日志，并同步到各个元素转换器
+
+        Returns:
+            bool: 是否输出调试日志
+        """
+        debug = self.debug and logger.isEnabledFor(logging.DEBUG)
+        self._trace = debug
+        for converter in self.converters.values():
+            converter.debug = debug
+        return debug
+
     def convert(self, md_text: str) -> Document:
         """将 Markdown 文本转换为 DOCX 文档
 
+        调试模式下只在本次转换期间开启 mddocx 的调试日志。
+
         Args:
             md_text: Markdown 文本
 
@@ -110,6 +396,13 @@ class BaseConverter:
             ParseError: Markdown 解析错误
             ConvertError: 转换过程错误
         """
+        if not self.debug:
+            return self._convert(md_text)
+        with debug_output():
+            return self._convert(md_text)
+
+    def _convert(self, md_text: str) -> Document:
+        """转换 Markdown 文本，见 ``convert``"""
         try:
             # 验证输入参数
             if not isinstance(md_text, str):
@@ -121,314 +414,59 @@ class BaseConverter:
                 # 空文档也创建基本的DOCX结构
                 return self.document
 
+            # 调试开关在每次转换开始时确定一次
+            debug = self._resolve_debug()
+
             # 解析 Markdown 文本为 AST
+            stats = self.stats
+            if stats is not None:
+                start = time.perf_counter()
             tokens = self.md.parse(md_text)
+            if stats is not None:
+                stats.parse_time += time.perf_counter() - start
 
-            # 调试：打印所有标记
-            if self.debug:
-                print(
-                    "-----------------==============================================="
-                )
-                print(tokens)
-                print(
-                    "-----------------==============================================="
-                )
-
+            # 调试：逐个记录解析得到的标记
+            if debug:
+                logger.debug("解析完成，共 %d 个标记", len(tokens))
                 for token in tokens:
-                    print(
-                        f"Token type={token.type}, "
-                        f"tag={token.tag if hasattr(token, 'tag') else ''}, "
-                        f"content={token.content if hasattr(token, 'content') else ''}"
+                    logger.debug(
+                        "Token type=%s, tag=%s, content=%s",
+                        token.type,
+                        token.tag,
+                        token.content,
                     )
-                    if hasattr(token, "children") and token.children is not None:
-                        for child in token.children:
-                            print(
-                                f"  Child: type={child.type}, "
-                                f"content={child.content if hasattr(child, 'content') else ''}"
-                            )
+                    for child in token.children or ():
+                        logger.debug(
+                            "  Child: type=%s, content=%s", child.type, child.content
+                        )
+
+            self._index = BlockIndex(tokens)
 
-            # 用于跟踪已处理的段落，避免重复处理
-            processed_paragraphs = set()
+            # 并发下载在线图片，生成阶段直接使用下载好的数据
+            if self.prefetcher is not None:
+                self._prefetch_images(tokens)
+            # 按显示尺寸并行缩小、重新压缩图片
+            if self.image_optimizer is not None:
+                self._optimize_images(tokens)
+            if stats is not None:
+                emit_start = time.perf_counter()
 
-            # 转换每个节点
+            # 按分发表转换每个节点，处理函数返回下一个 token 的索引
+            handlers = self.dispatcher.handlers
+            total = len(tokens)
             i = 0
-            while i < len(tokens):
+            while i < total:
                 token = tokens[i]
                 # 调试信息
-                if self.debug:
-                    print(
-                        f"Processing token: type={token.type}, tag={token.tag if hasattr(token, 'tag') else ''}"
+                if debug:
+                    logger.debug(
+                        "Processing token: type=%s, tag=%s", token.type, token.tag
                     )
+                handler = handlers.get(token.type)
+                i = handler(tokens, i) if handler is not None else i + 1
 
-                # 处理标题
-                if token.type == "heading_open":
-                    converter = self.converters.get("heading")
-                    if converter and i + 1 < len(tokens):
-                        content_token = tokens[i + 1]
-                        if content_token.type == "inline":
-                            converter.convert((token, content_token))
-                            i += 2  # 跳过内容标记
-
-                # 处理引用块
-                elif token.type == "blockquote_open":
-                    converter = self.converters.get("blockquote")
-                    if converter:
-                        # 查找引用块的内容
-                        content_start = i + 1
-                        content_end = content_start
-                        nesting_level = 1
-
-                        while content_end < len(tokens):
-                            if tokens[content_end].type == "blockquote_open":
-                                nesting_level += 1
-                            elif tokens[content_end].type == "blockquote_close":
-                                nesting_level -= 1
-                                if nesting_level == 0:
-                                    break
-                            content_end += 1
-
-                        if content_end < len(tokens):
-                            # 处理引用块内的内容
-                            j = content_start
-                            empty_quote = True
-                            while j < content_end:
-                                if (
-                                    tokens[j].type == "paragraph_open"
-                                    and j + 1 < content_end
-                                ):
-                                    content_token = tokens[j + 1]
-                                    if content_token.type == "inline":
-                                        # 获取当前引用块的层级
-                                        current_level = 0
-                                        k = j
-                                        while k >= 0:
-                                            if tokens[k].type == "blockquote_open":
-                                                current_level += 1
-                                            k -= 1
-                                        # 使用正确的引用块标记
-                                        quote_token = tokens[i]
-                                        quote_token.markup = ">" * current_level
-                                        converter.convert((quote_token, content_token))
-                                        empty_quote = False
-                                        j += 2
-                                        continue
-                                j += 1
-
-                            # 处理空引用块
-                            if empty_quote:
-                                converter.convert((tokens[i], None))
-
-                            i = content_end  # 跳到引用块结束标记
-
-                # 处理列表
-                elif token.type in ("bullet_list_open", "ordered_list_open"):
-                    # 更新列表栈
-                    list_type = (
-                        "ordered" if token.type == "ordered_list_open" else "bullet"
-                    )
-                    level = len(self._list_stack) + 1
-                    self._list_stack.append((list_type, level))
-                    if self.debug:
-                        print(f"列表开始: {token.type}, 栈={self._list_stack}")
-                    i += 1
-
-                # 处理列表项
-                elif token.type == "list_item_open":
-                    converter = self.converters.get("list")
-                    if converter:
-                        # 获取列表类型和级别
-                        list_type = (
-                            self._list_stack[-1][0] if self._list_stack else "bullet"
-                        )
-                        level = self._list_stack[-1][1] if self._list_stack else 1
-
-                        if self.debug:
-                            print(
-                                f"处理列表项: 栈={self._list_stack}, list_type={list_type}, level={level}"
-                            )
-
-                        # 创建列表token
-                        list_token = type(
-                            "ListToken",
-                            (),
-                            {
-                                "type": f"{list_type}_list_open",
-                                "content": "  " * (level - 1),
-                            },
-                        )
-
-                        # 查找列表项内容 - 简化逻辑，遇到嵌套列表时停止
-                        content_token = None
-                        j = i + 1
-                        paragraph_indices = []
-
-                        while j < len(tokens) and tokens[j].type not in (
-                            "list_item_close",
-                            "ordered_list_open",
-                            "bullet_list_open",
-                        ):
-                            if tokens[j].type == "paragraph_open" and j + 1 < len(
-                                tokens
-                            ):
-                                content_token = tokens[j + 1]
-                                paragraph_indices.append(j)
-                                if content_token.type == "inline":
-                                    break
-                            j += 1
-
-                        # 处理空列表项
-                        if not content_token:
-                            content_token = type(
-                                "EmptyToken", (), {"type": "inline", "children": []}
-                            )
-
-                        # 检查是否为任务列表项
-                        is_task_list = False
-                        if content_token.type == "inline" and hasattr(
-                            content_token, "content"
-                        ):
-                            content = content_token.content.strip()
-                            if content.startswith("[ ] ") or content.startswith("[x] "):
-                                is_task_list = True
-
-                        # 使用任务列表转换器或普通列表转换器
-                        if is_task_list and "task_list" in self.converters:
-                            self.converters["task_list"].convert(
-                                (list_token, content_token)
-                            )
-                            # 记录已处理的段落，避免重复处理
-                            for paragraph_index in paragraph_indices:
-                                processed_paragraphs.add(paragraph_index)
-                        else:
-                            converter.convert((list_token, content_token))
-
-                        # 跳过已处理的段落
-                        for paragraph_index in paragraph_indices:
-                            processed_paragraphs.add(paragraph_index)
-
-                        # 移动到下一个token
-                        i = j
-                    else:
-                        i += 1
-
-                # 处理列表结束
-                elif token.type in ("bullet_list_close", "ordered_list_close"):
-                    if self.debug:
-                        print(
-                            f"列表结束前栈: {self._list_stack}, token: {token.type}, level: {getattr(token, 'level', 'N/A')}"
-                        )
-                    # 弹出栈中对应的列表
-                    # markdown-it-py 的 level 从 0 开始，我们的栈 level 从 1 开始
-                    current_token_level = getattr(token, "level", 0)
-                    # markdown-it-py level=0 -> 栈 level=1, level=2 -> 栈 level=2
-                    target_level = (current_token_level // 2) + 1
-                    # 弹出栈顶 level == target_level 的项
-                    if self._list_stack and self._list_stack[-1][1] == target_level:
-                        self._list_stack.pop()
-                    if self.debug:
-                        print(f"列表结束后栈: {self._list_stack}")
-                    i += 1
-
-                # 处理代码块
-                elif token.type == "fence":
-                    converter = self.converters.get("code")
-                    if converter:
-                        converter.convert(token)
-                    i += 1
-
-                # 处理图片
-                elif token.type == "image":
-                    converter = self.converters.get("image")
-                    if converter:
-                        converter.convert((token, token))
-                    i += 1
-
-                # 处理水平线
-                elif token.type == "hr":
-                    converter = self.converters.get("hr")
-                    if converter:
-                        converter.convert(token)
-                    else:
-                        self.document.add_paragraph("---")
-                    i += 1
-
-                # 处理表格
-                elif token.type == "table_open":
-                    converter = self.converters.get("table")
-                    if converter:
-                        # 查找表格的结束位置
-                        table_end = i + 1
-                        while (
-                            table_end < len(tokens)
-                            and tokens[table_end].type != "table_close"
-                        ):
-                            table_end += 1
-
-                        if table_end < len(tokens):
-                            # 提取整个表格的tokens
-                            table_tokens = tokens[i : table_end + 1]
-                            if self.debug:
-                                print(f"处理表格tokens: {table_tokens}")
-                            converter.convert(tokens[i], table_tokens)
-                            i = table_end + 1  # 跳过整个表格
-                        else:
-                            i += 1
-                    else:
-                        i += 1
-
-                # 处理HTML标签
-                elif token.type == "html_block" or token.type == "html_inline":
-                    converter = self.converters.get("html")
-                    if converter:
-                        if self.debug:
-                            print(
-                                f"处理HTML标签: {token.content if hasattr(token, 'content') else ''}"
-                            )
-                        converter.convert(token)
-                    i += 1
-
-                # 处理段落
-                elif token.type == "paragraph_open":
-                    # 检查是否已经处理过这个段落
-                    if i in processed_paragraphs:
-                        # 跳过已处理的段落
-                        i += 2  # 跳过段落开始和内容标记
-                        while i < len(tokens) and tokens[i].type != "paragraph_close":
-                            i += 1
-                        i += 1  # 跳过段落结束标记
-                    else:
-                        converter = self.converters.get("text")
-                        if converter and i + 1 < len(tokens):
-                            content_token = tokens[i + 1]
-                            if content_token.type == "inline":
-                                # 检查是否为任务列表项
-                                is_task_list = False
-                                if hasattr(content_token, "content"):
-                                    content = content_token.content.strip()
-                                    if content.startswith("[ ] ") or content.startswith(
-                                        "[x] "
-                                    ):
-                                        is_task_list = True
-
-                                # 如果是任务列表项，使用任务列表转换器
-                                if is_task_list and "task_list" in self.converters:
-                                    # 创建一个虚拟的列表token
-                                    list_token = type(
-                                        "ListToken",
-                                        (),
-                                        {"type": "bullet_list_open", "content": ""},
-                                    )
-                                    self.converters["task_list"].convert(
-                                        (list_token, content_token)
-                                    )
-                                else:
-                                    converter.convert((token, content_token))
-                                i += 2  # 跳过内容标记
-                        else:
-                            i += 1
-                else:
-                    i += 1
-
+            if stats is not None:
+                stats.emit_time += time.perf_counter() - emit_start
             return self.document
 
         except (TypeError, ValueError) as e:
@@ -440,3 +478,291 @@ class BaseConverter:
         except Exception as e:
             # 其他未知错误
             raise ConvertError(f"转换过程发生未知错误: {str(e)}")
+        finally:
+            # 释放本次解析的索引，token 列表随之不再被引用
+            self._index = None
+
+    def convert_stream(
+        self, lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Document:
+        """以流式分块的方式转换 Markdown
+
+        输入在顶层块之间的空行处切分，每个块单独解析并输出到同一个文档，
+        处理完即释放该块的 token，适合体积很大的生成报告。
+        输入中的引用式链接定义预先收集并加在每个块前面，
+        只能读取一次的输入除外（见 ``streaming.collect_link_definitions``）。
+
+        Args:
+            lines: Markdown 行的可迭代对象（例如打开的文本文件）
+            chunk_size: 目标块大小（字符数）
+
+        Returns:
+            Document: 生成的 DOCX 文档
+
+        Raises:
+            ParseError: Markdown 解析错误
+            ConvertError: 转换过程错误
+        """
+        lines, definitions = collect_link_definitions(lines)
+        for chunk in iter_chunks(lines, chunk_size):
+            self.convert(definitions + chunk)
+        return self.document
+
+    def convert_parallel(
+        self,
+        lines: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_size: int = MIN_PARALLEL_CHUNK_SIZE,
+    ) -> Document:
+        """使用多个进程转换一个大型 Markdown 文档
+
+        输入按与 ``convert_stream`` 相同的规则切分，各块在进程池中转换为
+        正文片段后按原顺序拼接，超链接和图片的关系 ID 会重新分配。
+        工作进程使用默认配置的转换器（沿用 debug 和 fast_xml 设置）。
+
+        Args:
+            lines: Markdown 文本或行的可迭代对象
+            workers: 工作进程数量，默认为 CPU 核心数
+            chunk_size: 目标块大小（字符数）
+
+        Returns:
+            Document: 生成的 DOCX 文档
+        """
+        return convert_parallel(self, lines, workers, chunk_size)
+
+    def _handle_heading(self, tokens: List[Any], i: int) -> int:
+        """处理标题"""
+        converter = self.converters.get("heading")
+        heading_end = self._index.close[i]
+        if converter and heading_end > i + 1:
+            content_token = tokens[i + 1]
+            if content_token.type == "inline":
+                converter.convert((tokens[i], content_token))
+                return heading_end + 1  # 跳过内容和结束标记
+        return i + 1
+
+    def _handle_blockquote(self, tokens: List[Any], i: int) -> int:
+        """处理引用块"""
+        converter = self.converters.get("blockquote")
+        if not converter:
+            return i + 1
+
+        # 引用块的结束位置由预处理索引给出
+        close = self._index.close
+        quote_depth = self._index.quote_depth
+        content_end = close[i]
+        if content_end == -1:
+            return i + 1
+
+        # 处理引用块内的内容
+        j = i + 1
+        empty_quote = True
+        while j < content_end:
+            if tokens[j].type == "paragraph_open" and j + 1 < content_end:
+                content_token = tokens[j + 1]
+                if content_token.type == "inline":
+                    # 段落所在的引用块层级由预处理索引给出
+                    converter.convert((tokens[i], content_token), level=quote_depth[j])
+                    empty_quote = False
+                    j = self._skip_block(j)  # 跳到段落结束标记之后
+                    continue
+            j += 1
+
+        # 处理空引用块
+        if empty_quote:
+            converter.convert((tokens[i], None), level=quote_depth[i])
+
+        return content_end + 1  # 跳过引用块结束标记
+
+    def _handle_list_open(self, tokens: List[Any], i: int) -> int:
+        """处理列表开始，更新列表栈"""
+        token = tokens[i]
+        list_type = "ordered" if token.type == "ordered_list_open" else "bullet"
+        level = len(self._list_stack) + 1
+        self._list_stack.append((list_type, level))
+        if self._trace:
+            logger.debug("列表开始: %s, 栈=%s", token.type, self._list_stack)
+        return i + 1
+
+    def _handle_list_item(self, tokens: List[Any], i: int) -> int:
+        """处理列表项"""
+        converter = self.converters.get("list")
+        if not converter:
+            return i + 1
+
+        # 获取列表类型和级别
+        list_type = self._list_stack[-1][0] if self._list_stack else "bullet"
+        level = self._list_stack[-1][1] if self._list_stack else 1
+
+        if self._trace:
+            logger.debug(
+                "处理列表项: 栈=%s, list_type=%s, level=%s",
+                self._list_stack,
+                list_type,
+                level,
+            )
+
+        # 创建列表token
+        list_token = type(
+            "ListToken",
+            (),
+            {
+                "type": f"{list_type}_list_open",
+                "content": "  " * (level - 1),
+            },
+        )
+
+        # 查找列表项内容 - 简化逻辑，遇到嵌套列表时停止
+        close = self._index.close
+        item_end = close[i] if close[i] != -1 else len(tokens)
+        content_token = None
+        # 列表项处理完后继续的位置：默认停在嵌套列表或列表项结束处，
+        # 若已使用列表项内的段落，则直接跳过该段落
+        next_index = i + 1
+        while next_index < item_end and tokens[next_index].type not in (
+            "ordered_list_open",
+            "bullet_list_open",
+        ):
+            if (
+                tokens[next_index].type == "paragraph_open"
+                and next_index + 1 < item_end
+            ):
+                content_token = tokens[next_index + 1]
+                next_index = self._skip_block(next_index)
+                break
+            next_index += 1
+
+        # 处理空列表项
+        if not content_token:
+            content_token = type("EmptyToken", (), {"type": "inline", "children": []})
+
+        # 使用任务列表转换器或普通列表转换器
+        if self._is_task_item(content_token) and "task_list" in self.converters:
+            self.converters["task_list"].convert((list_token, content_token))
+        else:
+            converter.convert((list_token, content_token))
+
+        return next_index
+
+    def _handle_list_close(self, tokens: List[Any], i: int) -> int:
+        """处理列表结束，弹出列表栈"""
+        token = tokens[i]
+        if self._trace:
+            logger.debug(
+                "列表结束前栈: %s, token: %s, level: %s",
+                self._list_stack,
+                token.type,
+                getattr(token, "level", "N/A"),
+            )
+        # 弹出栈中对应的列表
+        # markdown-it-py 的 level 从 0 开始，我们的栈 level 从 1 开始
+        current_token_level = getattr(token, "level", 0)
+        # markdown-it-py level=0 -> 栈 level=1, level=2 -> 栈 level=2
+        target_level = (current_token_level // 2) + 1
+        # 弹出栈顶 level == target_level 的项
+        if self._list_stack and self._list_stack[-1][1] == target_level:
+            self._list_stack.pop()
+        if self._trace:
+            logger.debug("列表结束后栈: %s", self._list_stack)
+        return i + 1
+
+    def _handle_fence(self, tokens: List[Any], i: int) -> int:
+        """处理代码块"""
+        converter = self.converters.get("code")
+        if converter:
+            converter.convert(tokens[i])
+        return i + 1
+
+    def _handle_image(self, tokens: List[Any], i: int) -> int:
+        """处理图片"""
+        converter = self.converters.get("image")
+        if converter:
+            converter.convert((tokens[i], tokens[i]))
+        return i + 1
+
+    def _handle_hr(self, tokens: List[Any], i: int) -> int:
+        """处理水平线"""
+        converter = self.converters.get("hr")
+        if converter:
+            converter.convert(tokens[i])
+        else:
+            self.document.add_paragraph("---")
+        return i + 1
+
+    def _handle_table(self, tokens: List[Any], i: int) -> int:
+        """处理表格"""
+        converter = self.converters.get("table")
+        if not converter:
+            return i + 1
+
+        # 表格的结束位置由预处理索引给出
+        table_end = self._index.close[i]
+        if table_end == -1:
+            return i + 1
+
+        # 提取整个表格的tokens
+        table_tokens = tokens[i : table_end + 1]
+        if self._trace:
+            logger.debug("处理表格tokens: %s", table_tokens)
+        converter.convert(tokens[i], table_tokens)
+        return table_end + 1  # 跳过整个表格
+
+    def _handle_html(self, tokens: List[Any], i: int) -> int:
+        """处理HTML标签"""
+        converter = self.converters.get("html")
+        if converter:
+            token = tokens[i]
+            if self._trace:
+                logger.debug("处理HTML标签: %s", getattr(token, "content", ""))
+            converter.convert(token)
+        return i + 1
+
+    def _handle_paragraph(self, tokens: List[Any], i: int) -> int:
+        """处理段落"""
+        converter = self.converters.get("text")
+        if not converter or i + 1 >= len(tokens):
+            return i + 1
+
+        content_token = tokens[i + 1]
+        if content_token.type != "inline":
+            return i + 1
+
+        # 如果是任务列表项，使用任务列表转换器
+        if self._is_task_item(content_token) and "task_list" in self.converters:
+            # 创建一个虚拟的列表token
+            list_token = type(
+                "ListToken",
+                (),
+                {"type": "bullet_list_open", "content": ""},
+            )
+            self.converters["task_list"].convert((list_token, content_token))
+        else:
+            converter.convert((tokens[i], content_token))
+        return self._skip_block(i)  # 跳过内容和结束标记
+
+    def _skip_block(self, index: int) -> int:
+        """获取块结束标记之后的位置
+
+        Args:
+            index: ``*_open`` token 的索引
+
+        Returns:
+            int: 对应结束标记的下一个索引，没有匹配的结束标记时返回 index + 1
+        """
+        block_end = self._index.close[index]
+        return block_end + 1 if block_end > index else index + 1
+
+    @staticmethod
+    def _is_task_item(content_token: Any) -> bool:
+        """检查内容标记是否为任务列表项
+
+        Args:
+            content_token: 内联内容标记
+
+        Returns:
+            bool: 是否以 "[ ] " 或 "[x] " 开头
+        """
+        if content_token.type != "inline" or not hasattr(content_token, "content"):
+            return False
+        content = content_token.content.strip()
+        return content.startswith("[ ] ") or content.startswith("[x] ")
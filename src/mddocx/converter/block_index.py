@@ -0,0 +1,49 @@
+"""
+块级索引模块，在每次解析后对 token 流做一次预处理
+"""
+
+from typing import Any, List
+
+
+class BlockIndex:
+    """token 流的块级索引
+
+    在 ``BaseConverter.convert`` 解析完成后构建一次，之后各个处理函数
+    可以 O(1) 查询任意 token 的信息，而不需要在 token 流中来回扫描。
+
+    Attributes:
+        close: 每个 ``*_open`` token 对应的 ``*_close`` token 的索引，
+            其他 token 以及未闭合的开始标记为 -1。
+        quote_depth: 每个 token 所在的引用块嵌套深度，0 表示不在引用块内。
+            ``blockquote_open`` / ``blockquote_close`` 自身计入其所开启的层级。
+    """
+
+    __slots__ = ("close", "quote_depth")
+
+    def __init__(self, tokens: List[Any]) -> None:
+        """构建索引
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+        """
+        total = len(tokens)
+        close = [-1] * total
+        quote_depth = [0] * total
+        stack: List[int] = []
+        depth = 0
+        for idx, token in enumerate(tokens):
+            nesting = token.nesting
+            if nesting == 1:
+                stack.append(idx)
+                if token.type == "blockquote_open":
+                    depth += 1
+            elif nesting == -1:
+                if stack:
+                    close[stack.pop()] = idx
+                quote_depth[idx] = depth
+                if token.type == "blockquote_close":
+                    depth -= 1
+                continue
+            quote_depth[idx] = depth
+        self.close = close
+        self.quote_depth = quote_depth
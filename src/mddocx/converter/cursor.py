@@ -0,0 +1,131 @@
+"""
+正文游标模块
+
+python-docx 的 ``document.paragraphs`` 每次访问都会为正文中的全部段落创建
+代理对象，转换器用 ``document.paragraphs[-1]`` 取“刚输出的段落”时，每个
+块的开销都与已有段落数量成正比，整个文档因此是平方复杂度。
+
+正文游标挂在每个文档部件上，记住正文末尾的分节属性：新的块级元素直接插入
+到它之前，不必像 python-docx 那样每次都在正文中查找 ``w:sectPr``；最后一个
+段落从正文末尾向前查找，通常只需要检查一两个元素。表格按游标记住的分节
+属性计算宽度，不像 ``document.add_table`` 那样在整个文档中查找全部分节属性、
+也不经过样式表解析默认表格样式。
+"""
+
+from typing import Any, Optional
+
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.table import CT_Tbl
+from docx.section import Section
+from docx.shared import Emu, Inches, Length
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+_P = qn("w:p")
+_SECT_PR = qn("w:sectPr")
+
+# 游标在文档部件上的属性名
+_ATTR = "_mddocx_body_cursor"
+
+
+class BodyCursor:
+    """文档正文末尾的游标"""
+
+    def __init__(self, document: Document) -> None:
+        """初始化正文游标
+
+        Args:
+            document: 目标文档
+        """
+        self._document = document
+        self._body = document.element.body
+        self._parent = document._body
+        self._sect_pr = self._body.find(_SECT_PR)
+
+    def _body_sect_pr(self) -> Optional[Any]:
+        """正文末尾的分节属性，被移走时重新查找"""
+        sect_pr = self._sect_pr
+        if sect_pr is None or sect_pr.getparent() is not self._body:
+            sect_pr = self._sect_pr = self._body.find(_SECT_PR)
+        return sect_pr
+
+    def append(self, element: Any) -> None:
+        """把块级元素追加到正文末尾（分节属性之前）
+
+        Args:
+            element: w:p、w:tbl 等块级元素
+        """
+        sect_pr = self._body_sect_pr()
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            self._body.append(element)
+
+    def add_paragraph(self) -> Paragraph:
+        """在正文末尾追加一个空段落，等价于 ``document.add_paragraph()``
+
+        Returns:
+            Paragraph: 新段落
+        """
+        p = OxmlElement("w:p")
+        self.append(p)
+        return Paragraph(p, self._parent)
+
+    def add_table(self, rows: int, cols: int) -> Table:
+        """在正文末尾追加表格，等价于 ``document.add_table(rows, cols)``
+
+        Args:
+            rows: 行数
+            cols: 列数
+
+        Returns:
+            Table: 新表格（未设置表格样式）
+        """
+        tbl = CT_Tbl.new_tbl(rows, cols, self._block_width())
+        self.append(tbl)
+        return Table(tbl, self._parent)
+
+    def _block_width(self) -> Length:
+        """正文宽度，与 python-docx 按最后一节计算的结果相同"""
+        sect_pr = self._body_sect_pr()
+        if sect_pr is None:
+            return self._document._block_width
+        section = Section(sect_pr, self._document.part)
+        page_width = section.page_width or Inches(8.5)
+        left_margin = section.left_margin or Inches(1)
+        right_margin = section.right_margin or Inches(1)
+        return Emu(page_width - left_margin - right_margin)
+
+    def last_paragraph(self) -> Optional[Paragraph]:
+        """获取正文中的最后一个段落
+
+        结果与 ``document.paragraphs[-1]`` 相同：跳过末尾的分节属性和表格，
+        不查找表格内的段落。
+
+        Returns:
+            Optional[Paragraph]: 最后一个段落，正文中没有段落时为 None
+        """
+        # 反向遍历从最后一个子元素开始，不会先数出全部子元素
+        for element in reversed(self._body):
+            if element.tag == _P:
+                return Paragraph(element, self._parent)
+        return None
+
+
+def get_body_cursor(document: Document) -> BodyCursor:
+    """获取文档的正文游标，首次访问时创建并挂在文档部件上
+
+    Args:
+        document: 目标文档
+
+    Returns:
+        BodyCursor: 该文档的正文游标
+    """
+    part = document.part
+    cursor = getattr(part, _ATTR, None)
+    if cursor is None:
+        cursor = BodyCursor(document)
+        setattr(part, _ATTR, cursor)
+    return cursor
@@ -0,0 +1,319 @@
+"""
+图片磁盘缓存模块
+
+图片转换器的内存缓存只在一个转换器实例内有效，每次运行命令行工具、批量转换
+的每个进程都要重新下载同样的在线图片。
+
+磁盘缓存保存在一个可由多个进程共用的目录中：
+
+- ``objects/<摘要前两位>/<SHA-256>`` 按内容保存图片，地址不同但内容相同的
+  图片只保存一份；
+- ``index/<地址的 SHA-256>.json`` 记录地址对应的内容摘要以及服务器返回的
+  ``ETag``、``Last-Modified``，再次使用时据此发送条件请求重新验证。
+
+所有文件先写入同一目录下的临时文件，再用 ``os.replace`` 原子替换，并发的
+进程不会读到写了一半的文件。缓存总大小超过上限时按最近使用时间（读取时
+更新文件的修改时间）淘汰最久未用的图片，同时删除图片已被淘汰的地址记录。
+
+``map`` 以只读方式映射较大的缓存图片文件，返回的 ``memoryview`` 可以直接
+放入图片内存缓存而不复制数据；文件随后被淘汰时，已建立的映射仍然有效。
+每个映射都占用一个文件描述符，小于 ``MMAP_MIN_BYTES`` 的图片直接读入内存，
+内存缓存的大小上限因此也限制了同时存在的映射数量。
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ..log import debug_enabled
+
+logger = logging.getLogger(__name__)
+
+# 默认缓存大小上限（字节）
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 映射图片文件的最小大小（字节），更小的图片直接读入内存
+MMAP_MIN_BYTES = 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    """缓存中某个地址的记录"""
+
+    url: str
+    digest: str
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class DiskImageCache:
+    """按内容寻址、带重新验证信息和 LRU 淘汰的图片磁盘缓存
+
+    同一进程内可以被多个线程同时使用。
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """初始化磁盘缓存，目录不存在时创建
+
+        Args:
+            directory: 缓存目录
+            max_bytes: 图片数据的总大小上限（字节）
+
+        Raises:
+            ValueError: 大小上限小于 0
+            OSError: 无法创建缓存目录
+        """
+        if max_bytes < 0:
+            raise ValueError(f"缓存大小上限不能小于 0，得到 {max_bytes}")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._objects = self.directory / "objects"
+        self._index = self.directory / "index"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._index.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 估计的图片数据总大小，首次写入时扫描目录得到，超过上限时重新扫描
+        self._size: Optional[int] = None
+
+    def _index_path(self, url: str) -> Path:
+        return self._index / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """查找地址对应的缓存记录
+
+        Args:
+            url: 图片地址
+
+        Returns:
+            Optional[CacheEntry]: 缓存记录，未缓存或图片已被淘汰时为 None
+        """
+        path = self._index_path(url)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CacheEntry(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            if debug_enabled():
+                logger.debug("图片缓存记录无效: %s %s", path, e)
+            return None
+        if entry.url != url or not self._object_path(entry.digest).exists():
+            return None
+        return entry
+
+    def read(self, entry: CacheEntry) -> Optional[bytes]:
+        """读取缓存的图片数据，并把图片标记为最近使用
+
+        Args:
+            entry: 缓存记录
+
+        Returns:
+            Optional[bytes]: 图片数据，图片已被淘汰时为 None
+        """
+        path = self._object_path(entry.digest)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def map(self, entry: CacheEntry) -> Optional[memoryview]:
+        """只读映射缓存的图片文件，并把图片标记为最近使用
+
+        小于 ``MMAP_MIN_BYTES`` 的图片以及无法映射的图片直接读入内存。
+
+        Args:
+            entry: 缓存记录
+
+        Returns:
+            Optional[memoryview]: 图片数据的只读视图，图片已被淘汰或无法读取时
+            为 None
+        """
+        path = self._object_path(entry.digest)
+        try:
+            with open(path, "rb") as f:
+                data = self._map_file(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            # 例如文件描述符耗尽，当作未缓存处理
+            if debug_enabled():
+                logger.debug("无法读取缓存的图片: %s %s", path, e)
+            return None
+        return data
+
+    @staticmethod
+    def _map_file(f) -> memoryview:
+        """映射已打开的图片文件，较小或无法映射时读入内存"""
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            try:
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except OSError as e:
+                if debug_enabled():
+                    logger.debug("无法映射缓存的图片，改为读取: %s", e)
+        return memoryview(f.read())
+
+    @staticmethod
+    def validators(entry: CacheEntry) -> Dict[str, str]:
+        """重新验证缓存记录时使用的条件请求头
+
+        Args:
+            entry: 缓存记录
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since 请求头，服务器没有
+            提供验证信息时为空
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        url: str,
+        data: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """保存图片数据及其验证信息，超过大小上限时淘汰最久未用的图片
+
+        Args:
+            url: 图片地址
+            data: 图片数据
+            etag: 服务器返回的 ETag
+            last_modified: 服务器返回的 Last-Modified
+
+        Returns:
+            CacheEntry: 新的缓存记录
+
+        Raises:
+            OSError: 写入缓存失败
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        added = 0
+        if path.exists():
+            os.utime(path)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            _atomic_write(path, data)
+            added = len(data)
+        entry = CacheEntry(url, digest, len(data), etag, last_modified)
+        _atomic_write(
+            self._index_path(url),
+            json.dumps(entry._asdict(), ensure_ascii=False).encode("utf-8"),
+        )
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += added
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+        return entry
+
+    def evict(self) -> int:
+        """淘汰最久未用的图片，直到总大小不超过上限，并删除失效的地址记录
+
+        Returns:
+            int: 淘汰的图片数量
+        """
+        with self._lock:
+            objects = self._scan()
+            total = sum(size for _, _, size in objects)
+            removed = 0
+            for _, path, size in sorted(objects):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # 例如 Windows 上仍被映射的文件不能删除，留待下次淘汰
+                    if debug_enabled():
+                        logger.debug("无法淘汰缓存的图片: %s %s", path, e)
+                    continue
+                total -= size
+                removed += 1
+            self._size = total
+            pruned = self._prune_index()
+        if (removed or pruned) and debug_enabled():
+            logger.debug("图片缓存淘汰 %s 张图片，删除 %s 条地址记录", removed, pruned)
+        return removed
+
+    def _prune_index(self) -> int:
+        """删除图片已不存在或无法解析的地址记录
+
+        Returns:
+            int: 删除的记录数量
+        """
+        pruned = 0
+        for path in self._index.glob("*.json"):
+            try:
+                digest = json.loads(path.read_text(encoding="utf-8"))["digest"]
+                if self._object_path(digest).exists():
+                    continue
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if debug_enabled():
+                    logger.debug("无法删除图片缓存记录: %s %s", path, e)
+                continue
+            pruned += 1
+        return pruned
+
+    def _scan(self) -> List[Tuple[float, Path, int]]:
+        """列出缓存的图片：(最近使用时间, 路径, 大小)"""
+        objects = []
+        for path in self._objects.glob("*/*"):
+            if path.name.startswith("."):
+                # 其他进程正在写入的临时文件
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stat.st_mtime, path, stat.st_size))
+        return objects
+
+    def _scan_size(self) -> int:
+        return sum(size for _, _, size in self._scan())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """先写入同一目录下的临时文件，再原子替换目标文件"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
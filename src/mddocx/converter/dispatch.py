@@ -0,0 +1,121 @@
+"""
+Token 分发模块，将 markdown-it 的 token 类型映射到处理函数
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# 处理函数签名: handler(tokens, index) -> 下一个要处理的 token 索引
+Handler = Callable[[List[Any], int], int]
+
+
+class HandlerStats:
+    """单个处理函数的调用统计"""
+
+    __slots__ = ("name", "calls", "total_time")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典
+
+        Returns:
+            Dict[str, Any]: 包含调用次数和耗时（秒）的字典
+        """
+        return {"calls": self.calls, "total_time": self.total_time}
+
+    def __repr__(self) -> str:
+        return f"HandlerStats({self.name!r}, calls={self.calls}, total_time={self.total_time:.6f})"
+
+
+class TokenDispatcher:
+    """Token 分发表
+
+    在转换器初始化时构建一次，把 token 类型直接映射到处理函数，
+    替代逐个比较 token.type 的 if/elif 链。开启统计后，每个处理函数
+    都会被包装一层计数器和计时器。
+    """
+
+    def __init__(self, instrument: bool = False) -> None:
+        """初始化分发表
+
+        Args:
+            instrument: 是否统计每个处理函数的调用次数和耗时
+        """
+        # token 类型 -> (处理函数名称, 原始处理函数)
+        self._entries: Dict[str, Tuple[str, Handler]] = {}
+        # token 类型 -> 实际调用的处理函数（可能带统计包装）
+        self.handlers: Dict[str, Handler] = {}
+        # 处理函数名称 -> 统计信息
+        self.stats: Dict[str, HandlerStats] = {}
+        self.instrument = instrument
+
+    def register(self, name: str, token_types: Iterable[str], handler: Handler) -> None:
+        """注册处理函数
+
+        Args:
+            name: 处理函数名称，用于统计信息
+            token_types: 该函数处理的 token 类型
+            handler: 处理函数
+        """
+        for token_type in token_types:
+            self._entries[token_type] = (name, handler)
+            self.handlers[token_type] = self._wrap(name, handler)
+
+    def get(self, token_type: str) -> Any:
+        """获取 token 类型对应的处理函数
+
+        Args:
+            token_type: token 类型
+
+        Returns:
+            Optional[Handler]: 处理函数，未注册时返回 None
+        """
+        return self.handlers.get(token_type)
+
+    def set_instrument(self, enabled: bool) -> None:
+        """开启或关闭调用统计
+
+        Args:
+            enabled: 是否开启统计
+        """
+        self.instrument = enabled
+        for token_type, (name, handler) in self._entries.items():
+            self.handlers[token_type] = self._wrap(name, handler)
+
+    def reset_stats(self) -> None:
+        """清空统计信息"""
+        for stat in self.stats.values():
+            stat.calls = 0
+            stat.total_time = 0.0
+
+    def _wrap(self, name: str, handler: Handler) -> Handler:
+        """按需为处理函数添加计数和计时
+
+        Args:
+            name: 处理函数名称
+            handler: 原始处理函数
+
+        Returns:
+            Handler: 未开启统计时返回原函数，否则返回包装后的函数
+        """
+        if not self.instrument:
+            return handler
+
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = HandlerStats(name)
+        perf_counter = time.perf_counter
+
+        def instrumented(tokens: List[Any], index: int) -> int:
+            start = perf_counter()
+            try:
+                return handler(tokens, index)
+            finally:
+                stat.calls += 1
+                stat.total_time += perf_counter() - start
+
+        return instrumented
@@ -2,9 +2,17 @@
 基础元素转换器模块
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Hashable, Optional
 
 from docx import Document
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from ..cursor import BodyCursor, get_body_cursor
+from ..inline import InlineRenderer
+from ..ooxml import RunCoalescer, append_text
+from ..relations import RelationshipIndex, get_relationship_index
+from ..styles import StyleRegistry, get_style_registry
 
 
 class ElementConverter:
@@ -18,6 +26,12 @@ class ElementConverter:
         """
         self.document: Optional[Document] = None
         self.base_converter = base_converter
+        # 是否输出调试日志，BaseConverter 在每次转换开始时统一设置
+        self.debug = bool(getattr(base_converter, "debug", False))
+        # 相邻同格式文本块合并
+        self._runs = RunCoalescer()
+        # 段落、列表项等块内的内联内容渲染器
+        self.inline = InlineRenderer(self)
 
     def set_document(self, document: Document) -> None:
         """设置文档实例
@@ -27,6 +41,64 @@ class ElementConverter:
         """
         self.document = document
 
+    @property
+    def style_registry(self) -> StyleRegistry:
+        """当前文档的样式注册表"""
+        return get_style_registry(self.document)
+
+    @property
+    def relationship_index(self) -> RelationshipIndex:
+        """当前文档正文部件的关系索引"""
+        return get_relationship_index(self.document)
+
+    @property
+    def cursor(self) -> BodyCursor:
+        """当前文档的正文游标"""
+        return get_body_cursor(self.document)
+
+    @property
+    def writer(self) -> Optional[Any]:
+        """基础转换器的快速输出器（OoxmlWriter），未开启时为 None"""
+        return getattr(self.base_converter, "writer", None)
+
+    def reset(self) -> None:
+        """清除与单个文档相关的状态
+
+        在转换器被复用于新文档之前调用，子类覆盖时需要调用父类实现。
+        """
+        self._runs.clear()
+
+    def _add_run(
+        self,
+        paragraph: Paragraph,
+        text: str,
+        key: Hashable = None,
+        configure: Optional[Callable[[Run], None]] = None,
+    ) -> None:
+        """向段落添加文本块
+
+        与段落中上一个格式键相同的文本块相邻时，文本合并到该文本块中。
+        开启快速输出时通过 OoxmlWriter 输出，否则使用 python-docx。
+
+        Args:
+            paragraph: 目标段落
+            text: 文本内容
+            key: 文本格式键，相同的键必须对应相同的 configure
+            configure: 设置文本块格式的函数，为 None 时不设置格式
+        """
+        if text and self._runs.extend(paragraph, key, text):
+            return
+        writer = self.writer
+        if writer is not None:
+            r = writer.add_run(paragraph, text, key, configure)
+        else:
+            run = paragraph.add_run()
+            append_text(run._r, text)
+            if configure is not None:
+                configure(run)
+            r = run._r
+        self._runs.record(key, r)
+
     def convert(self, element: Any) -> Any:
         """转换元素（需要子类实现）
 
@@ -18,16 +18,27 @@ class CodeConverter(ElementConverter):
 
         self.document = document
         # 创建代码样式
-        if "Code" not in self.document.styles:
-            style = self.document.styles.add_style("Code", WD_STYLE_TYPE.PARAGRAPH)
-            font = style.font
-            font.name = "Consolas"  # 使用等宽字体
-            font.size = Pt(10)
-            # 设置段落格式
-            style.paragraph_format.space_before = Pt(10)
-            style.paragraph_format.space_after = Pt(10)
-            style.paragraph_format.left_indent = Pt(32)  # 约0.5英寸
-            style.paragraph_format.right_indent = Pt(32)  # 约0.5英寸
+        self.style_registry.ensure(
+            "Code", WD_STYLE_TYPE.PARAGRAPH, self._configure_code_style
+        )
+
+    @staticmethod
+    def _configure_code_style(style):
+        """设置新建的代码样式"""
+        font = style.font
+        font.name = "Consolas"  # 使用等宽字体
+        font.size = Pt(10)
+        font.color.rgb = RGBColor(51, 51, 51)  # 深灰色
+        # 设置段落格式
+        style.paragraph_format.space_before = Pt(10)
+        style.paragraph_format.space_after = Pt(10)
+        style.paragraph_format.left_indent = Pt(32)  # 约0.5英寸
+        style.paragraph_format.right_indent = Pt(32)  # 约0.5英寸
+
+    def reset(self):
+        """清除上一个文档的代码块状态"""
+        super().reset()
+        self._last_was_code = False
 
     def convert(self, token):
         """转换代码块
@@ -39,31 +50,31 @@ class CodeConverter(ElementConverter):
             raise ValueError("Document not set")
 
         # 如果上一个是代码块，添加空行
+        writer = self.writer
         if self._last_was_code:
-            self.document.add_paragraph()
+            if writer is not None:
+                writer.add_paragraph()
+            else:
+                self.document.add_paragraph()
 
         # 创建新段落
-        paragraph = self.document.add_paragraph()
-        paragraph.style = "Code"
+        if writer is not None:
+            paragraph = writer.add_paragraph(self.style_registry.style_id("Code"))
+        else:
+            paragraph = self.document.add_paragraph()
+            self.style_registry.apply_paragraph_style(paragraph, "Code")
 
         # 获取代码内容
         code = token.content if hasattr(token, "content") else ""
 
         # 处理空的代码块
         if not code:
-            paragraph.add_run("")
+            self._add_run(paragraph, "")
             return
 
-        # 分割并处理每一行，去掉末尾的空行
-        lines = code.rstrip("\n").splitlines()
-
-        # 添加代码内容
-        for i, line in enumerate(lines):
-            if i > 0:  # 不是第一行，添加换行符
-                paragraph.add_run("\n")
-            run = paragraph.add_run(line)
-            run.font.name = "Consolas"
-            run.font.color.rgb = RGBColor(51, 51, 51)  # 深灰色
+        # 去掉末尾的空行，整个代码块放在一个文本块中，行之间使用 w:br 换行，
+        # 字体和颜色来自 Code 样式
+        self._add_run(paragraph, "\n".join(code.rstrip("\n").splitlines()))
 
         # 更新状态
         self._last_was_code = True
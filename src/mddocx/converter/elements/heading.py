@@ -5,6 +5,7 @@
 from typing import Any, Dict, Tuple
 
 from docx.shared import Pt
+from docx.text.run import Run
 
 from .base import ElementConverter
 
@@ -46,12 +47,32 @@ class HeadingConverter(ElementConverter):
         text = content_token.content
 
         # 添加标题段落
-        paragraph = self.document.add_paragraph()
-        paragraph.style = self.document.styles[self.HEADING_STYLES[level]["name"]]
-        run = paragraph.add_run(text)
+        style = self.HEADING_STYLES[level]
+        writer = self.writer
+        if writer is not None:
+            paragraph = writer.add_paragraph(
+                self.style_registry.style_id(style["name"])
+            )
+        else:
+            paragraph = self.document.add_paragraph()
+            self.style_registry.apply_paragraph_style(paragraph, style["name"])
+
+        # 添加文本并应用样式
+        self._add_run(
+            paragraph,
+            text,
+            ("heading", level),
+            lambda run: self._apply_font(run, style),
+        )
+
+    @staticmethod
+    def _apply_font(run: Run, style: Dict[str, Any]) -> None:
+        """设置标题文本块的字号和粗体
 
-        # 应用样式
+        Args:
+            run: 文本块
+            style: 标题样式配置
+        """
         font = run.font
-        style = self.HEADING_STYLES[level]
         font.size = Pt(style["size"])
         font.bold = style["bold"]
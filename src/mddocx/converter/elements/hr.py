@@ -2,12 +2,16 @@
 分隔线转换器模块
 """
 
+import logging
+
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
 
 class HRConverter(ElementConverter):
     """分隔线转换器，处理Markdown中的水平分隔线"""
@@ -19,9 +23,6 @@ class HRConverter(ElementConverter):
             base_converter: 基础转换器实例
         """
         super().__init__(base_converter)
-        self.debug = False
-        if base_converter:
-            self.debug = base_converter.debug
 
     def convert(self, token):
         """转换分隔线token为DOCX水平线
@@ -36,7 +37,7 @@ class HRConverter(ElementConverter):
             raise ValueError("Document not set for HRConverter")
 
         if self.debug:
-            print(f"处理分隔线: {token}")
+            logger.debug("处理分隔线: %s", token)
 
         # 创建一个空段落
         paragraph = self.document.add_paragraph()
@@ -2,6 +2,7 @@
 HTML转换器模块，处理Markdown中的HTML标签
 """
 
+import logging
 import os
 import re
 import tempfile
@@ -20,6 +21,8 @@ except ImportError:
 
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
 
 class HtmlConverter(ElementConverter):
     """HTML转换器，处理Markdown中的HTML标签"""
@@ -31,9 +34,6 @@ class HtmlConverter(ElementConverter):
             base_converter: 基础转换器实例
         """
         super().__init__(base_converter)
-        self.debug = False
-        if base_converter:
-            self.debug = base_converter.debug
 
     def convert(self, token: Any) -> Any:
         """转换HTML标签为DOCX元素
@@ -48,7 +48,7 @@ class HtmlConverter(ElementConverter):
             raise ValueError("Document not set for HtmlConverter")
 
         if self.debug:
-            print(f"处理HTML标签: {token.content if hasattr(token, 'content') else ''}")
+            logger.debug("处理HTML标签: %s", getattr(token, "content", ""))
 
         # 获取HTML内容
         html_content = ""
@@ -61,21 +61,21 @@ class HtmlConverter(ElementConverter):
 
         if not html_content:
             if self.debug:
-                print("HTML内容为空")
+                logger.debug("HTML内容为空")
             return None
 
         # 首先尝试使用自定义解析方法
         result = self._custom_html_convert(html_content)
         if result:
             if self.debug:
-                print("使用自定义HTML解析成功")
+                logger.debug("使用自定义HTML解析成功")
             return result
 
         # 如果自定义解析失败，尝试使用html2docx
         if HTML2DOCX_AVAILABLE:
             try:
                 if self.debug:
-                    print("尝试使用html2docx转换")
+                    logger.debug("尝试使用html2docx转换")
 
                 # 创建完整的HTML文档
                 full_html = f"""
@@ -105,8 +105,8 @@ class HtmlConverter(ElementConverter):
                     temp_html_path = f.name
 
                 if self.debug:
-                    print(f"创建临时HTML文件: {temp_html_path}")
-                    print(f"HTML内容: {full_html[:100]}...")
+                    logger.debug("创建临时HTML文件: %s", temp_html_path)
+                    logger.debug("HTML内容: %s...", full_html[:100])
 
                 # 创建临时DOCX文件路径
                 temp_docx_path = temp_html_path.replace(".html", ".docx")
@@ -115,26 +115,26 @@ class HtmlConverter(ElementConverter):
                 html2docx.convert(temp_html_path, temp_docx_path)
 
                 if self.debug:
-                    print(f"转换完成，临时DOCX文件: {temp_docx_path}")
+                    logger.debug("转换完成，临时DOCX文件: %s", temp_docx_path)
                     if os.path.exists(temp_docx_path):
-                        print(
-                            f"临时DOCX文件大小: {os.path.getsize(temp_docx_path)} 字节"
+                        logger.debug(
+                            "临时DOCX文件大小: %s 字节", os.path.getsize(temp_docx_path)
                         )
                     else:
-                        print("临时DOCX文件不存在")
+                        logger.debug("临时DOCX文件不存在")
 
                 # 打开生成的DOCX文件
                 temp_doc = Document(temp_docx_path)
 
                 if self.debug:
-                    print(f"临时文档包含 {len(temp_doc.paragraphs)} 个段落")
+                    logger.debug("临时文档包含 %s 个段落", len(temp_doc.paragraphs))
 
                 # 将临时文档的内容复制到当前文档
                 for paragraph in temp_doc.paragraphs:
                     if not paragraph.text.strip():
                         continue  # 跳过空段落
 
-                    p = self.document.add_paragraph()
+                    p = self.cursor.add_paragraph()
                     for run in paragraph.runs:
                         r = p.add_run(run.text)
                         r.bold = run.bold
@@ -145,12 +145,14 @@ class HtmlConverter(ElementConverter):
                 # 复制表格
                 for table in temp_doc.tables:
                     if self.debug:
-                        print(f"复制表格: {len(table.rows)}行 x {len(table.columns)}列")
+                        logger.debug(
+                            "复制表格: %s行 x %s列", len(table.rows), len(table.columns)
+                        )
 
-                    new_table = self.document.add_table(
-                        rows=len(table.rows), cols=len(table.columns)
+                    new_table = self.cursor.add_table(
+                        len(table.rows), len(table.columns)
                     )
-                    new_table.style = "Table Grid"
+                    self.style_registry.apply_table_style(new_table, "Table Grid")
 
                     # 复制单元格内容
                     for i, row in enumerate(table.rows):
@@ -165,30 +167,30 @@ class HtmlConverter(ElementConverter):
                     os.remove(temp_html_path)
                     os.remove(temp_docx_path)
                     if self.debug:
-                        print("临时文件已清理")
+                        logger.debug("临时文件已清理")
                 except Exception as e:
                     if self.debug:
-                        print(f"清理临时文件失败: {e}")
+                        logger.debug("清理临时文件失败: %s", e)
 
                 if self.debug:
-                    print(
-                        f"HTML转换完成，添加了{len(temp_doc.paragraphs)}个段落和{len(temp_doc.tables)}个表格"
+                    logger.debug(
+                        "HTML转换完成，添加了%s个段落和%s个表格",
+                        len(temp_doc.paragraphs),
+                        len(temp_doc.tables),
                     )
 
                 # 返回最后一个添加的段落
-                return (
-                    self.document.paragraphs[-1] if self.document.paragraphs else None
-                )
+                return self.cursor.last_paragraph()
 
             except Exception as e:
                 if self.debug:
-                    print(f"HTML转换失败: {e}")
+                    logger.debug("HTML转换失败: %s", e)
                 # 失败时回退到基本转换
                 return self._fallback_convert(html_content)
         else:
             # html2docx不可用时回退到基本转换
             if self.debug:
-                print("html2docx不可用，使用基本转换")
+                logger.debug("html2docx不可用，使用基本转换")
             return self._fallback_convert(html_content)
 
     def _custom_html_convert(self, html_content: str) -> Optional[Paragraph]:
@@ -202,7 +204,7 @@ class HtmlConverter(ElementConverter):
         """
         try:
             if self.debug:
-                print("使用自定义HTML解析")
+                logger.debug("使用自定义HTML解析")
 
             # 简单的HTML标签解析
             # 处理简单的HTML段落
@@ -210,13 +212,13 @@ class HtmlConverter(ElementConverter):
                 content = re.sub(
                     r"^\s*<p>(.*?)</p>\s*$", r"\1", html_content, flags=re.DOTALL
                 )
-                paragraph = self.document.add_paragraph()
+                paragraph = self.cursor.add_paragraph()
 
                 # 处理内部标签
                 content = self._process_inline_tags(content, paragraph)
 
                 if self.debug:
-                    print(f"解析段落: {content}")
+                    logger.debug("解析段落: %s", content)
 
                 return paragraph
 
@@ -228,13 +230,13 @@ class HtmlConverter(ElementConverter):
                     html_content,
                     flags=re.DOTALL,
                 )
-                paragraph = self.document.add_paragraph()
+                paragraph = self.cursor.add_paragraph()
 
                 # 处理内部标签
                 content = self._process_inline_tags(content, paragraph)
 
                 if self.debug:
-                    print(f"解析div: {content}")
+                    logger.debug("解析div: %s", content)
 
                 return paragraph
 
@@ -246,15 +248,13 @@ class HtmlConverter(ElementConverter):
                 list_items = re.findall(r"<li[^>]*>(.*?)</li>", list_content, re.DOTALL)
 
                 if self.debug:
-                    print(f"解析无序列表: {len(list_items)}项")
+                    logger.debug("解析无序列表: %s项", len(list_items))
 
                 for item in list_items:
-                    paragraph = self.document.add_paragraph(style="List Bullet")
+                    paragraph = self._add_paragraph("List Bullet")
                     self._process_inline_tags(item, paragraph)
 
-                return (
-                    self.document.paragraphs[-1] if self.document.paragraphs else None
-                )
+                return self.cursor.last_paragraph()
 
             # 处理简单的有序列表
             if re.match(r"^\s*<ol[^>]*>(.*?)</ol>\s*$", html_content, re.DOTALL):
@@ -264,15 +264,13 @@ class HtmlConverter(ElementConverter):
                 list_items = re.findall(r"<li[^>]*>(.*?)</li>", list_content, re.DOTALL)
 
                 if self.debug:
-                    print(f"解析有序列表: {len(list_items)}项")
+                    logger.debug("解析有序列表: %s项", len(list_items))
 
                 for item in list_items:
-                    paragraph = self.document.add_paragraph(style="List Number")
+                    paragraph = self._add_paragraph("List Number")
                     self._process_inline_tags(item, paragraph)
 
-                return (
-                    self.document.paragraphs[-1] if self.document.paragraphs else None
-                )
+                return self.cursor.last_paragraph()
 
             # 处理简单的表格
             if re.match(r"^\s*<table[^>]*>(.*?)</table>\s*$", html_content, re.DOTALL):
@@ -290,7 +288,7 @@ class HtmlConverter(ElementConverter):
                     return None
 
                 if self.debug:
-                    print(f"解析表格: {len(rows)}行")
+                    logger.debug("解析表格: %s行", len(rows))
 
                 # 计算列数
                 first_row = rows[0]
@@ -302,8 +300,8 @@ class HtmlConverter(ElementConverter):
                     return None
 
                 # 创建表格
-                table = self.document.add_table(rows=len(rows), cols=cols)
-                table.style = "Table Grid"
+                table = self.cursor.add_table(len(rows), cols)
+                self.style_registry.apply_table_style(table, "Table Grid")
 
                 # 填充表格内容
                 for i, row_html in enumerate(rows):
@@ -323,15 +321,34 @@ class HtmlConverter(ElementConverter):
                             table.cell(i, j).text = clean_content.strip()
 
                 # 添加一个空段落，以便返回
-                return self.document.add_paragraph()
+                return self.cursor.add_paragraph()
 
             # 无法解析，返回None
             return None
         except Exception as e:
             if self.debug:
-                print(f"错误: 自定义HTML解析失败: {e}")
+                logger.debug("错误: 自定义HTML解析失败: %s", e)
             return None
 
+    def _add_paragraph(self, style_name: str) -> Paragraph:
+        """在正文末尾添加指定样式的段落
+
+        样式 ID 从样式注册表中取得，段落通过正文游标追加，开启快速输出时
+        直接追加 XML 元素。
+
+        Args:
+            style_name: 段落样式名称
+
+        Returns:
+            Paragraph: 新段落
+        """
+        writer = self.writer
+        if writer is not None:
+            return writer.add_paragraph(self.style_registry.style_id(style_name))
+        paragraph = self.cursor.add_paragraph()
+        self.style_registry.apply_paragraph_style(paragraph, style_name)
+        return paragraph
+
     def _process_inline_tags(self, content: str, paragraph: Paragraph) -> str:
         """处理内联HTML标签
 
@@ -422,7 +439,7 @@ class HtmlConverter(ElementConverter):
                             run.font.strike = True
                         except Exception as e:
                             if self.debug:
-                                print(f"无法设置删除线(方法1): {e}")
+                                logger.debug("无法设置删除线(方法1): %s", e)
                             try:
                                 # 方法2：使用XML元素
                                 run._element.get_or_add_rPr().set(
@@ -430,12 +447,12 @@ class HtmlConverter(ElementConverter):
                                 )
                             except Exception as e:
                                 if self.debug:
-                                    print(f"无法设置删除线(方法2): {e}")
+                                    logger.debug("无法设置删除线(方法2): %s", e)
 
             return content
         except Exception as e:
             if self.debug:
-                print(f"错误: 处理内联标签失败: {e}")
+                logger.debug("错误: 处理内联标签失败: %s", e)
             # 简单处理，直接添加纯文本
             clean_text = re.sub(r"<[^>]*>", " ", content)
             paragraph.add_run(clean_text.strip())
@@ -451,10 +468,10 @@ class HtmlConverter(ElementConverter):
             Paragraph: 创建的段落
         """
         if self.debug:
-            print("使用基本HTML转换")
+            logger.debug("使用基本HTML转换")
 
         # 创建新段落
-        paragraph = self.document.add_paragraph()
+        paragraph = self.cursor.add_paragraph()
 
         # 简单处理一些基本HTML标签
         # 这里只是一个非常基础的实现，无法处理复杂的HTML
@@ -2,26 +2,150 @@
 图片转换器模块
 """
 
+import logging
 import os
 import re
 from io import BytesIO
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Pt
 
+from ..image_store import ImageEntry, get_image_store
+from ..memory_cache import DEFAULT_MEMORY_MAX_BYTES, ImageData, ImageMemoryCache
+from ..optimize import ImageOptimizer, Optimized
+from ..prefetch import REMOTE_PREFIXES, ImagePrefetcher, remote_image_sources
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
+# 图片的显示尺寸 (宽, 高)，单位为磅，未指定的一边按比例确定
+DisplaySize = Tuple[Optional[float], Optional[float]]
+
 
 class ImageConverter(ElementConverter):
     """图片转换器，处理各种类型的图片"""
 
-    def __init__(self, base_converter=None) -> None:
+    # 段落内图片未指定尺寸时的显示宽度（磅）
+    INLINE_WIDTH = 100
+
+    def __init__(
+        self, base_converter=None, cache_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES
+    ) -> None:
+        """初始化图片转换器
+
+        Args:
+            base_converter: 基础转换器实例
+            cache_max_bytes: 图片内存缓存的大小上限（字节）
+        """
         super().__init__(base_converter)
         self.document = None
-        # 图片缓存，避免重复下载
-        self._image_cache = {}
+        # 图片缓存，避免重复下载，超过大小上限时淘汰最久未用的图片
+        self._image_cache = ImageMemoryCache(cache_max_bytes)
+        # 当前文档预取的图片数据，生成时取出并放入图片缓存
+        self._prefetched: Dict[str, ImageData] = {}
+        # 复用转换器处理新文档时是否保留图片缓存
+        self.keep_cache = True
+        # 当前文档下载在线图片和读取本地图片的字节数
+        self.bytes_fetched = 0
+        self.bytes_read = 0
+        # 当前文档从磁盘缓存取得（服务器确认未修改）的在线图片数量
+        self.images_cached = 0
+        # 预取时下载失败的在线图片，生成阶段不再重试
+        self._unavailable = set()
+        # 当前文档使用的图片优化器，为 None 时原样嵌入图片
+        self._optimizer: Optional[ImageOptimizer] = None
+        # 生成之前优化好的图片，键为 (图片地址, 显示尺寸)
+        self._optimized: Dict[Tuple[str, DisplaySize], Optimized] = {}
+        # 当前文档缩小或重新压缩的图片数量和节省的字节数
+        self.images_optimized = 0
+        self.bytes_saved = 0
+
+    def reset(self) -> None:
+        """按缓存策略清除上一个文档的图片缓存，并清零字节计数"""
+        super().reset()
+        if not self.keep_cache:
+            self._image_cache.clear()
+        self._image_cache.reset_counters()
+        self._prefetched.clear()
+        self._unavailable.clear()
+        self._optimizer = None
+        self._optimized.clear()
+        self.images_optimized = 0
+        self.bytes_saved = 0
+        self.bytes_fetched = 0
+        self.bytes_read = 0
+        self.images_cached = 0
+
+    @property
+    def memory_cache(self) -> ImageMemoryCache:
+        """图片内存缓存"""
+        return self._image_cache
+
+    def prefetch(self, tokens: List[Any], prefetcher: ImagePrefetcher) -> int:
+        """并发下载 token 流中尚未缓存的在线图片
+
+        在生成之前调用，生成阶段直接使用下载好的图片数据。
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+            prefetcher: 在线图片预取器
+
+        Returns:
+            int: 取得数据的图片数量（包括来自磁盘缓存的）
+        """
+        urls = [
+            src
+            for src in remote_image_sources(tokens)
+            if src not in self._image_cache and src not in self._prefetched
+        ]
+        if not urls:
+            return 0
+        if self.debug:
+            logger.debug("预取在线图片: %s 张", len(urls))
+        fetched = 0
+        for src, result in prefetcher.fetch(urls).items():
+            if result is None:
+                self._unavailable.add(src)
+                continue
+            if result.cached:
+                self.images_cached += 1
+            else:
+                self.bytes_fetched += len(result.data)
+            self._prefetched[src] = result.data
+            fetched += 1
+        return fetched
+
+    def optimize(self, tokens: List[Any], optimizer: ImageOptimizer) -> int:
+        """用优化器的线程池并行优化 token 流中的图片
+
+        在预取之后、生成之前调用，当前文档生成时还会用同一个优化器处理
+        没有在这里优化的图片。
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+            optimizer: 图片优化器
+
+        Returns:
+            int: 优化的图片数量（包括没有变小、原样使用的）
+        """
+        self._optimizer = optimizer
+
+        def jobs():
+            seen = set()
+            for key in self._image_requests(tokens):
+                if key in seen:
+                    continue
+                seen.add(key)
+                src, (width, height) = key
+                image_data = self._load_image(src)
+                if image_data is not None:
+                    yield key, image_data, width, height
+
+        results = optimizer.optimize_many(jobs())
+        self._optimized.update(results)
+        return len(results)
 
     def convert(self, tokens: Tuple[Any, Any]) -> Optional[Any]:
         """转换图片元素
@@ -50,18 +174,14 @@ class ImageConverter(ElementConverter):
             alt = content_token.content
 
         # 调试信息
-        debug = (
-            self.base_converter.debug
-            if hasattr(self.base_converter, "debug")
-            else False
-        )
-        if debug:
-            print(f"处理图片: src={src}, alt={alt}, title={title}")
-
-        # 解析尺寸信息（如果有）
-        width, height = self._parse_size(alt)
-        if width and height and debug:
-            print(f"图片尺寸: {width}x{height}")
+        if self.debug:
+            logger.debug("处理图片: src=%s, alt=%s, title=%s", src, alt, title)
+
+        # 解析尺寸信息（如果有），未指定时使用原始尺寸
+        size = self._display_size(alt, inline=False)
+        width, height = size
+        if width and height and self.debug:
+            logger.debug("图片尺寸: %sx%s", width, height)
 
         # 创建段落并设置居中对齐
         paragraph = self.document.add_paragraph()
@@ -69,22 +189,23 @@ class ImageConverter(ElementConverter):
 
         # 添加图片
         try:
-            # 获取图片数据
-            image_data = self._get_image_data(src)
-            if not image_data:
-                if debug:
-                    print(f"无法获取图片数据: {src}")
+            # 获取图片
+            entry = self._get_image_entry(src, size)
+            if entry is None:
+                if self.debug:
+                    logger.debug("无法获取图片数据: %s", src)
                 return paragraph
 
             # 添加图片到文档
+            store = get_image_store(self.document)
             if width and height:
                 # 使用指定尺寸
                 run = paragraph.add_run()
-                run.add_picture(image_data, width=Pt(width), height=Pt(height))
+                store.add_picture(run, entry, width=Pt(width), height=Pt(height))
             else:
                 # 使用默认尺寸
                 run = paragraph.add_run()
-                run.add_picture(image_data)
+                store.add_picture(run, entry)
 
             # 添加图片标题（如果有）
             if title:
@@ -94,13 +215,13 @@ class ImageConverter(ElementConverter):
                 caption_run.italic = True
                 caption_run.font.size = Pt(10)
 
-            if debug:
-                print(f"图片添加成功: {src}")
+            if self.debug:
+                logger.debug("图片添加成功: %s", src)
             return paragraph
 
         except Exception as e:
-            if debug:
-                print(f"添加图片失败: {str(e)}")
+            if self.debug:
+                logger.debug("添加图片失败: %s", e)
             return paragraph
 
     def convert_in_paragraph(self, paragraph, token, style=None) -> None:
@@ -111,16 +232,11 @@ class ImageConverter(ElementConverter):
             token: 图片标记
             style: 样式信息
         """
-        debug = (
-            self.base_converter.debug
-            if hasattr(self.base_converter, "debug")
-            else False
-        )
 
         # 获取图片信息
         if not hasattr(token, "attrs") or not token.attrs:
-            if debug:
-                print("警告: 图片标记没有属性")
+            if self.debug:
+                logger.debug("警告: 图片标记没有属性")
             return
 
         # 获取图片URL和标题
@@ -131,38 +247,98 @@ class ImageConverter(ElementConverter):
         if hasattr(token, "content"):
             alt = token.content
 
-        if debug:
-            print(f"处理段落内图片: src={src}, alt={alt}")
+        if self.debug:
+            logger.debug("处理段落内图片: src=%s, alt=%s", src, alt)
 
-        # 解析尺寸信息（如果有）
-        width, height = self._parse_size(alt)
-        if width and height and debug:
-            print(f"图片尺寸: {width}x{height}")
+        # 解析尺寸信息（如果有），未指定时使用较小的默认宽度，适合内联
+        size = self._display_size(alt, inline=True)
+        width, height = size
+        if width and height and self.debug:
+            logger.debug("图片尺寸: %sx%s", width, height)
 
         # 添加图片
         try:
-            # 获取图片数据
-            image_data = self._get_image_data(src)
-            if not image_data:
-                if debug:
-                    print(f"无法获取图片数据: {src}")
+            # 获取图片
+            entry = self._get_image_entry(src, size)
+            if entry is None:
+                if self.debug:
+                    logger.debug("无法获取图片数据: %s", src)
                 return
 
             # 添加图片到段落
+            store = get_image_store(self.document)
             run = paragraph.add_run()
-            if width and height:
-                # 使用指定尺寸
-                run.add_picture(image_data, width=Pt(width), height=Pt(height))
-            else:
-                # 使用默认尺寸（较小，适合内联）
-                run.add_picture(image_data, width=Pt(100))
+            store.add_picture(
+                run, entry, width=Pt(width), height=Pt(height) if height else None
+            )
 
-            if debug:
-                print(f"段落内图片添加成功: {src}")
+            if self.debug:
+                logger.debug("段落内图片添加成功: %s", src)
 
         except Exception as e:
-            if debug:
-                print(f"添加段落内图片失败: {str(e)}")
+            if self.debug:
+                logger.debug("添加段落内图片失败: %s", e)
+
+    def _get_image_entry(
+        self, src: str, size: DisplaySize = (None, None)
+    ) -> Optional[ImageEntry]:
+        """获取已加入当前文档的图片，首次出现时读取图片数据并加入
+
+        同一来源或内容相同的图片在文档中只保存一份。优化图片时按显示尺寸
+        分别保存，同一张图片以不同尺寸出现时各自缩小。
+
+        Args:
+            src: 图片路径或URL
+            size: 显示尺寸 (宽, 高)，单位为磅
+
+        Returns:
+            Optional[ImageEntry]: 图片信息，无法获取图片数据时返回 None
+
+        Raises:
+            UnrecognizedImageError: 无法识别的图片格式
+        """
+        store = get_image_store(self.document)
+        source = src
+        if self._optimizer is not None:
+            source = "%s|%sx%s" % (src, *size)
+        entry = store.get(source)
+        if entry is None:
+            if self._optimizer is None:
+                image_data = self._get_image_data(src)
+            else:
+                image_data = self._get_optimized_data(src, size)
+            if not image_data:
+                return None
+            duplicates = store.duplicates
+            entry = store.add(image_data, source)
+            if self.debug and store.duplicates > duplicates:
+                logger.debug("图片内容与已有图片相同，共用图片部件: %s", src)
+        elif self.debug:
+            logger.debug("图片已加入文档，直接复用: %s", src)
+        return entry
+
+    def _get_optimized_data(self, src: str, size: DisplaySize) -> Optional[BytesIO]:
+        """获取按显示尺寸优化后的图片数据
+
+        Args:
+            src: 图片路径或URL
+            size: 显示尺寸 (宽, 高)，单位为磅
+
+        Returns:
+            BytesIO: 图片数据流
+        """
+        result = self._optimized.pop((src, size), None)
+        if result is None:
+            image_data = self._load_image(src)
+            if image_data is None:
+                return None
+            result = self._optimizer.optimize(image_data, *size)
+        if result.saved:
+            self.images_optimized += 1
+            self.bytes_saved += result.saved
+            if self.debug:
+                logger.debug("图片优化节省 %s 字节: %s", result.saved, src)
+        return BytesIO(result.data)
 
     def _get_image_data(self, src: str) -> Optional[BytesIO]:
         """获取图片数据
@@ -173,48 +349,112 @@ class ImageConverter(ElementConverter):
         Returns:
             BytesIO: 图片数据流
         """
+        image_data = self._load_image(src)
+        if image_data is None:
+            return None
+        return BytesIO(image_data)
+
+    def _load_image(self, src: str) -> Optional[ImageData]:
+        """读取图片数据，依次使用预取结果、图片缓存、网络或本地文件
+
+        Args:
+            src: 图片路径或URL
+
+        Returns:
+            Optional[ImageData]: 图片数据，无法获取时返回 None
+        """
+        # 预取的数据只使用一次，之后由图片缓存保存
+        image_data = self._prefetched.pop(src, None)
+        if image_data is not None:
+            self._image_cache.put(src, image_data)
+            return image_data
+
         # 检查缓存
-        if src in self._image_cache:
-            return BytesIO(self._image_cache[src])
+        image_data = self._image_cache.get(src)
+        if image_data is not None:
+            return image_data
 
         try:
             # 处理在线图片
-            if src.startswith(("http://", "https://")):
+            if src.startswith(REMOTE_PREFIXES):
+                if src in self._unavailable:
+                    return None
                 response = requests.get(src, timeout=10)
                 if response.status_code == 200:
                     image_data = response.content
+                    self.bytes_fetched += len(image_data)
                     # 缓存图片数据
-                    self._image_cache[src] = image_data
-                    return BytesIO(image_data)
+                    self._image_cache.put(src, image_data)
+                    return image_data
             # 处理本地图片
             else:
                 # 尝试从当前目录加载
                 if os.path.exists(src):
                     with open(src, "rb") as f:
                         image_data = f.read()
+                        self.bytes_read += len(image_data)
                         # 缓存图片数据
-                        self._image_cache[src] = image_data
-                        return BytesIO(image_data)
+                        self._image_cache.put(src, image_data)
+                        return image_data
 
                 # 尝试从测试目录加载
                 test_path = os.path.join("tests", "samples", "basic", src)
                 if os.path.exists(test_path):
                     with open(test_path, "rb") as f:
                         image_data = f.read()
+                        self.bytes_read += len(image_data)
                         # 缓存图片数据
-                        self._image_cache[src] = image_data
-                        return BytesIO(image_data)
+                        self._image_cache.put(src, image_data)
+                        return image_data
         except Exception as e:
-            debug = (
-                self.base_converter.debug
-                if hasattr(self.base_converter, "debug")
-                else False
-            )
-            if debug:
-                print(f"获取图片数据失败: {str(e)}")
+            if self.debug:
+                logger.debug("获取图片数据失败: %s", e)
 
         return None
 
+    def _display_size(self, alt: str, inline: bool) -> DisplaySize:
+        """图片在文档中的显示尺寸
+
+        生成图片和生成之前优化图片都由此确定尺寸，两者使用相同的键。
+
+        Args:
+            alt: 图片alt文本
+            inline: 是否为段落内图片
+
+        Returns:
+            DisplaySize: 指定的尺寸；未指定时段落内图片使用默认宽度并按比例
+            确定高度，独立图片为 (None, None)，即原始尺寸
+        """
+        width, height = self._parse_size(alt)
+        if width and height:
+            return width, height
+        if inline:
+            return self.INLINE_WIDTH, None
+        return None, None
+
+    def _image_requests(self, tokens: List[Any]) -> Iterator[Tuple[str, DisplaySize]]:
+        """按出现顺序遍历 token 流中的图片地址及其显示尺寸（可能重复）
+
+        顶层图片 token 由 convert 生成，行内子 token 由 convert_in_paragraph
+        生成，尺寸分别按两者的规则确定。
+
+        Args:
+            tokens: markdown-it 解析得到的 token 列表
+
+        Yields:
+            Tuple[str, DisplaySize]: (图片地址, 显示尺寸)
+        """
+        for token in tokens:
+            if token.type == "image" and token.attrs:
+                yield token.attrs.get("src", ""), self._display_size(
+                    token.content, inline=False
+                )
+            for child in token.children or ():
+                if child.type == "image" and child.attrs:
+                    yield child.attrs.get("src", ""), self._display_size(
+                        child.content, inline=True
+                    )
+
     def _parse_size(self, alt: str) -> Tuple[Optional[int], Optional[int]]:
         """从alt文本中解析图片尺寸
 
@@ -226,11 +466,6 @@ class ImageConverter(ElementConverter):
         Returns:
             Tuple[Optional[int], Optional[int]]: (宽度, 高度)
         """
-        debug = (
-            self.base_converter.debug
-            if hasattr(self.base_converter, "debug")
-            else False
-        )
 
         if not alt:
             return None, None
@@ -247,8 +482,8 @@ class ImageConverter(ElementConverter):
             if match:
                 width = int(match.group(1))
                 height = int(match.group(2))
-                if debug:
-                    print(f"解析到图片尺寸: {width}x{height}")
+                if self.debug:
+                    logger.debug("解析到图片尺寸: %sx%s", width, height)
                 return width, height
 
         return None, None
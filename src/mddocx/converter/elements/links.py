@@ -2,13 +2,18 @@
 链接转换器模块
 """
 
+import logging
+
 from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import RGBColor
 
+from ..inline import BOLD, ITALIC, LINK, STRIKE, format_run
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
 
 class LinkConverter(ElementConverter):
     """链接转换器，处理各种类型的链接"""
@@ -26,11 +31,16 @@ class LinkConverter(ElementConverter):
 
     def _ensure_hyperlink_style(self):
         """确保Hyperlink样式存在"""
-        if "Hyperlink" not in self.document.styles:
-            style = self.document.styles.add_style("Hyperlink", WD_STYLE_TYPE.CHARACTER)
-            font = style.font
-            font.color.rgb = RGBColor(0, 0, 255)  # 蓝色
-            font.underline = True
+        self.style_registry.ensure(
+            "Hyperlink", WD_STYLE_TYPE.CHARACTER, self._configure_hyperlink_style
+        )
+
+    @staticmethod
+    def _configure_hyperlink_style(style):
+        """设置新建的Hyperlink样式"""
+        font = style.font
+        font.color.rgb = RGBColor(0, 0, 255)  # 蓝色
+        font.underline = True
 
     def convert(self, token_pair):
         """转换链接
@@ -60,10 +70,9 @@ class LinkConverter(ElementConverter):
             text = "(空链接)"
 
         # 获取当前段落或创建新段落
-        if self.document.paragraphs:
-            paragraph = self.document.paragraphs[-1]
-        else:
-            paragraph = self.document.add_paragraph()
+        paragraph = self.cursor.last_paragraph()
+        if paragraph is None:
+            paragraph = self.cursor.add_paragraph()
 
         # 创建超链接
         self._add_hyperlink(paragraph, text, url)
@@ -77,26 +86,23 @@ class LinkConverter(ElementConverter):
             style: 样式信息
             link_text: 链接文本，如果提供则使用此文本
         """
-        debug = (
-            self.base_converter.debug
-            if hasattr(self.base_converter, "debug")
-            else False
-        )
-        if debug:
-            print(
-                f"转换链接: token={token.type}, content={token.content if hasattr(token, 'content') else ''}"
+        if self.debug:
+            logger.debug(
+                "转换链接: token=%s, content=%s",
+                token.type,
+                getattr(token, "content", ""),
             )
-            print(f"链接样式: {style}")
+            logger.debug("链接样式: %s", style)
 
         if not hasattr(token, "attrs") or not token.attrs:
-            if debug:
-                print("警告: 链接标记没有属性")
+            if self.debug:
+                logger.debug("警告: 链接标记没有属性")
             return
 
         # 获取链接URL
         url = token.attrs.get("href", "")
-        if debug:
-            print(f"链接URL: {url}")
+        if self.debug:
+            logger.debug("链接URL: %s", url)
 
         # 获取链接文本
         text = link_text or ""
@@ -107,14 +113,14 @@ class LinkConverter(ElementConverter):
                 if child.type == "text":
                     text += child.content
 
-        if debug:
-            print(f"链接文本: {text}")
+        if self.debug:
+            logger.debug("链接文本: %s", text)
 
         # 如果没有文本，使用URL作为文本
         if not text:
             text = url
-            if debug:
-                print(f"使用URL作为链接文本: {text}")
+            if self.debug:
+                logger.debug("使用URL作为链接文本: %s", text)
 
         # 添加带样式的超链接
         self._add_hyperlink_with_style(paragraph, text, url, style or {})
@@ -134,19 +140,14 @@ class LinkConverter(ElementConverter):
         self._ensure_hyperlink_style()
 
         # 应用超链接样式
-        run.style = "Hyperlink"
+        self.style_registry.apply_run_style(run, "Hyperlink")
 
         # 如果URL为空，不创建实际的超链接
         if not url:
             return
 
-        # 创建关系ID
-        part = self.document.part
-        r_id = part.relate_to(
-            url,
-            "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink",
-            is_external=True,
-        )
+        # 创建关系ID（相同地址复用已有关系）
+        r_id = self.relationship_index.external(url)
 
         # 获取XML元素
         r_element = run._element
@@ -179,53 +180,43 @@ class LinkConverter(ElementConverter):
             url: 链接地址
             style: 样式信息，包含bold、italic、strike
         """
-        debug = (
-            self.base_converter.debug
-            if hasattr(self.base_converter, "debug")
-            else False
-        )
         # 调试信息
-        if debug:
-            print(f"添加带样式的超链接: text='{text}', url='{url}', style={style}")
+        if self.debug:
+            logger.debug(
+                "添加带样式的超链接: text='%s', url='%s', style=%s", text, url, style
+            )
 
         # 创建超链接
         run = paragraph.add_run(text)
-        if debug:
-            print(f"创建的run文本: '{run.text}'")
+        if self.debug:
+            logger.debug("创建的run文本: '%s'", run.text)
 
-        # 应用样式
+        # 应用样式（复制格式位对应的 rPr 模板）
+        mask = LINK
         if style.get("bold"):
-            run.bold = True
-            if debug:
-                print("应用粗体样式")
+            mask |= BOLD
         if style.get("italic"):
-            run.italic = True
-            if debug:
-                print("应用斜体样式")
+            mask |= ITALIC
         if style.get("strike"):
-            run.font.strike = True
-            if debug:
-                print("应用删除线样式")
+            mask |= STRIKE
+        format_run(run, mask)
+        if self.debug:
+            logger.debug("应用格式位: %#x", mask)
 
         # 确保Hyperlink样式存在
         self._ensure_hyperlink_style()
 
         # 应用超链接样式
-        run.style = "Hyperlink"
+        self.style_registry.apply_run_style(run, "Hyperlink")
 
         # 如果URL为空，不创建实际的超链接
         if not url:
-            if debug:
-                print("URL为空，不创建实际的超链接")
+            if self.debug:
+                logger.debug("URL为空，不创建实际的超链接")
             return
 
-        # 创建关系ID
-        part = self.document.part
-        r_id = part.relate_to(
-            url,
-            "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink",
-            is_external=True,
-        )
+        # 创建关系ID（相同地址复用已有关系）
+        r_id = self.relationship_index.external(url)
 
         # 获取XML元素
         r_element = run._element
@@ -249,5 +240,5 @@ class LinkConverter(ElementConverter):
         # 将超链接插入到原来运行元素的位置
         parent.insert(index, hyperlink)
 
-        if debug:
-            print("超链接创建成功")
+        if self.debug:
+            logger.debug("超链接创建成功")
@@ -2,16 +2,19 @@
 列表转换器模块，处理有序列表和无序列表的转换
 """
 
+import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.shared import OxmlElement, qn
+from docx.oxml.shared import qn
 from docx.shared import Inches, Pt
 from docx.text.paragraph import Paragraph
 
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
 
 class ListConverter(ElementConverter):
     """处理列表的转换器"""
@@ -27,6 +30,14 @@ class ListConverter(ElementConverter):
         # 上一个处理的标记类型
         self._last_token_type: Optional[str] = None
 
+    def reset(self) -> None:
+        """清除上一个文档的列表状态和编号"""
+        super().reset()
+        self._current_lists = []
+        self._numbering_cache = {}
+        self._current_numbers = {}
+        self._last_token_type = None
+
     def convert(self, tokens: Tuple[Any, Any]) -> Paragraph:
         """转换列表元素
 
@@ -42,16 +53,11 @@ class ListConverter(ElementConverter):
         list_token, content_token = tokens
 
         # 调试信息
-        debug = (
-            hasattr(self, "base_converter")
-            and self.base_converter
-            and hasattr(self.base_converter, "debug")
-            and self.base_converter.debug
-        )
-        if debug:
-            print(
-                f"ListConverter: 处理列表项, token.type={list_token.type}, "
-                f"content={content_token.content if hasattr(content_token, 'content') else 'N/A'}"
+        if self.debug:
+            logger.debug(
+                "ListConverter: 处理列表项, token.type=%s, content=%s",
+                list_token.type,
+                content_token.content if hasattr(content_token, "content") else "N/A",
             )
 
         # 获取列表层级和类型
@@ -75,9 +81,12 @@ class ListConverter(ElementConverter):
 
         # 创建或获取列表样式
         style_name = self._get_style_name(level, is_ordered)
-        if debug:
-            print(
-                f"ListConverter: 使用样式 {style_name} (level={level}, is_ordered={is_ordered})"
+        if self.debug:
+            logger.debug(
+                "ListConverter: 使用样式 %s (level=%s, is_ordered=%s)",
+                style_name,
+                level,
+                is_ordered,
             )
         numbering_id = self._ensure_list_style(
             style_name, level, is_ordered, need_new_numbering
@@ -87,8 +96,12 @@ class ListConverter(ElementConverter):
         self._update_list_state(level, is_ordered, numbering_id)
 
         # 创建新段落
-        paragraph = self.document.add_paragraph()
-        paragraph.style = self.document.styles[style_name]
+        writer = self.writer
+        if writer is not None:
+            paragraph = writer.add_paragraph(self.style_registry.style_id(style_name))
+        else:
+            paragraph = self.document.add_paragraph()
+            self.style_registry.apply_paragraph_style(paragraph, style_name)
 
         # 手动设置段落格式以确保缩进生效
         indent_inches = 0.25 * (level - 1)  # 每级缩进0.25英寸
@@ -112,11 +125,11 @@ class ListConverter(ElementConverter):
                 num_pr = paragraph._element.get_or_add_pPr().get_or_add_numPr()
                 num_pr.get_or_add_numId().val = numbering_id
                 num_pr.get_or_add_ilvl().val = level - 1
-                if debug:
-                    print(f"设置编号: numId={numbering_id}, ilvl={level - 1}")
+                if self.debug:
+                    logger.debug("设置编号: numId=%s, ilvl=%s", numbering_id, level - 1)
             except Exception as e:
-                if debug:
-                    print(f"设置编号失败: {e}")
+                if self.debug:
+                    logger.debug("设置编号失败: %s", e)
         # 无序列表使用 bullet 样式，无需额外设置
 
         # 手动设置段落格式以确保缩进生效
@@ -124,10 +137,6 @@ class ListConverter(ElementConverter):
         paragraph.paragraph_format.left_indent = Inches(indent_inches)
         paragraph.paragraph_format.first_line_indent = Inches(-0.25)  # 悬挂缩进0.25英寸
 
-        # 处理列表项内的文本和样式
-        current_text = ""
-        current_style = {"bold": False, "italic": False, "strike": False}
-
         # 处理空列表项
         if (
             not content_token
@@ -145,11 +154,11 @@ class ListConverter(ElementConverter):
                     return paragraph
                 else:
                     # 普通列表项，添加内容
-                    paragraph.add_run(content)
+                    self._add_run(paragraph, content)
                     return paragraph
             else:
                 # 真正的空列表项
-                paragraph.add_run("")
+                self._add_run(paragraph, "")
                 return paragraph
 
         # 检查是否为任务列表项（通过内容字符串判断）
@@ -160,50 +169,8 @@ class ListConverter(ElementConverter):
                 # 只返回一个空段落，让任务列表转换器处理内容
                 return paragraph
 
-        # 处理列表项内的子元素
-        for child in content_token.children:
-            if child.type == "text":
-                # 处理多行文本中的空格
-                text = child.content.replace("\n", " ")
-                if text.endswith(" "):
-                    text = text[:-1]
-                current_text += text
-            elif child.type == "strong_open":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["bold"] = True
-            elif child.type == "strong_close":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["bold"] = False
-            elif child.type == "em_open":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["italic"] = True
-            elif child.type == "em_close":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["italic"] = False
-            elif child.type == "s_open":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["strike"] = True
-            elif child.type == "s_close":
-                if current_text:
-                    self._add_text_with_style(paragraph, current_text, current_style)
-                    current_text = ""
-                current_style["strike"] = False
-            elif child.type == "softbreak":
-                current_text += " "
-
-        # 添加剩余的文本
-        if current_text:
-            self._add_text_with_style(paragraph, current_text, current_style)
+        # 输出列表项内的文本、强调、链接和图片
+        self.inline.render(paragraph, content_token.children)
 
         return paragraph
 
@@ -272,25 +239,6 @@ class ListConverter(ElementConverter):
             # 否则添加新的列表状态
             self._current_lists.append((level, is_ordered, numbering_id))
 
-    def _add_text_with_style(
-        self, paragraph: Paragraph, text: str, style: Dict[str, bool]
-    ) -> None:
-        """添加带样式的文本
-
-        Args:
-            paragraph: 段落对象
-            text: 要添加的文本
-            style: 样式配置
-        """
-        run = paragraph.add_run(text)
-        run.bold = style["bold"]
-        run.italic = style["italic"]
-        if style["strike"]:
-            rPr = run._element.get_or_add_rPr()
-            strike = OxmlElement("w:strike")
-            strike.set(qn("w:val"), "true")
-            rPr.append(strike)
-
     def _get_list_info(self, token: Any) -> Tuple[int, bool]:
         """获取列表的层级和类型
 
@@ -328,6 +276,17 @@ class ListConverter(ElementConverter):
         base_name = "List Number" if is_ordered else "List Bullet"
         return f"{base_name} {level}" if level > 1 else base_name
 
+    @staticmethod
+    def _configure_list_style(style) -> None:
+        """设置新建的列表样式"""
+        # 设置基本样式
+        style.font.size = Pt(12)
+        # 设置段落间距
+        style.paragraph_format.space_before = Pt(6)
+        style.paragraph_format.space_after = Pt(6)
+        # 设置对齐方式
+        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+
     def _ensure_list_style(
         self,
         style_name: str,
@@ -346,16 +305,10 @@ class ListConverter(ElementConverter):
         Returns:
             Optional[int]: 编号定义ID
         """
-        # 检查样式是否已存在
-        if style_name not in self.document.styles:
-            style = self.document.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
-            # 设置基本样式
-            style.font.size = Pt(12)
-            # 设置段落间距
-            style.paragraph_format.space_before = Pt(6)
-            style.paragraph_format.space_after = Pt(6)
-            # 设置对齐方式
-            style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        # 样式不存在时创建
+        self.style_registry.ensure(
+            style_name, WD_STYLE_TYPE.PARAGRAPH, self._configure_list_style
+        )
 
         # 对于有序列表，尝试使用内置的编号样式
         if is_ordered:
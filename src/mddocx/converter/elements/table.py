@@ -2,6 +2,8 @@
 表格转换器模块
 """
 
+import logging
+
 from docx.enum.table import WD_ALIGN_VERTICAL
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
@@ -9,6 +11,8 @@ from docx.shared import Inches
 
 from .base import ElementConverter
 
+logger = logging.getLogger(__name__)
+
 
 class TableConverter(ElementConverter):
     """表格转换器，处理Markdown表格到DOCX表格的转换"""
@@ -19,12 +23,7 @@ class TableConverter(ElementConverter):
         Args:
             base_converter: 基础转换器实例，用于处理表格内的内联元素
         """
-        super().__init__()
-        self.base_converter = base_converter
-        self.debug = False
-        self.current_style = {}  # 当前样式
-        if base_converter:
-            self.debug = base_converter.debug
+        super().__init__(base_converter)
 
     def convert(self, token, tokens=None):
         """转换表格token为DOCX表格
@@ -40,9 +39,9 @@ class TableConverter(ElementConverter):
             raise ValueError("Document not set for TableConverter")
 
         if self.debug:
-            print(f"处理表格: {token}")
+            logger.debug("处理表格: %s", token)
             if tokens:
-                print(f"表格tokens: {tokens}")
+                logger.debug("表格tokens: %s", tokens)
 
         # 解析表格结构
         rows = self._parse_table_structure(token, tokens)
@@ -53,8 +52,8 @@ class TableConverter(ElementConverter):
         cols = len(rows[0]) if rows else 0
 
         # 创建表格
-        table = self.document.add_table(rows=len(rows), cols=cols)
-        table.style = "Table Grid"
+        table = self.cursor.add_table(len(rows), cols)
+        self.style_registry.apply_table_style(table, "Table Grid")
 
         # 填充表格内容
         self._fill_table_content(table, rows)
@@ -86,9 +85,9 @@ class TableConverter(ElementConverter):
 
         # 调试输出
         if self.debug:
-            print(f"解析表格结构，tokens长度: {len(tokens)}")
+            logger.debug("解析表格结构，tokens长度: %s", len(tokens))
             for t in tokens:
-                print(f"  Token: {t.type}")
+                logger.debug("  Token: %s", t.type)
 
         # 查找表格行
         tr_open_indices = []
@@ -104,8 +103,10 @@ class TableConverter(ElementConverter):
         # 确保找到了相同数量的开始和结束标记
         if len(tr_open_indices) != len(tr_close_indices):
             if self.debug:
-                print(
-                    f"警告: 表格行的开始和结束标记数量不匹配: {len(tr_open_indices)} vs {len(tr_close_indices)}"
+                logger.debug(
+                    "警告: 表格行的开始和结束标记数量不匹配: %s vs %s",
+                    len(tr_open_indices),
+                    len(tr_close_indices),
                 )
             # 尝试修复
             if len(tr_open_indices) > len(tr_close_indices):
@@ -236,9 +237,9 @@ class TableConverter(ElementConverter):
 
         # 调试输出
         if self.debug:
-            print(f"解析到 {len(rows)} 行表格")
+            logger.debug("解析到 %s 行表格", len(rows))
             for i, row in enumerate(rows):
-                print(f"  行 {i+1}: {len(row)} 个单元格")
+                logger.debug("  行 %s: %s 个单元格", i + 1, len(row))
 
         return rows
 
@@ -292,48 +293,10 @@ class TableConverter(ElementConverter):
                                 hasattr(content_token, "type")
                                 and content_token.type == "inline"
                             ):
-                                # 使用基础转换器处理内联内容
-                                if hasattr(self.base_converter, "_process_inline"):
-                                    self.base_converter._process_inline(
-                                        content_token, p
-                                    )
-                                # 直接处理内联内容（如果基础转换器没有_process_inline方法）
-                                elif hasattr(content_token, "children"):
-                                    for child in content_token.children:
-                                        if hasattr(child, "type"):
-                                            if child.type == "text":
-                                                run = p.add_run(child.content)
-                                                # 应用当前样式
-                                                if "bold" in self.current_style:
-                                                    run.bold = self.current_style[
-                                                        "bold"
-                                                    ]
-                                                if "italic" in self.current_style:
-                                                    run.italic = self.current_style[
-                                                        "italic"
-                                                    ]
-                                                if "strike" in self.current_style:
-                                                    run.font.strike = (
-                                                        self.current_style["strike"]
-                                                    )
-                                            elif child.type == "strong_open":
-                                                # 开始加粗
-                                                self.current_style = {"bold": True}
-                                            elif child.type == "strong_close":
-                                                # 结束加粗
-                                                self.current_style = {}
-                                            elif child.type == "em_open":
-                                                # 开始斜体
-                                                self.current_style = {"italic": True}
-                                            elif child.type == "em_close":
-                                                # 结束斜体
-                                                self.current_style = {}
-                                            elif child.type == "s_open":
-                                                # 开始删除线
-                                                self.current_style = {"strike": True}
-                                            elif child.type == "s_close":
-                                                # 结束删除线
-                                                self.current_style = {}
+                                # 输出单元格内的文本、强调、链接和图片
+                                self.inline.render(
+                                    p, getattr(content_token, "children", None)
+                                )
                             elif (
                                 hasattr(content_token, "type")
                                 and content_token.type == "text"
@@ -353,7 +316,7 @@ class TableConverter(ElementConverter):
                                             p.add_run(content_token.content)
                                 except Exception as e:
                                     if self.debug:
-                                        print(f"处理单元格内容时出错: {e}")
+                                        logger.debug("处理单元格内容时出错: %s", e)
                     else:
                         # 简单文本处理
                         text = self._get_text_from_tokens(cell_data["content"])
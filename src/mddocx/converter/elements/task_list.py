@@ -2,11 +2,14 @@
 任务列表转换器模块
 """
 
+import logging
 import re
 
 from .base import ElementConverter
 from .list import ListConverter
 
+logger = logging.getLogger(__name__)
+
 
 class TaskListConverter(ElementConverter):
     """任务列表转换器，处理Markdown中的任务列表（TODO列表）"""
@@ -18,10 +21,8 @@ class TaskListConverter(ElementConverter):
             base_converter: 基础转换器实例
         """
         super().__init__(base_converter)
-        self.debug = False
         self.list_converter = None
         if base_converter:
-            self.debug = base_converter.debug
             # 获取列表转换器，用于处理基本列表结构
             if "list" in base_converter.converters:
                 self.list_converter = base_converter.converters["list"]
@@ -41,7 +42,7 @@ class TaskListConverter(ElementConverter):
             raise ValueError("Document not set for TaskListConverter")
 
         if self.debug:
-            print(f"处理任务列表: {tokens}")
+            logger.debug("处理任务列表: %s", tokens)
 
         # 解析token
         list_token, content_token = tokens
@@ -124,7 +125,7 @@ class TaskListConverter(ElementConverter):
         # 检查段落是否为None
         if paragraph is None:
             if self.debug:
-                print("警告: 尝试向None段落添加复选框")
+                logger.debug("警告: 尝试向None段落添加复选框")
             return
 
         # 获取段落的第一个run
@@ -0,0 +1,198 @@
+"""
+图片存储模块
+
+python-docx 每插入一张图片都要重新解析图片数据、计算 SHA1，再把它与包中
+所有图片部件逐个比较（每个部件的 SHA1 每次都重新计算），然后遍历关系查找
+rId、扫描整个正文 XML 计算下一个形状编号。同一个图标或标志在每个章节重复
+出现时，这些开销都要再付一遍。
+
+图片存储挂在每个文档部件上，按内容哈希和图片来源（路径或 URL）两级索引，
+直接映射到已有的图片部件和 rId：
+
+- 来源相同的图片只需一次字典查找，不再读取和解析图片数据；
+- 来源不同但内容相同的图片共用同一个图片部件；
+- 形状编号按顺序分配，与 python-docx 的取值（最大编号加一）相同。
+
+存储同时统计重复图片的数量和因去重节省的字节数。
+"""
+
+import hashlib
+from typing import IO, Dict, NamedTuple, Optional, Set, Union
+
+from docx.document import Document
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml.shape import CT_Inline
+from docx.parts.image import ImagePart
+from docx.shape import InlineShape
+from docx.shared import Length
+from docx.text.run import Run
+
+from .relations import get_relationship_index
+
+# 存储在文档部件上的属性名
+_ATTR = "_mddocx_image_store"
+
+
+class ImageEntry(NamedTuple):
+    """已加入文档的图片
+
+    Attributes:
+        r_id: 正文部件到图片部件的关系 rId
+        image: 图片信息（尺寸、文件名等）
+        size: 图片数据的字节数
+    """
+
+    r_id: str
+    image: Image
+    size: int
+
+
+class ImageStore:
+    """单个文档的图片存储
+
+    只会追加图片，不处理删除。形状编号在首次分配时从正文中取一次，之后
+    顺序递增，因此文档中的图片应统一通过存储插入，或用 ``next_shape_id``
+    分配编号。
+    """
+
+    def __init__(self, document: Document) -> None:
+        """初始化图片存储，已有的图片部件按内容哈希编入索引
+
+        Args:
+            document: 目标文档
+        """
+        self.document = document
+        self.part = document.part
+        self._image_parts = self.part.package.image_parts
+        self._relationships = get_relationship_index(document)
+        self._by_hash: Dict[str, ImagePart] = {}
+        self._by_source: Dict[str, ImageEntry] = {}
+        self._used_numbers: Set[int] = set()
+        for image_part in self._image_parts:
+            self._by_hash.setdefault(image_part.sha1, image_part)
+            self._used_numbers.add(image_part.partname.idx)
+        self._next_number = 1
+        self._next_shape_id: Optional[int] = None
+        # 重复图片数量和因此节省的字节数
+        self.duplicates = 0
+        self.duplicate_bytes = 0
+
+    def get(self, source: str) -> Optional[ImageEntry]:
+        """按来源查找已加入的图片
+
+        Args:
+            source: 图片路径或 URL
+
+        Returns:
+            Optional[ImageEntry]: 已加入的图片，未加入过时返回 None
+        """
+        entry = self._by_source.get(source)
+        if entry is not None:
+            self._count_duplicate(entry.size)
+        return entry
+
+    def add(
+        self, data: Union[bytes, IO[bytes]], source: Optional[str] = None
+    ) -> ImageEntry:
+        """加入图片，内容相同的图片共用同一个图片部件
+
+        Args:
+            data: 图片数据或数据流
+            source: 图片路径或 URL，提供时之后可以通过 get 直接查找
+
+        Returns:
+            ImageEntry: 图片信息
+
+        Raises:
+            UnrecognizedImageError: 无法识别的图片格式
+        """
+        if isinstance(data, bytes):
+            blob = data
+        else:
+            data.seek(0)
+            blob = data.read()
+        digest = hashlib.sha1(blob).hexdigest()
+        image_part = self._by_hash.get(digest)
+        if image_part is not None:
+            self._count_duplicate(len(blob))
+            image = image_part.image
+        else:
+            image = Image.from_blob(blob)
+            image_part = ImagePart.from_image(image, self._next_partname(image.ext))
+            self._image_parts.append(image_part)
+            self._by_hash[digest] = image_part
+        r_id = self._relationships.internal(image_part, RT.IMAGE)
+        entry = ImageEntry(r_id, image, len(blob))
+        if source is not None:
+            self._by_source[source] = entry
+        return entry
+
+    def add_picture(
+        self,
+        run: Run,
+        entry: ImageEntry,
+        width: Optional[Length] = None,
+        height: Optional[Length] = None,
+    ) -> InlineShape:
+        """在文本块末尾插入图片，与 ``run.add_picture`` 的结果相同
+
+        Args:
+            run: 目标文本块
+            entry: 图片信息
+            width: 宽度，为 None 时按高度等比缩放或使用原始尺寸
+            height: 高度，为 None 时按宽度等比缩放或使用原始尺寸
+
+        Returns:
+            InlineShape: 插入的图片
+        """
+        image = entry.image
+        cx, cy = image.scaled_dimensions(width, height)
+        inline = CT_Inline.new_pic_inline(
+            self.next_shape_id(), entry.r_id, image.filename, cx, cy
+        )
+        run._r.add_drawing(inline)
+        return InlineShape(inline)
+
+    def _count_duplicate(self, size: int) -> None:
+        self.duplicates += 1
+        self.duplicate_bytes += size
+
+    def _next_partname(self, ext: str) -> PackURI:
+        """下一个图片部件名，与 python-docx 一样取最小的未使用编号"""
+        n = self._next_number
+        while n in self._used_numbers:
+            n += 1
+        self._used_numbers.add(n)
+        self._next_number = n + 1
+        return PackURI("/word/media/image%d.%s" % (n, ext))
+
+    def next_shape_id(self) -> int:
+        """分配下一个形状编号
+
+        Returns:
+            int: 文档中未使用的形状编号
+        """
+        shape_id = self._next_shape_id
+        if shape_id is None:
+            shape_id = self.part.next_id
+        self._next_shape_id = shape_id + 1
+        return shape_id
+
+
+def get_image_store(document: Document) -> ImageStore:
+    """获取文档的图片存储，首次访问时创建并挂在文档部件上
+
+    Args:
+        document: 目标文档
+
+    Returns:
+        ImageStore: 该文档的图片存储
+    """
+    part = document.part
+    store = getattr(part, _ATTR, None)
+    if store is None:
+        store = ImageStore(document)
+        setattr(part, _ATTR, store)
+    return store
@@ -0,0 +1,309 @@
+"""
+内联渲染模块
+
+段落、列表项、引用块和表格单元格中的内联内容（文本、粗体、斜体、删除线、
+行内代码、链接、图片）都由同一个渲染器输出。处理函数按 token 类型预先建表，
+粗体、斜体和删除线用格式栈跟踪，嵌套和交叉的强调都能正确恢复外层格式。
+
+文本块的格式用格式位（BOLD、ITALIC、STRIKE、CODE、LINK）的组合表示，每种
+组合的 ``w:rPr`` 只用 python-docx 的属性设置代码生成一次，之后每个文本块
+直接复制模板，不再逐个调用 ``run.bold``、``run.font.*`` 等属性。
+"""
+
+import copy
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from docx.oxml.text.font import CT_RPr
+from docx.shared import Pt
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from .ooxml import compile_run_template
+
+if TYPE_CHECKING:
+    from .elements.base import ElementConverter
+
+logger = logging.getLogger(__name__)
+
+# 内联格式位，一个文本块的格式是这些位的组合
+BOLD = 0x01
+ITALIC = 0x02
+STRIKE = 0x04
+CODE = 0x08
+LINK = 0x10
+
+# 解析器没有识别为强调、紧贴在链接前后的标记，例如“中文**[链接](url)**中文”，
+# 依次为 (标记, 格式位, 不能以其开头或结尾的更长标记)
+_LINK_MARKERS = (("**", BOLD, None), ("*", ITALIC, "**"), ("~~", STRIKE, None))
+
+
+def apply_format(run: Run, mask: int) -> None:
+    """用 python-docx 的属性设置代码设置文本块格式
+
+    普通文本和行内代码显式写出粗体、斜体和删除线（包括关闭）；链接只写出
+    生效的格式，其余由 Hyperlink 字符样式决定。
+
+    Args:
+        run: 文本块
+        mask: 格式位
+    """
+    if mask & LINK:
+        if mask & BOLD:
+            run.bold = True
+        if mask & ITALIC:
+            run.italic = True
+        if mask & STRIKE:
+            run.font.strike = True
+    else:
+        run.bold = bool(mask & BOLD)
+        run.italic = bool(mask & ITALIC)
+        run.font.strike = bool(mask & STRIKE)
+    if mask & CODE:
+        # 设置等宽字体，字号稍小
+        run.font.name = "Consolas"
+        run.font.size = Pt(10)
+
+
+# 格式位到 w:rPr 模板的缓存，不需要任何属性时为 None
+_rpr_templates: Dict[int, Optional[CT_RPr]] = {}
+
+
+def run_properties(mask: int) -> Optional[CT_RPr]:
+    """获取格式位对应的 w:rPr 模板，首次使用时生成
+
+    返回的元素由所有文档共用，只能复制，不能修改。
+
+    Args:
+        mask: 格式位
+
+    Returns:
+        Optional[CT_RPr]: rPr 模板，不需要任何属性（例如不带强调的链接）时为 None
+    """
+    try:
+        return _rpr_templates[mask]
+    except KeyError:
+        pass
+    rpr = compile_run_template(partial(apply_format, mask=mask)).rPr
+    return _rpr_templates.setdefault(mask, rpr)
+
+
+def format_run(run: Run, mask: int) -> None:
+    """设置新建文本块的格式，结果与 apply_format 相同，但直接复制 rPr 模板
+
+    Args:
+        run: 还没有设置格式的文本块
+        mask: 格式位
+    """
+    rpr = run_properties(mask)
+    if rpr is not None:
+        run._r.insert(0, copy.deepcopy(rpr))
+
+
+# 每种格式位组合的格式键和设置函数，格式键在所有转换器之间通用
+_RUN_FORMATS: Dict[int, Tuple[Tuple[str, int], Callable[[Run], None]]] = {
+    mask: (("inline", mask), partial(format_run, mask=mask))
+    for mask in range((BOLD | ITALIC | STRIKE | CODE | LINK) + 1)
+}
+
+
+class _State:
+    """一次渲染的状态"""
+
+    __slots__ = ("paragraph", "children", "pending", "stack", "mask")
+
+    def __init__(self, paragraph: Paragraph, children: Sequence[Any]) -> None:
+        self.paragraph = paragraph
+        self.children = children
+        # 尚未输出的文本片段
+        self.pending: List[str] = []
+        # 格式栈，元素为 BOLD、ITALIC、STRIKE 等格式位
+        self.stack: List[int] = []
+        # 栈中格式位的组合
+        self.mask = 0
+
+    def push(self, bit: int) -> None:
+        """压入格式"""
+        self.stack.append(bit)
+        self.mask |= bit
+
+    def pop(self, bit: int) -> None:
+        """移除最近一次压入的指定格式，不存在时忽略"""
+        stack = self.stack
+        for k in range(len(stack) - 1, -1, -1):
+            if stack[k] == bit:
+                del stack[k]
+                break
+        mask = 0
+        for pushed in stack:
+            mask |= pushed
+        self.mask = mask
+
+
+class InlineRenderer:
+    """内联内容渲染器
+
+    渲染器属于某个元素转换器，文本块通过该转换器的 ``_add_run`` 输出，
+    因此同样会合并相邻的同格式文本、在开启时使用快速输出。链接和图片交给
+    基础转换器中注册的 link、image 转换器处理，未注册时链接按普通文本输出。
+    """
+
+    def __init__(self, owner: "ElementConverter") -> None:
+        """初始化渲染器
+
+        Args:
+            owner: 使用渲染器的元素转换器
+        """
+        self.owner = owner
+
+    def render(self, paragraph: Paragraph, children: Optional[Sequence[Any]]) -> None:
+        """把内联 token 输出到段落末尾
+
+        Args:
+            paragraph: 目标段落
+            children: inline token 的子 token 列表
+        """
+        if not children:
+            return
+        state = _State(paragraph, children)
+        handlers = self._HANDLERS
+        debug = self.owner.debug
+        i = 0
+        count = len(children)
+        while i < count:
+            child = children[i]
+            if debug:
+                logger.debug(
+                    "处理标记: type=%s, content=%s",
+                    child.type,
+                    getattr(child, "content", ""),
+                )
+            handler = handlers.get(child.type)
+            i = handler(self, state, i) if handler is not None else i + 1
+        self._flush(state)
+
+    def _converter(self, name: str) -> Optional[Any]:
+        """基础转换器中注册的元素转换器"""
+        base_converter = self.owner.base_converter
+        if base_converter and name in base_converter.converters:
+            return base_converter.converters.get(name)
+        return None
+
+    def _flush(self, state: _State) -> None:
+        """输出已累积的文本"""
+        if state.pending:
+            text = "".join(state.pending)
+            state.pending.clear()
+            if text:
+                self._add_text(state, text)
+
+    def _add_text(self, state: _State, text: str, mask: int = 0) -> None:
+        key, configure = _RUN_FORMATS[state.mask | mask]
+        self.owner._add_run(state.paragraph, text, key, configure)
+
+    def _style(self, state: _State) -> Dict[str, bool]:
+        """当前格式的字典形式，传给链接和图片转换器"""
+        mask = state.mask
+        return {
+            "bold": bool(mask & BOLD),
+            "italic": bool(mask & ITALIC),
+            "strike": bool(mask & STRIKE),
+        }
+
+    def _text(self, state: _State, i: int) -> int:
+        children = state.children
+        content = children[i].content
+        if i + 1 < len(children) and children[i + 1].type == "link_open":
+            for marker, bit, longer in _LINK_MARKERS:
+                if content.endswith(marker) and not (
+                    longer and content.endswith(longer)
+                ):
+                    return self._marked_link(state, i, marker, bit, longer)
+        # 多行文本中的换行按空格处理
+        state.pending.append(content.replace("\n", " "))
+        return i + 1
+
+    def _marked_link(
+        self, state: _State, i: int, marker: str, bit: int, longer: Optional[str]
+    ) -> int:
+        """处理两侧带有未解析强调标记的链接，标记之间的链接按对应格式输出"""
+        children = state.children
+        state.pending.append(children[i].content[: -len(marker)])
+        self._flush(state)
+        state.push(bit)
+        i = self._link(state, i + 1)
+        if i < len(children):
+            closing = children[i]
+            content = closing.content if closing.type == "text" else ""
+            if content.startswith(marker) and not (
+                longer and content.startswith(longer)
+            ):
+                state.pop(bit)
+                state.pending.append(content[len(marker) :])
+                return i + 1
+        return i
+
+    def _link(self, state: _State, i: int) -> int:
+        self._flush(state)
+        children = state.children
+        # 链接文本取链接内最后一个文本 token
+        link_text = None
+        j = i + 1
+        while j < len(children) and children[j].type != "link_close":
+            if children[j].type == "text":
+                link_text = children[j].content
+            j += 1
+
+        if link_text is not None:
+            link_converter = self._converter("link")
+            if link_converter is not None:
+                link_converter.convert_in_paragraph(
+                    state.paragraph, children[i], self._style(state), link_text
+                )
+            else:
+                self._add_text(state, link_text)
+        return j + 1 if j < len(children) else i + 1
+
+    def _image(self, state: _State, i: int) -> int:
+        self._flush(state)
+        image_converter = self._converter("image")
+        if image_converter is not None:
+            image_converter.convert_in_paragraph(
+                state.paragraph, state.children[i], self._style(state)
+            )
+        return i + 1
+
+    def _code_inline(self, state: _State, i: int) -> int:
+        self._flush(state)
+        self._add_text(state, state.children[i].content, CODE)
+        return i + 1
+
+    def _softbreak(self, state: _State, i: int) -> int:
+        state.pending.append(" ")
+        return i + 1
+
+    def _open(self, state: _State, i: int, bit: int) -> int:
+        self._flush(state)
+        state.push(bit)
+        return i + 1
+
+    def _close(self, state: _State, i: int, bit: int) -> int:
+        self._flush(state)
+        state.pop(bit)
+        return i + 1
+
+    # token 类型到处理函数的映射，未列出的类型直接跳过
+    _HANDLERS: Dict[str, Callable[..., int]] = {
+        "text": _text,
+        "softbreak": _softbreak,
+        "strong_open": partial(_open, bit=BOLD),
+        "strong_close": partial(_close, bit=BOLD),
+        "em_open": partial(_open, bit=ITALIC),
+        "em_close": partial(_close, bit=ITALIC),
+        "s_open": partial(_open, bit=STRIKE),
+        "s_close": partial(_close, bit=STRIKE),
+        "code_inline": _code_inline,
+        "link_open": _link,
+        "image": _image,
+    }
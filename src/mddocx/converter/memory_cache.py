@@ -0,0 +1,104 @@
+"""
+图片内存缓存模块
+
+图片转换器在进程内缓存图片数据，复用转换器时（例如 Web 界面中长期运行的
+转换器）不必再次下载或读取同一张图片。缓存按字节数设置上限，超过上限时
+淘汰最久未用的图片，内存占用不会随着引用过的图片越来越多而无限增长。
+
+缓存的值可以是 ``bytes``，也可以是映射磁盘缓存文件的 ``memoryview``：映射
+的页面由操作系统按需载入和回收，不需要复制一份图片数据。
+"""
+
+from collections import OrderedDict
+from typing import Optional, Union
+
+# 默认缓存大小上限（字节）
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+# 缓存的图片数据
+ImageData = Union[bytes, memoryview]
+
+
+class ImageMemoryCache:
+    """按字节数限制大小的 LRU 图片缓存
+
+    ``get`` 会更新最近使用顺序并计入命中/未命中次数，``in`` 只检查是否存在。
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_MAX_BYTES) -> None:
+        """初始化缓存
+
+        Args:
+            max_bytes: 缓存数据的总大小上限（字节）
+
+        Raises:
+            ValueError: 大小上限小于 0
+        """
+        if max_bytes < 0:
+            raise ValueError(f"缓存大小上限不能小于 0，得到 {max_bytes}")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, ImageData]" = OrderedDict()
+        # 缓存数据的总字节数
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[ImageData]:
+        """获取缓存的图片数据，并标记为最近使用
+
+        Args:
+            key: 图片地址
+
+        Returns:
+            Optional[ImageData]: 图片数据，未缓存时为 None
+        """
+        try:
+            data = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: ImageData) -> bool:
+        """缓存图片数据，超过大小上限时淘汰最久未用的图片
+
+        Args:
+            key: 图片地址
+            data: 图片数据
+
+        Returns:
+            bool: 是否缓存，单张图片超过大小上限时不缓存
+        """
+        size = len(data)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        if size > self.max_bytes:
+            return False
+        self._entries[key] = data
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted)
+            self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """清空缓存，计数保持不变"""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def reset_counters(self) -> None:
+        """清零命中、未命中和淘汰次数"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
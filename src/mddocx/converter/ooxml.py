@@ -0,0 +1,238 @@
+"""
+OOXML 快速输出模块
+
+元素转换器默认通过 python-docx 的代理对象输出（``add_paragraph``、
+``add_run``、``run.font.*``、``paragraph.style = ...``），每次调用都会创建
+包装对象、在样式表中查找样式、按 schema 顺序逐个插入子元素，并且每个新段落
+都要在正文中查找 ``w:sectPr``。
+
+``OoxmlWriter`` 直接向正文追加 lxml 的 ``w:p``/``w:r`` 元素：段落和文本块
+的属性（``w:pPr``/``w:rPr``）按键预先生成一次，之后只复制模板。模板本身
+由 python-docx 的同一套属性设置代码生成，因此两种输出方式得到的 XML 结构
+相同。通过 ``BaseConverter(fast_xml=True)`` 开启。
+"""
+
+import copy
+import re
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.text.run import CT_R
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from .cursor import get_body_cursor
+from .styles import get_style_registry
+
+_PPR = qn("w:pPr")
+_PSTYLE = qn("w:pStyle")
+_T = qn("w:t")
+_TAB = qn("w:tab")
+_BR = qn("w:br")
+_VAL = qn("w:val")
+_XML_SPACE = qn("xml:space")
+
+# python-docx 会把这些字符转换为 w:tab/w:br，而不是放进 w:t
+_SPECIAL_CHARS = frozenset("\t\r\n")
+_SPECIAL_SPLIT = re.compile(r"([\t\r\n])")
+
+# 文本块模板：键 -> 只含 w:rPr（或为空）的 w:r 元素，与具体文档无关，进程内共享
+_run_templates: Dict[Hashable, CT_R] = {}
+_lock = threading.Lock()
+
+
+def _set_text(t: Any, text: str) -> None:
+    """设置 w:t 的文本，首尾有空白时保留空白（与 python-docx 的 add_t 一致）"""
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(_XML_SPACE, "preserve")
+    else:
+        t.attrib.pop(_XML_SPACE, None)
+
+
+def append_text(r: CT_R, text: str) -> None:
+    """把文本追加到文本块末尾
+
+    与 python-docx 设置 ``Run.text`` 的结果相同：制表符转换为 ``w:tab``，
+    换行符和回车符各转换为一个 ``w:br``，其余连续字符放在同一个 ``w:t`` 中。
+    按分隔符切分而不是逐字符处理，长代码块也只需少量 Python 调用。
+
+    Args:
+        r: 文本块元素
+        text: 文本内容
+    """
+    if _SPECIAL_CHARS.isdisjoint(text):
+        if text:
+            t = r.makeelement(_T)
+            _set_text(t, text)
+            r.append(t)
+        return
+    for piece in _SPECIAL_SPLIT.split(text):
+        if not piece:
+            continue
+        if piece == "\t":
+            r.append(r.makeelement(_TAB))
+        elif piece in "\r\n":
+            r.append(r.makeelement(_BR))
+        else:
+            t = r.makeelement(_T)
+            _set_text(t, piece)
+            r.append(t)
+
+
+def compile_run_template(configure: Callable[[Run], None]) -> CT_R:
+    """用 python-docx 的属性设置代码生成一个文本块模板
+
+    Args:
+        configure: 设置文本块格式的函数，接收一个空的 Run
+
+    Returns:
+        CT_R: 不含文本内容的 w:r 元素
+    """
+    run = Paragraph(OxmlElement("w:p"), None).add_run()
+    configure(run)
+    return run._r
+
+
+class OoxmlWriter:
+    """直接向文档正文追加段落和文本块的输出器
+
+    输出器与单个文档绑定，文档替换后需要重新创建。
+    """
+
+    def __init__(self, document: Document) -> None:
+        """初始化输出器
+
+        Args:
+            document: 目标文档
+        """
+        self.document = document
+        self._body = document.element.body
+        self._parent = document._body
+        self._cursor = get_body_cursor(document)
+
+    def paragraph_style_id(self, name: str) -> Optional[str]:
+        """获取段落样式的 ID，结果由文档的样式注册表缓存
+
+        Args:
+            name: 样式名称
+
+        Returns:
+            Optional[str]: 样式 ID，默认段落样式返回 None（与 python-docx 一致）
+        """
+        return get_style_registry(self.document).style_id(name)
+
+    def add_paragraph(self, style_id: Optional[str] = None) -> Paragraph:
+        """在正文末尾（分节属性之前）追加一个段落
+
+        Args:
+            style_id: 段落样式 ID，为 None 时不设置样式
+
+        Returns:
+            Paragraph: 新段落的代理对象，可继续交给其他转换器使用
+        """
+        p = OxmlElement("w:p")
+        if style_id is not None:
+            p_pr = p.makeelement(_PPR)
+            p.append(p_pr)
+            p_style = p.makeelement(_PSTYLE)
+            p_style.set(_VAL, style_id)
+            p_pr.append(p_style)
+
+        self._cursor.append(p)
+        return Paragraph(p, self._parent)
+
+    def add_run(
+        self,
+        paragraph: Paragraph,
+        text: str,
+        key: Hashable = None,
+        configure: Optional[Callable[[Run], None]] = None,
+    ) -> CT_R:
+        """在段落末尾追加一个文本块
+
+        Args:
+            paragraph: 目标段落
+            text: 文本内容
+            key: 文本块格式的缓存键，相同的键必须对应相同的 configure
+            configure: 首次遇到 key 时用于生成模板的格式设置函数，为 None 时不设置格式
+
+        Returns:
+            CT_R: 新文本块元素
+        """
+        if configure is None:
+            r = OxmlElement("w:r")
+        else:
+            template = _run_templates.get(key)
+            if template is None:
+                with _lock:
+                    template = _run_templates.get(key)
+                    if template is None:
+                        template = compile_run_template(configure)
+                        _run_templates[key] = template
+            r = copy.deepcopy(template)
+
+        if text:
+            append_text(r, text)
+        paragraph._p.append(r)
+        return r
+
+
+class RunCoalescer:
+    """合并段落中相邻的同格式文本块
+
+    记录最近添加的文本块及其格式键。下一段文本的格式键相同、且该文本块仍是
+    段落的最后一个子元素（中间没有插入超链接、图片等）时，文本直接追加到它的
+    ``w:t`` 中，不再新建文本块。
+    """
+
+    def __init__(self) -> None:
+        self._run: Optional[CT_R] = None
+        self._key: Hashable = None
+
+    def clear(self) -> None:
+        """清除记录，在切换文档时调用"""
+        self._run = None
+        self._key = None
+
+    def extend(self, paragraph: Paragraph, key: Hashable, text: str) -> bool:
+        """尝试把文本追加到上一个同格式文本块
+
+        Args:
+            paragraph: 目标段落
+            key: 文本格式键
+            text: 文本内容
+
+        Returns:
+            bool: 是否已合并，为 False 时调用方需要新建文本块并调用 record
+        """
+        r = self._run
+        if r is None or key != self._key or not _SPECIAL_CHARS.isdisjoint(text):
+            return False
+        p = paragraph._p
+        if r.getparent() is not p or p[-1] is not r:
+            return False
+        t = r[-1] if len(r) else None
+        if t is None or t.tag != _T:
+            return False
+        _set_text(t, (t.text or "") + text)
+        return True
+
+    def record(self, key: Hashable, r: CT_R) -> None:
+        """记录新建的文本块
+
+        Args:
+            key: 文本格式键
+            r: 文本块元素
+        """
+        self._run = r
+        self._key = key
+
+
+def clear_run_templates() -> None:
+    """清空文本块模板缓存"""
+    with _lock:
+        _run_templates.clear()
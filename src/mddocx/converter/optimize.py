@@ -0,0 +1,266 @@
+"""
+图片优化模块
+
+相机拍摄的照片（例如 4000x3000、8 MB 的 JPEG）在文档中通常只显示为几厘米
+宽，原样嵌入会让 DOCX 体积、保存耗时、传输和 Word 打开的时间都成倍增加。
+
+优化器按图片在文档中的显示尺寸（磅）和目标分辨率（DPI）计算需要的像素数，
+图片比需要的大时按比例缩小，再按质量设置重新压缩：
+
+- JPEG 按 ``quality`` 重新编码，保留 EXIF（方向）和 ICC 颜色配置；
+- PNG 无损重新压缩；
+- 其他格式、无法识别的数据以及重新压缩后没有变小的图片原样使用。
+
+缩小后按比例调整图片的 DPI，未指定显示尺寸的图片在文档中的尺寸不变。
+优化结果按（内容哈希、目标像素尺寸、质量）缓存，同一张图片在多个文档中
+以相同尺寸出现时只处理一次。Pillow 在解码、缩放和编码时释放 GIL，
+``optimize_many`` 用线程池并行处理多张图片。
+
+需要安装可选依赖 Pillow：``pip install mddocx[images]``。
+"""
+
+import hashlib
+import logging
+import math
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from io import BytesIO
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ..log import debug_enabled, with_debug_scope
+from .memory_cache import DEFAULT_MEMORY_MAX_BYTES, ImageData, ImageMemoryCache
+
+try:
+    from PIL import Image as PILImage
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 默认的目标分辨率（每英寸像素数）
+DEFAULT_DPI = 150
+
+# 默认的 JPEG 压缩质量
+DEFAULT_QUALITY = 85
+
+# 默认的处理线程数
+DEFAULT_OPTIMIZE_WORKERS = min(4, os.cpu_count() or 1)
+
+# 未记录分辨率的图片按 72 DPI 计算显示尺寸，与 python-docx 一致
+_NATIVE_DPI = 72
+
+# 每英寸的磅数
+_POINTS_PER_INCH = 72
+
+K = TypeVar("K", bound=Hashable)
+
+
+class Optimized(NamedTuple):
+    """一张图片的优化结果"""
+
+    # 优化后的图片数据，没有变小时为原始数据
+    data: ImageData
+    # 节省的字节数
+    saved: int
+
+
+class ImageOptimizer:
+    """按显示尺寸缩小并重新压缩图片
+
+    同一进程内可以被多个线程同时使用。
+    """
+
+    def __init__(
+        self,
+        dpi: int = DEFAULT_DPI,
+        quality: int = DEFAULT_QUALITY,
+        max_workers: int = DEFAULT_OPTIMIZE_WORKERS,
+        cache_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+    ) -> None:
+        """初始化优化器
+
+        Args:
+            dpi: 目标分辨率（每英寸像素数）
+            quality: JPEG 压缩质量（1-95）
+            max_workers: optimize_many 使用的最大线程数
+            cache_max_bytes: 优化结果缓存的大小上限（字节）
+
+        Raises:
+            ImportError: 没有安装 Pillow
+            ValueError: 分辨率或线程数小于 1，或质量不在 1-95 之间
+        """
+        if not PIL_AVAILABLE:
+            raise ImportError("图片优化需要安装 Pillow: pip install mddocx[images]")
+        if dpi < 1:
+            raise ValueError(f"目标分辨率必须大于 0，得到 {dpi}")
+        if not 1 <= quality <= 95:
+            raise ValueError(f"压缩质量必须在 1-95 之间，得到 {quality}")
+        if max_workers < 1:
+            raise ValueError(f"处理线程数必须大于 0，得到 {max_workers}")
+        self.dpi = dpi
+        self.quality = quality
+        self.max_workers = max_workers
+        self._cache = ImageMemoryCache(cache_max_bytes)
+        self._lock = threading.Lock()
+
+    def target_size(
+        self,
+        size: Tuple[int, int],
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+    ) -> Tuple[int, int]:
+        """计算图片按给定显示尺寸和目标分辨率需要的像素尺寸
+
+        只缩小不放大，并保持宽高比：缩小后宽和高都不少于显示需要的像素数。
+
+        Args:
+            size: 图片的像素尺寸 (宽, 高)
+            width: 显示宽度（磅），为 None 时按高度等比缩放
+            height: 显示高度（磅），为 None 时按宽度等比缩放
+
+        Returns:
+            Tuple[int, int]: 目标像素尺寸，宽高都未指定时为原始尺寸
+        """
+        w, h = size
+        scales = []
+        if width:
+            scales.append(math.ceil(width / _POINTS_PER_INCH * self.dpi) / w)
+        if height:
+            scales.append(math.ceil(height / _POINTS_PER_INCH * self.dpi) / h)
+        if not scales:
+            return size
+        scale = max(scales)
+        if scale >= 1:
+            return size
+        return max(1, round(w * scale)), max(1, round(h * scale))
+
+    def optimize(
+        self,
+        data: ImageData,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+    ) -> Optimized:
+        """按显示尺寸优化一张图片
+
+        Args:
+            data: 图片数据
+            width: 显示宽度（磅），为 None 时按高度等比缩放
+            height: 显示高度（磅），为 None 时按宽度等比缩放
+
+        Returns:
+            Optimized: 优化结果，无法处理的图片原样返回
+        """
+        try:
+            with PILImage.open(BytesIO(data)) as image:
+                if image.format not in ("JPEG", "PNG"):
+                    return Optimized(data, 0)
+                target = self.target_size(image.size, width, height)
+                key = "%s:%dx%d:%d" % (
+                    hashlib.sha256(data).hexdigest(),
+                    target[0],
+                    target[1],
+                    self.quality,
+                )
+                with self._lock:
+                    cached = self._cache.get(key)
+                if cached is None:
+                    cached = self._encode(image, target)
+                    with self._lock:
+                        self._cache.put(key, cached)
+        except (OSError, ValueError, PILImage.DecompressionBombError) as e:
+            if debug_enabled():
+                logger.debug("图片优化失败，使用原图: %s", e)
+            return Optimized(data, 0)
+        if len(cached) >= len(data):
+            return Optimized(data, 0)
+        return Optimized(cached, len(data) - len(cached))
+
+    def optimize_many(
+        self, jobs: Iterable[Tuple[K, ImageData, Optional[float], Optional[float]]]
+    ) -> Dict[K, Optimized]:
+        """用线程池并行优化多张图片
+
+        ``jobs`` 按需读取，同时处理中的图片不超过线程数的两倍，不必先把全部
+        原图读入内存。
+
+        Args:
+            jobs: (键, 图片数据, 显示宽度, 显示高度) 的序列
+
+        Returns:
+            Dict[K, Optimized]: 键到优化结果的映射
+        """
+        results: Dict[K, Optimized] = {}
+        pending: Set["Future[Optimized]"] = set()
+        keys: Dict["Future[Optimized]", K] = {}
+        limit = self.max_workers * 2
+        optimize = with_debug_scope(self.optimize)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mddocx-optimize"
+        ) as executor:
+            for key, data, width, height in jobs:
+                if len(pending) >= limit:
+                    self._collect(pending, keys, results)
+                future = executor.submit(optimize, data, width, height)
+                keys[future] = key
+                pending.add(future)
+            while pending:
+                self._collect(pending, keys, results)
+        return results
+
+    @staticmethod
+    def _collect(
+        pending: Set["Future[Optimized]"],
+        keys: Dict["Future[Optimized]", K],
+        results: Dict[K, Optimized],
+    ) -> None:
+        """等待至少一个任务完成，取出已完成的结果"""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.discard(future)
+            results[keys.pop(future)] = future.result()
+
+    def _encode(self, image, target: Tuple[int, int]) -> bytes:
+        """缩小到目标尺寸并重新压缩"""
+        fmt = image.format
+        info = image.info
+        options = {}
+        if target != image.size:
+            scale = target[0] / image.size[0]
+            if fmt == "JPEG":
+                # 解码时按 DCT 缩放，只解码需要的分辨率
+                image.draft(image.mode, target)
+            if image.mode in ("P", "1"):
+                image = image.convert("RGBA" if "transparency" in info else "RGB")
+            image = image.resize(target, PILImage.Resampling.LANCZOS)
+            x_dpi, y_dpi = info.get("dpi") or (_NATIVE_DPI, _NATIVE_DPI)
+            # 调整分辨率，未指定显示尺寸时图片在文档中的尺寸不变
+            options["dpi"] = (
+                (x_dpi or _NATIVE_DPI) * scale,
+                (y_dpi or _NATIVE_DPI) * scale,
+            )
+        elif "dpi" in info:
+            options["dpi"] = info["dpi"]
+        if info.get("icc_profile"):
+            options["icc_profile"] = info["icc_profile"]
+        out = BytesIO()
+        if fmt == "JPEG":
+            if image.mode not in ("RGB", "L", "CMYK"):
+                image = image.convert("RGB")
+            if info.get("exif"):
+                options["exif"] = info["exif"]
+            image.save(out, "JPEG", quality=self.quality, optimize=True, **options)
+        else:
+            image.save(out, "PNG", optimize=True, **options)
+        return out.getvalue()
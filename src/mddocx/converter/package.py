@@ -0,0 +1,337 @@
+"""
+DOCX 流式打包模块
+
+python-docx 的 ``Document.save`` 先把每个部件完整序列化为字节串再写入 ZIP，
+正文 ``document.xml`` 的序列化结果和压缩缓冲会同时留在内存中。这里按部件逐个
+写入 ZIP：
+
+- 正文按顶层块（段落、表格等）逐个序列化，每次只保留一个块的字节串；
+- 图片等二进制部件按固定大小的切片从部件数据直接写入压缩流，不再额外复制；
+- ZIP 条目使用数据描述符，目标可以是不支持 seek 的流（管道、套接字、HTTP 响应）。
+
+生成的各个条目内容与 ``Document.save`` 完全相同。
+
+压缩方式由压缩配置（``COMPRESSION_PROFILES``）决定：``default`` 与
+python-docx 相同；``store`` 不压缩；``fast``、``max`` 分别为最快和最高级别的
+deflate；``store-media`` 只对已经压缩过的图片（PNG、JPEG 等）不再压缩，
+XML 仍按默认级别压缩。
+"""
+
+import copy
+import os
+import re
+import time
+import zipfile
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from docx.document import Document
+from docx.opc.package import OpcPackage
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.part import Part, XmlPart
+from docx.opc.pkgwriter import _ContentTypesItem
+from lxml import etree
+
+# iter_docx 每次产出的数据块大小
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# 二进制部件写入压缩流时的切片大小
+_BLOB_SLICE = 1024 * 1024
+
+# 正文序列化结果攒够这么多字节后写入一次压缩流
+_XML_BATCH = 64 * 1024
+
+# 正文序列化时替换 w:body 内容的占位注释
+_MARKER = b"mddocx-body"
+
+_XMLNS = re.compile(rb' xmlns(?::[\w.-]+)?="[^"]*"')
+
+# 已经压缩过的媒体类型，再用 deflate 压缩几乎不会变小
+_COMPRESSED_MEDIA = frozenset(
+    ["image/png", "image/jpeg", "image/gif", "image/webp", "image/x-wdp"]
+)
+
+
+class CompressionProfile(NamedTuple):
+    """DOCX 压缩配置
+
+    Attributes:
+        compression: ZIP 压缩方式
+        level: deflate 压缩级别，None 表示 zlib 默认级别
+        store_media: 已压缩的图片是否直接存储
+    """
+
+    compression: int
+    level: Optional[int]
+    store_media: bool
+
+
+DEFAULT_COMPRESSION = "default"
+
+COMPRESSION_PROFILES: Dict[str, CompressionProfile] = {
+    "default": CompressionProfile(zipfile.ZIP_DEFLATED, None, False),
+    "store": CompressionProfile(zipfile.ZIP_STORED, None, False),
+    "fast": CompressionProfile(zipfile.ZIP_DEFLATED, 1, False),
+    "max": CompressionProfile(zipfile.ZIP_DEFLATED, 9, False),
+    "store-media": CompressionProfile(zipfile.ZIP_DEFLATED, None, True),
+}
+
+
+def get_compression_profile(name: str) -> CompressionProfile:
+    """按名称获取压缩配置
+
+    Args:
+        name: 配置名称，见 COMPRESSION_PROFILES
+
+    Returns:
+        CompressionProfile: 压缩配置
+
+    Raises:
+        ValueError: 未知的配置名称
+    """
+    try:
+        return COMPRESSION_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"未知的压缩配置: {name}，可选: {', '.join(COMPRESSION_PROFILES)}"
+        ) from None
+
+
+class _Sink:
+    """只支持追加写入的缓冲区，供 iter_docx 逐块取出已生成的 ZIP 数据
+
+    没有 seek/tell，ZipFile 会按不可 seek 的流处理（写数据描述符）。
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """取出并清空已写入的数据"""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+def _inherited_declarations(root: etree._Element) -> frozenset:
+    """根元素上的命名空间声明（序列化形式）"""
+    declarations = set()
+    for prefix, uri in root.nsmap.items():
+        name = b"xmlns" if prefix is None else b"xmlns:" + prefix.encode("ascii")
+        declarations.add(b" " + name + b'="' + uri.encode("utf-8") + b'"')
+    return frozenset(declarations)
+
+
+class _ChildSerializer:
+    """单独序列化正文中的块
+
+    lxml 单独序列化子元素时会在其开始标签上重复声明祖先的全部命名空间，
+    这里去掉其中与根元素相同的声明，结果与整篇文档序列化时的片段相同。
+    这些声明对每个块都相同，首次找出后按前缀直接切除，不再逐个匹配。
+    """
+
+    def __init__(self, root: etree._Element) -> None:
+        """初始化
+
+        Args:
+            root: 文档根元素
+        """
+        self._inherited = _inherited_declarations(root)
+        # 紧跟在标签名之后的重复声明
+        self._declarations: Optional[bytes] = None
+
+    def __call__(self, child: etree._Element) -> bytes:
+        """序列化一个块
+
+        Args:
+            child: 正文中的块元素
+
+        Returns:
+            bytes: 序列化结果
+        """
+        data = etree.tostring(child, encoding="UTF-8")
+        # 属性值中的 ">" 会被转义，第一个 ">" 就是开始标签的结尾
+        end = data.index(b">")
+        name_end = data.find(b" ", 0, end)
+        declarations = self._declarations
+        if name_end == -1:
+            return data
+        if declarations and data.startswith(declarations, name_end, end):
+            return data[:name_end] + data[name_end + len(declarations) :]
+
+        matches = [m.group(0) for m in _XMLNS.finditer(data, 0, end)]
+        removed = [m for m in matches if m in self._inherited]
+        if not removed:
+            return data
+        if len(removed) == len(matches):
+            prefix = b"".join(removed)
+            if data.startswith(prefix, name_end):
+                self._declarations = prefix
+        start_tag = _XMLNS.sub(
+            lambda m: b"" if m.group(0) in self._inherited else m.group(0),
+            data[:end],
+        )
+        return start_tag + data[end:]
+
+
+def _split_document(root: etree._Element, body: etree._Element) -> List[bytes]:
+    """序列化正文以外的部分，返回正文内容之前和之后的字节串"""
+    shell = root.makeelement(root.tag, dict(root.attrib), nsmap=root.nsmap)
+    for child in root:
+        if child is body:
+            placeholder = shell.makeelement(body.tag, dict(body.attrib))
+            placeholder.append(etree.Comment(_MARKER.decode("ascii")))
+            shell.append(placeholder)
+        else:
+            shell.append(copy.deepcopy(child))
+    data = etree.tostring(shell, encoding="UTF-8", standalone=True)
+    return data.split(b"<!--" + _MARKER + b"-->")
+
+
+def _zip_info(
+    zf: zipfile.ZipFile, name: str, size: Optional[int] = None, stored: bool = False
+) -> zipfile.ZipInfo:
+    """创建与 ``ZipFile.writestr`` 相同属性的条目信息
+
+    Args:
+        zf: 目标 ZipFile
+        name: 条目名称
+        size: 数据大小，已知时提供，便于决定是否需要 ZIP64
+        stored: 是否不压缩直接存储
+
+    Returns:
+        zipfile.ZipInfo: 条目信息
+    """
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_STORED if stored else zf.compression
+    zinfo._compresslevel = zf.compresslevel
+    zinfo.external_attr = 0o600 << 16
+    if size is not None:
+        zinfo.file_size = size
+    return zinfo
+
+
+def _write_document_xml(zf: zipfile.ZipFile, part: XmlPart) -> Iterator[None]:
+    """逐块序列化并写入正文部件，每写入一批产出一次"""
+    root = part.element
+    body = root.find("{%s}body" % root.nsmap["w"])
+    if body is None:
+        zf.writestr(part.partname.membername, part.blob)
+        return
+    head, tail = _split_document(root, body)
+    serialize = _ChildSerializer(root)
+    with zf.open(_zip_info(zf, part.partname.membername), "w") as f:
+        f.write(head)
+        # 攒够一定大小再写入压缩流，减少逐块调用的开销
+        pending: List[bytes] = []
+        size = 0
+        for child in body:
+            data = serialize(child)
+            pending.append(data)
+            size += len(data)
+            if size >= _XML_BATCH:
+                f.write(b"".join(pending))
+                pending = []
+                size = 0
+                yield
+        pending.append(tail)
+        f.write(b"".join(pending))
+
+
+def _write_blob(zf: zipfile.ZipFile, part: Part, stored: bool) -> Iterator[None]:
+    """按切片写入二进制部件，每写完一个切片产出一次"""
+    blob = memoryview(part.blob)
+    zinfo = _zip_info(zf, part.partname.membername, len(blob), stored)
+    with zf.open(zinfo, "w") as f:
+        for start in range(0, len(blob), _BLOB_SLICE):
+            f.write(blob[start : start + _BLOB_SLICE])
+            yield
+
+
+def _write_package(
+    zf: zipfile.ZipFile, package: OpcPackage, store_media: bool = False
+) -> Iterator[None]:
+    """按 python-docx 的顺序写入包中的各个条目，写入过程中不时产出一次
+
+    Args:
+        zf: 以写模式打开的 ZipFile
+        package: 要写入的包
+        store_media: 已压缩的图片是否直接存储
+    """
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    main_part = package.main_document_part
+
+    zf.writestr(CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob)
+    zf.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+    for part in parts:
+        if part is main_part:
+            yield from _write_document_xml(zf, part)
+        elif isinstance(part, XmlPart):
+            zf.writestr(part.partname.membername, part.blob)
+        else:
+            stored = store_media and part.content_type in _COMPRESSED_MEDIA
+            yield from _write_blob(zf, part, stored)
+        if len(part.rels):
+            zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        yield
+
+
+def save_docx(
+    document: Document,
+    target: Union[str, "os.PathLike[str]", IO[bytes]],
+    compression: str = DEFAULT_COMPRESSION,
+) -> None:
+    """把文档流式写入文件或可写的二进制流
+
+    Args:
+        document: 要保存的文档
+        target: 文件路径，或可写的二进制流（可以不支持 seek）
+        compression: 压缩配置名称，见 COMPRESSION_PROFILES
+
+    Raises:
+        ValueError: 未知的压缩配置
+    """
+    profile = get_compression_profile(compression)
+    with zipfile.ZipFile(
+        target, "w", profile.compression, compresslevel=profile.level
+    ) as zf:
+        for _ in _write_package(zf, document.part.package, profile.store_media):
+            pass
+
+
+def iter_docx(
+    document: Document,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> Iterator[bytes]:
+    """逐块生成文档的 DOCX 数据，适合直接作为 HTTP 响应体
+
+    Args:
+        document: 要保存的文档
+        chunk_size: 每次产出的最小数据量（字节），最后一块可能更小
+        compression: 压缩配置名称，见 COMPRESSION_PROFILES
+
+    Yields:
+        bytes: DOCX 数据块，依次拼接即为完整文件
+    """
+    profile = get_compression_profile(compression)
+    sink = _Sink()
+    with zipfile.ZipFile(
+        sink, "w", profile.compression, compresslevel=profile.level
+    ) as zf:
+        for _ in _write_package(zf, document.part.package, profile.store_media):
+            if sink.size >= chunk_size:
+                yield sink.drain()
+    if sink.size:
+        yield sink.drain()
@@ -0,0 +1,290 @@
+"""
+多进程转换模块，把一个大型文档的各个块分发到进程池中并行转换
+
+输入按 ``streaming.iter_chunks`` 的规则切分为互相独立的顶层块，每个工作进程
+把一个块转换为 WordprocessingML 正文片段，主进程再按原顺序把片段拼接到目标
+文档中：
+
+- 超链接和图片的关系 ID（``r:id`` / ``r:embed``）在目标文档中重新分配；
+- 图片的 ``wp:docPr`` 编号按拼接顺序由目标文档的图片存储重新分配；
+- 工作进程中新建的样式（列表、引用等）在目标文档中缺失时被复制过去；
+- 代码块之间的空行依赖前面是否出现过代码块，在拼接时补齐；
+- 引用式链接的定义预先收集，随每个块一起发送给工作进程。
+
+工作进程使用默认配置的转换器，主进程上通过 ``register_converter`` 注册的
+自定义转换器不会生效。
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Deque, Iterable, List, NamedTuple, Optional, Tuple
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
+
+from .disk_cache import DEFAULT_MAX_BYTES
+from .elements import CodeConverter
+from .image_store import get_image_store
+from .optimize import DEFAULT_DPI, DEFAULT_QUALITY
+from .relations import get_relationship_index
+from .streaming import collect_link_definitions, iter_chunks
+
+if TYPE_CHECKING:
+    from docx.document import Document
+
+    from .base import BaseConverter
+
+# 并行模式下每个块的最小大小（字符数），块太小时进程间通信的开销会超过收益
+MIN_PARALLEL_CHUNK_SIZE = 64 * 1024
+
+_R_NS = "{%s}" % nsmap["r"]
+_DOC_PR = qn("wp:docPr")
+
+
+class ChunkFragment(NamedTuple):
+    """工作进程返回的单个块的转换结果
+
+    Attributes:
+        body: 块的 ``w:body`` 序列化结果（不含 ``w:sectPr``）
+        rels: 按创建顺序排列的新关系 (rId, 关系类型, 外部链接地址或图片数据)
+        styles: 按创建顺序排列的新样式序列化结果
+        first_code: 块内第一个代码块段落在片段中的位置，没有代码块时为 None
+    """
+
+    body: bytes
+    rels: List[Tuple[str, str, object]]
+    styles: List[bytes]
+    first_code: Optional[int]
+
+
+class _ChunkCodeConverter(CodeConverter):
+    """记录块内第一个代码块位置的代码块转换器"""
+
+    def __init__(self, base_converter=None):
+        super().__init__(base_converter)
+        self.first_code = None
+
+    def reset(self):
+        super().reset()
+        self.first_code = None
+
+    def convert(self, token):
+        if self.first_code is None:
+            body = self.document.element.body
+            self.first_code = len(body) - (1 if body.sectPr is not None else 0)
+        return super().convert(token)
+
+
+# 工作进程内复用的转换器
+_worker_converter: Optional["BaseConverter"] = None
+
+
+def _init_worker(
+    debug: bool,
+    fast_xml: bool = False,
+    image_cache_dir: Optional[str] = None,
+    image_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    optimize_images: bool = False,
+    image_dpi: int = DEFAULT_DPI,
+    image_quality: int = DEFAULT_QUALITY,
+) -> None:
+    """工作进程初始化：构建一次转换器，之后每个块只调用 reset()
+
+    各工作进程共用主进程的图片磁盘缓存目录和图片优化设置。
+    """
+    global _worker_converter
+    from .base import BaseConverter
+
+    _worker_converter = BaseConverter(
+        debug=debug,
+        fast_xml=fast_xml,
+        image_cache_dir=image_cache_dir,
+        image_cache_max_bytes=image_cache_max_bytes,
+        optimize_images=optimize_images,
+        image_dpi=image_dpi,
+        image_quality=image_quality,
+    )
+    _worker_converter.register_converter("code", _ChunkCodeConverter(_worker_converter))
+
+
+def _cache_args(converter: "BaseConverter") -> Tuple[Optional[str], int]:
+    """主进程转换器的图片磁盘缓存设置，传给工作进程"""
+    cache = converter.image_cache
+    if cache is None:
+        return None, DEFAULT_MAX_BYTES
+    return str(cache.directory), cache.max_bytes
+
+
+def _optimize_args(converter: "BaseConverter") -> Tuple[bool, int, int]:
+    """主进程转换器的图片优化设置，传给工作进程"""
+    optimizer = converter.image_optimizer
+    if optimizer is None:
+        return False, DEFAULT_DPI, DEFAULT_QUALITY
+    return True, optimizer.dpi, optimizer.quality
+
+
+def _convert_chunk(text: str) -> ChunkFragment:
+    """在工作进程中转换一个块
+
+    Args:
+        text: Markdown 文本块
+
+    Returns:
+        ChunkFragment: 块的转换结果
+    """
+    converter = _worker_converter
+    document = converter.reset()
+    part = document.part
+    base_rels = set(part.rels)
+    base_styles = {style.styleId for style in document.styles.element.style_lst}
+
+    converter.convert(text)
+
+    body = document.element.body
+    if body.sectPr is not None:
+        body.remove(body.sectPr)
+
+    rels: List[Tuple[str, str, object]] = []
+    for r_id, rel in part.rels.items():
+        if r_id in base_rels:
+            continue
+        if rel.is_external:
+            rels.append((r_id, rel.reltype, rel.target_ref))
+        elif rel.reltype == RT.IMAGE:
+            rels.append((r_id, rel.reltype, rel.target_part.blob))
+
+    styles = [
+        etree.tostring(style)
+        for style in document.styles.element.style_lst
+        if style.styleId not in base_styles
+    ]
+
+    return ChunkFragment(
+        etree.tostring(body),
+        rels,
+        styles,
+        converter.converters["code"].first_code,
+    )
+
+
+def _splice(document: "Document", fragment: ChunkFragment, had_code: bool) -> None:
+    """把一个块的转换结果按顺序拼接到目标文档
+
+    Args:
+        document: 目标文档
+        fragment: 块的转换结果
+        had_code: 目标文档中此前是否已有代码块
+    """
+
+    # 复制缺失的样式
+    styles_element = document.styles.element
+    style_ids = {style.styleId for style in styles_element.style_lst}
+    for style_xml in fragment.styles:
+        style = parse_xml(style_xml)
+        if style.get(qn("w:styleId")) not in style_ids:
+            styles_element.append(style)
+
+    # 在目标文档中重新建立关系
+    rid_map = {}
+    relationships = get_relationship_index(document)
+    images = get_image_store(document)
+    for r_id, reltype, target in fragment.rels:
+        if reltype == RT.IMAGE:
+            rid_map[r_id] = images.add(target).r_id
+        else:
+            rid_map[r_id] = relationships.external(target, reltype)
+
+    elements = list(parse_xml(fragment.body))
+
+    # 前面的块已经出现过代码块时，串行转换会在第一个代码块前加一个空段落
+    if had_code and fragment.first_code is not None:
+        elements.insert(fragment.first_code, OxmlElement("w:p"))
+
+    body = document.element.body
+    sect_pr = body.sectPr
+    for element in elements:
+        for node in element.iter():
+            for name, value in node.attrib.items():
+                if name.startswith(_R_NS) and value in rid_map:
+                    node.set(name, rid_map[value])
+            if node.tag == _DOC_PR:
+                # 与串行转换共用编号，同一文档交替两种方式转换时编号不重复
+                shape_id = images.next_shape_id()
+                node.set("id", str(shape_id))
+                node.set("name", "Picture %d" % shape_id)
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def default_workers() -> int:
+    """默认的工作进程数量（CPU 核心数）"""
+    return os.cpu_count() or 1
+
+
+def convert_parallel(
+    converter: "BaseConverter",
+    lines: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = MIN_PARALLEL_CHUNK_SIZE,
+) -> "Document":
+    """使用进程池把 Markdown 转换到转换器的当前文档
+
+    同时提交的块数量有上限，输入可以是惰性读取的文件，结果按原顺序拼接。
+
+    Args:
+        converter: 目标转换器，结果写入 ``converter.document``
+        lines: Markdown 文本或行的可迭代对象
+        workers: 工作进程数量，默认为 CPU 核心数，为 1 时在当前进程中逐块转换
+        chunk_size: 目标块大小（字符数）
+
+    Returns:
+        Document: 生成的 DOCX 文档
+    """
+    workers = workers or default_workers()
+    if workers <= 1:
+        return converter.convert_stream(lines, chunk_size)
+    lines, definitions = collect_link_definitions(lines)
+
+    start = time.perf_counter()
+    document = converter.document
+    code_converter = converter.converters.get("code")
+    had_code = bool(getattr(code_converter, "_last_was_code", False))
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(
+            converter.debug,
+            converter.fast_xml,
+            *_cache_args(converter),
+            *_optimize_args(converter),
+        ),
+    ) as executor:
+        for chunk in iter_chunks(lines, chunk_size):
+            pending.append(executor.submit(_convert_chunk, definitions + chunk))
+            # 限制同时在途的块数量，按顺序拼接已完成的块
+            while len(pending) > workers * 2:
+                had_code = _splice_next(document, pending.popleft(), had_code)
+        while pending:
+            had_code = _splice_next(document, pending.popleft(), had_code)
+
+    if code_converter is not None and had_code:
+        code_converter._last_was_code = True
+    # 解析在工作进程中进行，整体耗时计入生成阶段
+    if converter.stats is not None:
+        converter.stats.emit_time += time.perf_counter() - start
+    return document
+
+
+def _splice_next(document: "Document", future: Future, had_code: bool) -> bool:
+    """等待一个块完成并拼接，返回拼接后文档中是否已有代码块"""
+    fragment = future.result()
+    _splice(document, fragment, had_code)
+    return had_code or fragment.first_code is not None
@@ -0,0 +1,71 @@
+"""
+Markdown 解析器缓存模块
+
+构建 ``MarkdownIt`` 实例需要编译全部规则链，开销远大于一次普通的查找。
+这里按配置缓存已构建的解析器，供转换器、Web 预览和批量转换在整个进程内复用。
+缓存的解析器是共享对象，调用方不应再对其调用 ``enable``/``disable``/``use``。
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from markdown_it import MarkdownIt
+
+# 转换器使用的解析配置
+CONVERTER_PRESET = "commonmark"
+CONVERTER_OPTIONS: Dict[str, Any] = {"breaks": True, "html": True}  # 启用HTML支持
+CONVERTER_RULES: Tuple[str, ...] = ("strikethrough", "emphasis", "table")
+
+_cache: Dict[Hashable, MarkdownIt] = {}
+_lock = threading.Lock()
+
+
+def get_parser(
+    preset: str = "commonmark",
+    options: Optional[Dict[str, Any]] = None,
+    enable: Iterable[str] = (),
+    plugins: Iterable[Callable[..., Any]] = (),
+) -> MarkdownIt:
+    """获取（必要时构建）指定配置的解析器
+
+    Args:
+        preset: markdown-it 预设名称
+        options: 覆盖预设的选项，值必须可哈希
+        enable: 需要额外启用的规则名称
+        plugins: 依次通过 ``MarkdownIt.use`` 加载的插件
+
+    Returns:
+        MarkdownIt: 进程内共享的解析器实例
+    """
+    options = options or {}
+    enable = tuple(sorted(set(enable)))
+    plugins = tuple(plugins)
+    key = (preset, tuple(sorted(options.items())), enable, plugins)
+
+    parser = _cache.get(key)
+    if parser is None:
+        with _lock:
+            parser = _cache.get(key)
+            if parser is None:
+                parser = MarkdownIt(preset, dict(options) if options else None)
+                if enable:
+                    parser.enable(list(enable))
+                for plugin in plugins:
+                    parser.use(plugin)
+                _cache[key] = parser
+    return parser
+
+
+def get_converter_parser() -> MarkdownIt:
+    """获取转换器使用的解析器（CommonMark + 换行、HTML、删除线、表格）
+
+    Returns:
+        MarkdownIt: 进程内共享的解析器实例
+    """
+    return get_parser(CONVERTER_PRESET, CONVERTER_OPTIONS, CONVERTER_RULES)
+
+
+def clear_parser_cache() -> None:
+    """清空解析器缓存"""
+    with _lock:
+        _cache.clear()
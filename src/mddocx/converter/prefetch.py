@@ -0,0 +1,208 @@
+"""
+在线图片预取模块
+
+图片转换器在生成阶段遇到在线图片时逐个调用 ``requests.get``，每张图片都要
+等待一次完整的往返，并且每次都新建 TCP/TLS 连接。
+
+预取在解析之后、生成之前进行：先从 token 流中收集全部在线图片地址，再通过
+有界线程池并发下载，所有线程共用一个带连接池的 ``requests.Session``。生成
+阶段只从图片转换器的缓存中读取已经下载好的数据。
+
+设置磁盘缓存（DiskImageCache）后，已缓存的图片用 ETag/Last-Modified 发送
+条件请求，服务器返回 304 时直接使用缓存的数据（映射缓存文件，不复制）。
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..log import debug_enabled, with_debug_scope
+from .disk_cache import DiskImageCache
+
+logger = logging.getLogger(__name__)
+
+# 在线图片地址的前缀，与图片转换器的判断一致
+REMOTE_PREFIXES = ("http://", "https://")
+
+# 默认的下载线程数
+DEFAULT_WORKERS = 8
+
+
+def iter_image_tokens(tokens: Iterable[Any]) -> Iterator[Any]:
+    """按出现顺序遍历 token 流中带属性的图片 token（包括行内子 token）
+
+    Args:
+        tokens: markdown-it 解析得到的 token 列表
+
+    Yields:
+        Any: 图片 token
+    """
+    for token in tokens:
+        for image in (token, *(token.children or ())):
+            if image.type == "image" and image.attrs:
+                yield image
+
+
+def iter_image_sources(tokens: Iterable[Any]) -> Iterator[str]:
+    """按出现顺序遍历 token 流中的图片地址（可能重复）
+
+    Args:
+        tokens: markdown-it 解析得到的 token 列表
+
+    Yields:
+        str: 图片地址
+    """
+    for image in iter_image_tokens(tokens):
+        yield image.attrs.get("src", "")
+
+
+def remote_image_sources(tokens: Iterable[Any]) -> List[str]:
+    """收集 token 流中的在线图片地址，去重并保持首次出现的顺序
+
+    Args:
+        tokens: markdown-it 解析得到的 token 列表
+
+    Returns:
+        List[str]: 在线图片地址列表
+    """
+    return list(
+        dict.fromkeys(
+            src for src in iter_image_sources(tokens) if src.startswith(REMOTE_PREFIXES)
+        )
+    )
+
+
+class Fetched(NamedTuple):
+    """一张在线图片的下载结果"""
+
+    # 下载的数据，或映射磁盘缓存文件的只读视图
+    data: Union[bytes, memoryview]
+    # 是否来自磁盘缓存（服务器确认未修改，或请求失败时使用缓存）
+    cached: bool = False
+
+
+class ImagePrefetcher:
+    """并发下载在线图片
+
+    会话在首次下载时创建，连接池大小与线程数相同，同一主机的连接在图片之间
+    和文档之间复用。
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        timeout: float = 10,
+        session: Optional[requests.Session] = None,
+        cache: Optional[DiskImageCache] = None,
+    ) -> None:
+        """初始化预取器
+
+        Args:
+            max_workers: 最大下载线程数
+            timeout: 单个请求的超时时间（秒），与逐个下载时相同
+            session: 使用的会话，为 None 时创建带连接池的会话
+            cache: 磁盘缓存，为 None 时不使用
+
+        Raises:
+            ValueError: 线程数小于 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"下载线程数必须大于 0，得到 {max_workers}")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._session = session
+        self.cache = cache
+
+    @property
+    def session(self) -> requests.Session:
+        """下载使用的会话"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.max_workers, pool_maxsize=self.max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def fetch(self, urls: List[str]) -> Dict[str, Optional[Fetched]]:
+        """并发下载图片
+
+        Args:
+            urls: 图片地址列表（不应重复）
+
+        Returns:
+            Dict[str, Optional[Fetched]]: 地址到下载结果的映射，下载失败或状态码
+            不是 200 时为 None
+        """
+        if not urls:
+            return {}
+        # 会话在主线程中创建，所有下载线程共用
+        fetch_one = with_debug_scope(partial(self._fetch_one, self.session))
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mddocx-prefetch"
+        ) as executor:
+            return dict(zip(urls, executor.map(fetch_one, urls)))
+
+    def _fetch_one(self, session: requests.Session, url: str) -> Optional[Fetched]:
+        """下载单张图片，有缓存时先重新验证，失败时返回 None"""
+        cache = self.cache
+        entry = cache.lookup(url) if cache is not None else None
+        try:
+            if entry is not None:
+                response = session.get(
+                    url, timeout=self.timeout, headers=cache.validators(entry)
+                )
+                if response.status_code == 304:
+                    data = cache.map(entry)
+                    if data is not None:
+                        return Fetched(data, cached=True)
+                    # 图片刚被淘汰，重新下载
+                    response = session.get(url, timeout=self.timeout)
+            else:
+                response = session.get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                data = response.content
+                if cache is not None:
+                    self._store(url, response)
+                return Fetched(data)
+            if debug_enabled():
+                logger.debug("下载图片失败: %s 状态码 %s", url, response.status_code)
+        except requests.RequestException as e:
+            if debug_enabled():
+                logger.debug("下载图片失败: %s %s", url, e)
+            # 无法连接时使用缓存中的旧数据
+            if entry is not None:
+                data = cache.map(entry)
+                if data is not None:
+                    return Fetched(data, cached=True)
+        except OSError as e:
+            # 磁盘缓存以外的本地错误，按下载失败处理
+            if debug_enabled():
+                logger.debug("读取图片缓存失败: %s %s", url, e)
+        return None
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        """把下载结果写入磁盘缓存，写入失败不影响本次转换"""
+        try:
+            self.cache.store(
+                url,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        except OSError as e:
+            if debug_enabled():
+                logger.debug("写入图片缓存失败: %s %s", url, e)
+
+    def close(self) -> None:
+        """关闭会话及其连接"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
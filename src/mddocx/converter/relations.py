@@ -0,0 +1,133 @@
+"""
+关系索引模块
+
+python-docx 的 ``part.relate_to(url, reltype, is_external=True)`` 先遍历部件
+的全部关系查找相同的外部链接，找不到时再从 rId1 开始逐个试探下一个可用的
+rId，两步都与已有关系数量成正比，链接密集的文档因此是平方复杂度。
+
+关系索引挂在每个文档部件上，按 (关系类型, 链接地址) 和 (关系类型, 目标部件)
+记录 rId，并记住下一个可用 rId 的位置，已有关系和新关系都能直接得到 rId。
+通过 python-docx 其他接口新增的关系会在下次查找前补进索引。
+"""
+
+from itertools import islice
+from typing import Dict, Tuple
+
+from docx.document import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import Part
+
+# 索引在文档部件上的属性名
+_ATTR = "_mddocx_relationship_index"
+
+
+class RelationshipIndex:
+    """单个部件的关系索引
+
+    只会追加关系，不处理删除：关系被删除后需要调用 ``clear``。
+    """
+
+    def __init__(self, part: Part) -> None:
+        """初始化关系索引
+
+        Args:
+            part: 关系所属的部件
+        """
+        self.part = part
+        self._rels = part.rels
+        self._external: Dict[Tuple[str, str], str] = {}
+        self._internal: Dict[Tuple[str, Part], str] = {}
+        # 已编入索引的关系数量，关系集合按插入顺序排列
+        self._indexed = 0
+        # 下一个待试探的 rId 编号
+        self._next = 1
+
+    def clear(self) -> None:
+        """清空索引，下次查找时重新建立"""
+        self._external.clear()
+        self._internal.clear()
+        self._indexed = 0
+        self._next = 1
+
+    def _sync(self) -> None:
+        """把索引之后新增的关系补进索引"""
+        rels = self._rels
+        if len(rels) == self._indexed:
+            return
+        # 与 python-docx 相同，同一目标有多个关系时使用第一个
+        for rel in islice(rels.values(), self._indexed, None):
+            if rel.is_external:
+                self._external.setdefault((rel.reltype, rel.target_ref), rel.rId)
+            else:
+                self._internal.setdefault((rel.reltype, rel.target_part), rel.rId)
+        self._indexed = len(rels)
+
+    def _next_rid(self) -> str:
+        """下一个可用的 rId，与 python-docx 一样取最小的未使用编号"""
+        rels = self._rels
+        n = self._next
+        while f"rId{n}" in rels:
+            n += 1
+        self._next = n + 1
+        return f"rId{n}"
+
+    def external(self, target: str, reltype: str = RT.HYPERLINK) -> str:
+        """获取指向外部地址的关系 rId，不存在时创建
+
+        结果与 ``part.relate_to(target, reltype, is_external=True)`` 相同。
+
+        Args:
+            target: 外部地址，例如超链接 URL
+            reltype: 关系类型，默认为超链接
+
+        Returns:
+            str: 关系 rId
+        """
+        self._sync()
+        key = (reltype, target)
+        r_id = self._external.get(key)
+        if r_id is None:
+            r_id = self._next_rid()
+            self._rels.add_relationship(reltype, target, r_id, is_external=True)
+            self._external[key] = r_id
+            self._indexed += 1
+        return r_id
+
+    def internal(self, target: Part, reltype: str) -> str:
+        """获取指向包内部件的关系 rId，不存在时创建
+
+        结果与 ``part.relate_to(target, reltype)`` 相同。
+
+        Args:
+            target: 目标部件，例如图片部件
+            reltype: 关系类型
+
+        Returns:
+            str: 关系 rId
+        """
+        self._sync()
+        key = (reltype, target)
+        r_id = self._internal.get(key)
+        if r_id is None:
+            r_id = self._next_rid()
+            self._rels.add_relationship(reltype, target, r_id)
+            self._internal[key] = r_id
+            self._indexed += 1
+        return r_id
+
+
+def get_relationship_index(document: Document) -> RelationshipIndex:
+    """获取文档正文部件的关系索引，首次访问时创建并挂在部件上
+
+    Args:
+        document: 目标文档
+
+    Returns:
+        RelationshipIndex: 该文档的关系索引
+    """
+    part = document.part
+    index = getattr(part, _ATTR, None)
+    if index is None:
+        index = RelationshipIndex(part)
+        setattr(part, _ATTR, index)
+    return index
@@ -0,0 +1,184 @@
+"""
+转换统计模块，记录一次转换各阶段的耗时和生成的元素数量
+"""
+
+from typing import Any, Dict, List
+
+from docx.oxml.ns import qn
+
+from .dispatch import HandlerStats
+
+_P = qn("w:p")
+_R = qn("w:r")
+_TBL = qn("w:tbl")
+_INLINE = qn("wp:inline")
+_ANCHOR = qn("wp:anchor")
+
+
+class ConversionStats:
+    """一次转换的统计信息
+
+    在 ``BaseConverter(profile=True)`` 时收集，通过
+    ``BaseConverter.get_stats()`` 获取。耗时单位均为秒。
+
+    Attributes:
+        parse_time: Markdown 解析耗时
+        fetch_time: 生成之前并发下载在线图片（预取）的耗时
+        optimize_time: 生成之前并行缩小、重新压缩图片的耗时
+        emit_time: 按 token 生成文档内容的耗时（包含各处理函数）
+        save_time: ``BaseConverter.save`` 保存（打包 ZIP）的耗时
+        handlers: 各 token 处理函数的调用次数和耗时
+        paragraphs: 文档中的段落数量（包含表格单元格中的段落）
+        runs: 文本块数量
+        tables: 表格数量
+        images: 图片数量
+        bytes_fetched: 下载在线图片的字节数
+        bytes_read: 读取本地图片的字节数
+        image_cache_hits: 从磁盘缓存取得（服务器确认未修改）的在线图片数量
+        memory_cache_hits: 图片内存缓存命中次数
+        memory_cache_misses: 图片内存缓存未命中次数
+        memory_cache_evictions: 超过大小上限时从图片内存缓存淘汰的图片数量
+        memory_cache_bytes: 图片内存缓存当前占用的字节数
+        images_optimized: 缩小或重新压缩后变小的图片数量
+        image_bytes_saved: 图片优化节省的字节数
+        images_deduplicated: 与已有图片重复、共用图片部件的图片数量
+        image_bytes_deduplicated: 重复图片因共用图片部件节省的字节数
+    """
+
+    def __init__(self) -> None:
+        self.parse_time = 0.0
+        self.fetch_time = 0.0
+        self.optimize_time = 0.0
+        self.emit_time = 0.0
+        self.save_time = 0.0
+        self.handlers: Dict[str, HandlerStats] = {}
+        self.paragraphs = 0
+        self.runs = 0
+        self.tables = 0
+        self.images = 0
+        self.bytes_fetched = 0
+        self.bytes_read = 0
+        self.image_cache_hits = 0
+        self.memory_cache_hits = 0
+        self.memory_cache_misses = 0
+        self.memory_cache_evictions = 0
+        self.memory_cache_bytes = 0
+        self.images_optimized = 0
+        self.image_bytes_saved = 0
+        self.images_deduplicated = 0
+        self.image_bytes_deduplicated = 0
+
+    @property
+    def total_time(self) -> float:
+        """解析、下载、优化、生成和保存的总耗时"""
+        return (
+            self.parse_time
+            + self.fetch_time
+            + self.optimize_time
+            + self.emit_time
+            + self.save_time
+        )
+
+    def count_elements(self, document: Any) -> None:
+        """统计文档正文中的段落、文本块、表格和图片数量
+
+        Args:
+            document: DOCX 文档
+        """
+        paragraphs = runs = tables = images = 0
+        for element in document.element.body.iter(_P, _R, _TBL, _INLINE, _ANCHOR):
+            tag = element.tag
+            if tag == _P:
+                paragraphs += 1
+            elif tag == _R:
+                runs += 1
+            elif tag == _TBL:
+                tables += 1
+            else:
+                images += 1
+        self.paragraphs = paragraphs
+        self.runs = runs
+        self.tables = tables
+        self.images = images
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可序列化为 JSON 的字典
+
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        return {
+            "parse_time": self.parse_time,
+            "fetch_time": self.fetch_time,
+            "optimize_time": self.optimize_time,
+            "emit_time": self.emit_time,
+            "save_time": self.save_time,
+            "total_time": self.total_time,
+            "handlers": {
+                name: stat.to_dict() for name, stat in sorted(self.handlers.items())
+            },
+            "paragraphs": self.paragraphs,
+            "runs": self.runs,
+            "tables": self.tables,
+            "images": self.images,
+            "bytes_fetched": self.bytes_fetched,
+            "bytes_read": self.bytes_read,
+            "image_cache_hits": self.image_cache_hits,
+            "memory_cache_hits": self.memory_cache_hits,
+            "memory_cache_misses": self.memory_cache_misses,
+            "memory_cache_evictions": self.memory_cache_evictions,
+            "memory_cache_bytes": self.memory_cache_bytes,
+            "images_optimized": self.images_optimized,
+            "image_bytes_saved": self.image_bytes_saved,
+            "images_deduplicated": self.images_deduplicated,
+            "image_bytes_deduplicated": self.image_bytes_deduplicated,
+        }
+
+    def format(self) -> str:
+        """生成便于阅读的统计报告
+
+        Returns:
+            str: 多行文本报告
+        """
+        lines: List[str] = [
+            "转换统计:",
+            f"  解析     {self.parse_time * 1000:10.2f} ms",
+            f"  下载     {self.fetch_time * 1000:10.2f} ms",
+            f"  优化     {self.optimize_time * 1000:10.2f} ms",
+            f"  生成     {self.emit_time * 1000:10.2f} ms",
+            f"  保存     {self.save_time * 1000:10.2f} ms",
+            f"  总计     {self.total_time * 1000:10.2f} ms",
+        ]
+        if self.handlers:
+            lines.append("处理函数:")
+            ordered = sorted(
+                self.handlers.values(), key=lambda s: s.total_time, reverse=True
+            )
+            for stat in ordered:
+                lines.append(
+                    f"  {stat.name:<12} {stat.calls:>8} 次 {stat.total_time * 1000:10.2f} ms"
+                )
+        lines.extend(
+            [
+                "文档内容:",
+                f"  段落 {self.paragraphs}，文本块 {self.runs}，"
+                f"表格 {self.tables}，图片 {self.images}",
+                f"  下载图片 {self.bytes_fetched} 字节，读取本地图片 {self.bytes_read} 字节，"
+                f"磁盘缓存命中 {self.image_cache_hits} 张",
+                f"  内存缓存命中 {self.memory_cache_hits} 次，"
+                f"未命中 {self.memory_cache_misses} 次，"
+                f"淘汰 {self.memory_cache_evictions} 张，"
+                f"占用 {self.memory_cache_bytes} 字节",
+                f"  优化图片 {self.images_optimized} 张，"
+                f"节省 {self.image_bytes_saved} 字节",
+                f"  重复图片 {self.images_deduplicated} 张，"
+                f"节省 {self.image_bytes_deduplicated} 字节",
+            ]
+        )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionStats(parse_time={self.parse_time:.6f}, "
+            f"emit_time={self.emit_time:.6f}, save_time={self.save_time:.6f})"
+        )
@@ -0,0 +1,205 @@
+"""
+流式分块模块，把大型 Markdown 输入切分为可独立解析的块
+
+只在顶层块之间的空行处切分：代码围栏、可跨空行的 HTML 块、列表以及
+缩进内容内部都不会被切开。每个块单独解析和输出，解析得到的 token
+在块处理完后即可释放，因此峰值内存取决于块大小而不是整个输入的大小。
+
+引用式链接的定义（``[id]: url``）可能与使用处不在同一块：
+``collect_link_definitions`` 先逐行扫描一遍输入，收集顶层的单行定义，
+转换时加在每个块的前面。定义不产生
+任何输出，同一标签以文档中第一个定义为准，与整体转换一致。无法重复读取的
+输入（例如管道）不预先扫描，定义只在其所在的块内生效。
+"""
+
+import logging
+import re
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# 默认块大小（字符数）
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# 代码围栏开始/结束
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+# 列表项标记
+_LIST_MARKER_RE = re.compile(r"^(?:[-+*]|\d{1,9}[.)])(?:[ \t]|$)")
+# 可以跨越空行的 HTML 块（CommonMark 类型 1-5）及其结束标记
+_HTML_BLOCK_STARTS: Tuple[Tuple["re.Pattern[str]", str], ...] = (
+    (re.compile(r"^ {0,3}<(?:script|pre|style|textarea)(?:\s|>|$)", re.I), ""),
+    (re.compile(r"^ {0,3}<!--"), "-->"),
+    (re.compile(r"^ {0,3}<\?"), "?>"),
+    (re.compile(r"^ {0,3}<![A-Za-z]"), ">"),
+    (re.compile(r"^ {0,3}<!\[CDATA\["), "]]>"),
+)
+_HTML_TYPE1_END_RE = re.compile(r"</(?:script|pre|style|textarea)>", re.I)
+# 单行的引用式链接定义，捕获标签
+_LINK_DEF_RE = re.compile(r"^ {0,3}\[((?:[^\[\]\\]|\\.)+)\]:[ \t]*\S")
+
+
+class BlockSplitter:
+    """逐行扫描 Markdown，判断每一行是否可以作为新块的开始"""
+
+    def __init__(self) -> None:
+        # 当前代码围栏的 (字符, 长度)，不在围栏内时为 None
+        self._fence: Optional[Tuple[str, int]] = None
+        # 当前 HTML 块的结束标记，不在 HTML 块内时为 None（"" 表示类型 1）
+        self._html_end: Optional[str] = None
+        self._previous_blank = False
+
+    def is_boundary(self, line: str) -> bool:
+        """处理一行并返回在该行之前切分是否安全
+
+        Args:
+            line: 输入行（可以带换行符）
+
+        Returns:
+            bool: 该行是否开始一个新的顶层块
+        """
+        stripped = line.rstrip("\r\n")
+
+        if self._fence is not None:
+            self._close_fence(stripped)
+            self._previous_blank = False
+            return False
+
+        if self._html_end is not None:
+            self._close_html(stripped)
+            self._previous_blank = False
+            return False
+
+        if not stripped.strip():
+            self._previous_blank = True
+            return False
+
+        boundary = (
+            self._previous_blank
+            and not stripped[0].isspace()
+            and not _LIST_MARKER_RE.match(stripped)
+        )
+        self._previous_blank = False
+        self._open_block(stripped)
+        return boundary
+
+    def _open_block(self, line: str) -> None:
+        """检查该行是否开始代码围栏或跨空行的 HTML 块"""
+        match = _FENCE_RE.match(line)
+        if match:
+            marker = match.group(1)
+            # 反引号围栏的信息字符串中不能包含反引号
+            if marker[0] != "`" or "`" not in match.group(2):
+                self._fence = (marker[0], len(marker))
+            return
+
+        for pattern, end in _HTML_BLOCK_STARTS:
+            if pattern.match(line):
+                self._html_end = end
+                self._close_html(line)
+                return
+
+    def _close_fence(self, line: str) -> None:
+        """检查该行是否结束当前代码围栏"""
+        match = _FENCE_RE.match(line)
+        if not match or match.group(2).strip():
+            return
+        char, length = self._fence
+        marker = match.group(1)
+        if marker[0] == char and len(marker) >= length:
+            self._fence = None
+
+    def _close_html(self, line: str) -> None:
+        """检查该行是否结束当前 HTML 块"""
+        if self._html_end == "":
+            ended = _HTML_TYPE1_END_RE.search(line) is not None
+        else:
+            ended = self._html_end in line
+        if ended:
+            self._html_end = None
+
+
+def iter_chunks(
+    lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """把 Markdown 行流切分为可独立解析的块
+
+    Args:
+        lines: Markdown 行的可迭代对象（例如打开的文本文件）
+        chunk_size: 目标块大小（字符数），块只会在安全的边界处结束，
+            因此单个不可切分的块可能超过该大小
+
+    Yields:
+        str: Markdown 文本块
+    """
+    splitter = BlockSplitter()
+    buffer: List[str] = []
+    size = 0
+    for line in lines:
+        if splitter.is_boundary(line) and size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+        buffer.append(line)
+        size += len(line)
+    if buffer:
+        yield "".join(buffer)
+
+
+def scan_link_definitions(lines: Iterable[str]) -> str:
+    """扫描 Markdown 行流，收集顶层的引用式链接定义
+
+    只识别写在一行内、位于文档开头、空行之后或紧跟其他定义的定义，
+    代码围栏和 HTML 块中的内容不计入。同一标签（不区分大小写）只保留第一个。
+
+    Args:
+        lines: Markdown 行的可迭代对象
+
+    Returns:
+        str: 定义文本，每行一个定义并以空行结尾，没有定义时为空字符串
+    """
+    splitter = BlockSplitter()
+    definitions: List[str] = []
+    labels = set()
+    # 文档开头与空行之后一样可以开始定义
+    previous = True
+    for line in lines:
+        boundary = splitter.is_boundary(line)
+        match = _LINK_DEF_RE.match(line) if boundary or previous else None
+        previous = match is not None
+        if match:
+            label = " ".join(match.group(1).split()).casefold()
+            if label not in labels:
+                labels.add(label)
+                definitions.append(line.rstrip("\r\n") + "\n")
+    if not definitions:
+        return ""
+    definitions.append("\n")
+    return "".join(definitions)
+
+
+def collect_link_definitions(
+    lines: Union[str, Iterable[str], IO[str]]
+) -> Tuple[Iterable[str], str]:
+    """为分块转换预先收集输入中的引用式链接定义
+
+    文本和行列表直接扫描；可 seek 的文件扫描后回到原来的位置；其他只能
+    读取一次的输入不扫描，并记录一条警告。
+
+    Args:
+        lines: Markdown 文本、行列表或打开的文本文件
+
+    Returns:
+        Tuple[Iterable[str], str]: 用于分块的行，以及要加在每个块前面的定义文本
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines(keepends=True)
+    if isinstance(lines, (list, tuple)):
+        return lines, scan_link_definitions(lines)
+    seekable = getattr(lines, "seekable", None)
+    if seekable is not None and seekable():
+        position = lines.tell()
+        definitions = scan_link_definitions(lines)
+        lines.seek(position)
+        return lines, definitions
+    logger.warning("输入无法重复读取，引用式链接的定义只在其所在的块内生效")
+    return lines, ""
@@ -0,0 +1,201 @@
+"""
+样式注册表模块
+
+python-docx 的 ``styles[name]``、``name in styles`` 以及给段落、文本块设置
+样式时的 ID 解析都是在样式表中线性查找，内置模板就有一百多个样式，而列表项、
+引用和标题每个段落都要查找一次。样式注册表挂在每个文档上，样式按名称
+解析（必要时创建）一次，之后直接返回缓存的样式对象和样式 ID。
+
+解析样式 ID 和判断样式是否存在都是只读查找，文档的样式表与模板共用时
+（见 ``template`` 模块）不会因此被复制。
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.styles import CT_Style, CT_Styles
+from docx.styles import BabelFish
+from docx.styles.style import BaseStyle, StyleFactory
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+# 注册表在文档部件上的属性名
+_ATTR = "_mddocx_style_registry"
+
+
+class StyleRegistry:
+    """单个文档的样式缓存
+
+    只缓存已找到的样式；不存在的样式不做缓存，因此之后通过 python-docx
+    直接添加的样式也能被找到。样式被删除或改名后需要调用 ``clear``。
+    """
+
+    def __init__(self, document: Document) -> None:
+        """初始化样式注册表
+
+        Args:
+            document: 目标文档
+        """
+        self.document = document
+        self._part = document.part._styles_part
+        self._styles: Dict[str, BaseStyle] = {}
+        self._ids: Dict[Tuple[str, WD_STYLE_TYPE], Optional[str]] = {}
+        self._defaults: Dict[WD_STYLE_TYPE, Optional[str]] = {}
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._styles.clear()
+        self._ids.clear()
+        self._defaults.clear()
+
+    def find(self, name: str) -> Optional[BaseStyle]:
+        """按界面名称查找样式
+
+        Args:
+            name: 样式名称，例如 "Heading 1"
+
+        Returns:
+            Optional[BaseStyle]: 样式对象，不存在时返回 None
+        """
+        style = self._styles.get(name)
+        if style is None:
+            if self._find_element(name) is None:
+                return None
+            # 返回的样式对象可以修改，取文档自己的样式表
+            element = self._part.element.get_by_name(BabelFish.ui2internal(name))
+            style = self._styles[name] = StyleFactory(element)
+        return style
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._styles or self._find_element(name) is not None
+
+    def __getitem__(self, name: str) -> BaseStyle:
+        style = self.find(name)
+        if style is None:
+            raise KeyError(f"no style with name '{name}'")
+        return style
+
+    def ensure(
+        self,
+        name: str,
+        style_type: WD_STYLE_TYPE,
+        configure: Optional[Callable[[BaseStyle], None]] = None,
+    ) -> None:
+        """确保样式存在，不存在时创建
+
+        Args:
+            name: 样式名称
+            style_type: 样式类型
+            configure: 新建样式后用于设置格式的函数，已存在的样式不会再调用
+        """
+        if name in self:
+            return
+        style = self.document.styles.add_style(name, style_type)
+        if configure is not None:
+            configure(style)
+        self._styles[name] = style
+
+    def style_id(
+        self, name: str, style_type: WD_STYLE_TYPE = WD_STYLE_TYPE.PARAGRAPH
+    ) -> Optional[str]:
+        """获取用于 pStyle/rStyle/tblStyle 的样式 ID
+
+        与 python-docx 设置 ``.style`` 时的解析规则相同：该类型的默认样式返回
+        None，样式类型不符时抛出 ValueError。
+
+        Args:
+            name: 样式名称
+            style_type: 样式类型
+
+        Returns:
+            Optional[str]: 样式 ID
+
+        Raises:
+            KeyError: 样式不存在
+            ValueError: 样式类型不符
+        """
+        key = (name, style_type)
+        try:
+            return self._ids[key]
+        except KeyError:
+            pass
+        element = self._find_element(name)
+        if element is None:
+            raise KeyError(f"no style with name '{name}'")
+        # 只读取类型和 ID，不保留这个样式对象
+        style = StyleFactory(element)
+        if style.type != style_type:
+            raise ValueError(
+                f"assigned style is type {style.type}, need type {style_type}"
+            )
+        style_id = (
+            None if style.style_id == self._default_id(style_type) else style.style_id
+        )
+        self._ids[key] = style_id
+        return style_id
+
+    def _default_id(self, style_type: WD_STYLE_TYPE) -> Optional[str]:
+        """该类型默认样式的 ID"""
+        try:
+            return self._defaults[style_type]
+        except KeyError:
+            default = self._lookup_element().default_for(style_type)
+            style_id = self._defaults[style_type] = (
+                default.styleId if default is not None else None
+            )
+            return style_id
+
+    def _lookup_element(self) -> CT_Styles:
+        """只读查找使用的样式表元素，与模板共用时不复制"""
+        element = getattr(self._part, "read_element", None)
+        return element if element is not None else self._part.element
+
+    def _find_element(self, name: str) -> Optional[CT_Style]:
+        """按界面名称只读查找样式元素"""
+        return self._lookup_element().get_by_name(BabelFish.ui2internal(name))
+
+    def apply_paragraph_style(self, paragraph: Paragraph, name: str) -> None:
+        """设置段落样式，等价于 ``paragraph.style = name``
+
+        Args:
+            paragraph: 段落
+            name: 段落样式名称
+        """
+        paragraph._p.style = self.style_id(name, WD_STYLE_TYPE.PARAGRAPH)
+
+    def apply_run_style(self, run: Run, name: str) -> None:
+        """设置文本块的字符样式，等价于 ``run.style = name``
+
+        Args:
+            run: 文本块
+            name: 字符样式名称
+        """
+        run._r.style = self.style_id(name, WD_STYLE_TYPE.CHARACTER)
+
+    def apply_table_style(self, table: Table, name: str) -> None:
+        """设置表格样式，等价于 ``table.style = name``
+
+        Args:
+            table: 表格
+            name: 表格样式名称
+        """
+        table._tbl.tblStyle_val = self.style_id(name, WD_STYLE_TYPE.TABLE)
+
+
+def get_style_registry(document: Document) -> StyleRegistry:
+    """获取文档的样式注册表，首次访问时创建并挂在文档部件上
+
+    Args:
+        document: 目标文档
+
+    Returns:
+        StyleRegistry: 该文档的样式注册表
+    """
+    part = document.part
+    registry = getattr(part, _ATTR, None)
+    if registry is None:
+        registry = StyleRegistry(document)
+        setattr(part, _ATTR, registry)
+    return registry
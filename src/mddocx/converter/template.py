@@ -0,0 +1,185 @@
+"""
+文档模板缓存模块
+
+``docx.Document()`` 每次都要打开内置的 default.docx 压缩包并解析其中全部
+XML 部件（仅 styles.xml 就有约 350 KB），之后代码块、链接转换器还要在样式
+表里线性查找并添加自己的样式。这里把加好样式的基础文档包在进程内只构建
+一次，之后每个新文档只复制部件，不再重复解压和解析：
+
+- XML 部件写时复制：新文档先与模板共用元素树和预先序列化的内容，首次访问
+  ``element`` 时才复制元素树；没有访问过的部件保存时直接写出模板的内容。
+  样式注册表只读查找样式时不会触发复制，样式表通常只在按需添加列表、引用
+  样式时才复制；
+- 二进制部件直接共享不可变的字节内容。
+"""
+
+import copy
+import threading
+from typing import IO, Dict, Optional, Type, Union
+
+from docx import Document
+from docx.document import Document as DocumentObject
+from docx.opc.oxml import serialize_part_xml
+from docx.opc.package import OpcPackage
+from docx.opc.part import Part, XmlPart
+from docx.oxml.xmlchemy import BaseOxmlElement
+from docx.package import Package
+
+from .elements import CodeConverter, LinkConverter
+
+_default_template: Optional["DocumentTemplate"] = None
+_lock = threading.Lock()
+
+# XML 部件类型到对应写时复制子类的映射
+_shared_classes: Dict[type, type] = {}
+_shared_lock = threading.Lock()
+
+
+class SharedXmlPart(XmlPart):
+    """与模板共用元素树的 XML 部件，首次访问元素树时才复制
+
+    ``read_element`` 在复制之前返回模板的元素树，只能用于只读查找。
+    """
+
+    _shared: BaseOxmlElement
+    _shared_blob: bytes
+    _own: Optional[BaseOxmlElement] = None
+
+    @property
+    def _element(self) -> BaseOxmlElement:
+        element = self._own
+        if element is None:
+            element = self._own = copy.deepcopy(self._shared)
+        return element
+
+    @_element.setter
+    def _element(self, element: Optional[BaseOxmlElement]) -> None:
+        self._own = element
+
+    @property
+    def read_element(self) -> BaseOxmlElement:
+        """用于只读查找的元素树，不触发复制"""
+        own = self._own
+        return own if own is not None else self._shared
+
+    @property
+    def blob(self) -> bytes:
+        if self._own is None:
+            return self._shared_blob
+        return serialize_part_xml(self._own)
+
+
+def _shared_class(cls: Type[XmlPart]) -> type:
+    """获取 XML 部件类型对应的写时复制子类"""
+    shared = _shared_classes.get(cls)
+    if shared is None:
+        with _shared_lock:
+            shared = _shared_classes.get(cls)
+            if shared is None:
+                shared = _shared_classes[cls] = type(
+                    "Shared" + cls.__name__, (SharedXmlPart, cls), {}
+                )
+    return shared
+
+
+class DocumentTemplate:
+    """可快速复制的文档模板
+
+    构建时加载一次模板文档，并添加转换器固定使用的样式（Code、Hyperlink），
+    ``new_document()`` 返回互相独立的副本。列表、引用等按层级使用的样式仍在
+    转换时按需添加，因此生成文档的样式表与直接使用 ``Document()`` 时一致。
+    """
+
+    def __init__(self, source: Union[str, IO[bytes], None] = None) -> None:
+        """加载模板文档
+
+        Args:
+            source: 模板 .docx 文件路径或二进制流，为 None 时使用 python-docx 内置模板
+        """
+        document = Document(source)
+        # 与转换器 set_document 时添加的样式相同，顺序也相同
+        CodeConverter().set_document(document)
+        LinkConverter().set_document(document)
+        self._package = document.part.package
+        # 预先序列化各 XML 部件，未修改的部件保存时直接使用
+        self._blobs = {
+            part: serialize_part_xml(part.element)
+            for part in self._package.iter_parts()
+            if isinstance(part, XmlPart)
+        }
+
+    def new_document(self) -> DocumentObject:
+        """复制模板，返回一个新文档
+
+        Returns:
+            Document: 与模板内容相同、可独立修改的新文档
+        """
+        package = Package()
+        parts: Dict[Part, Part] = {}
+        for part in self._package.iter_parts():
+            if isinstance(part, XmlPart):
+                new_part = _shared_class(type(part))(
+                    part.partname, part.content_type, None, package
+                )
+                new_part._shared = part.element
+                new_part._shared_blob = self._blobs[part]
+                parts[part] = new_part
+            else:
+                # 与解包时相同的构造方式（ImagePart 等子类的参数与 Part 不同）
+                parts[part] = type(part).load(
+                    part.partname, part.content_type, part.blob, package
+                )
+
+        _copy_rels(self._package, package, parts)
+        for part, new_part in parts.items():
+            _copy_rels(part, new_part, parts)
+        for new_part in parts.values():
+            new_part.after_unmarshal()
+        package.after_unmarshal()
+        return package.main_document_part.document
+
+
+def _copy_rels(
+    source: Union[OpcPackage, Part],
+    target: Union[OpcPackage, Part],
+    parts: Dict[Part, Part],
+) -> None:
+    """按原有 rId 复制关系，内部关系指向复制后的部件
+
+    Args:
+        source: 模板中的包或部件
+        target: 新文档中对应的包或部件
+        parts: 模板部件到新部件的映射
+    """
+    for rel in source.rels.values():
+        if rel.is_external:
+            target.rels.add_relationship(
+                rel.reltype, rel.target_ref, rel.rId, is_external=True
+            )
+        else:
+            target.rels.add_relationship(rel.reltype, parts[rel.target_part], rel.rId)
+
+
+def get_default_template() -> DocumentTemplate:
+    """获取（必要时构建）进程内共享的默认模板
+
+    Returns:
+        DocumentTemplate: 基于 python-docx 内置模板的共享模板
+    """
+    global _default_template
+    template = _default_template
+    if template is None:
+        with _lock:
+            template = _default_template
+            if template is None:
+                template = _default_template = DocumentTemplate()
+    return template
+
+
+def new_document() -> DocumentObject:
+    """基于默认模板创建新文档，相当于更快的 ``Document()``（已包含 Code、Hyperlink 样式）
+
+    Returns:
+        Document: 新文档
+    """
+    return get_default_template().new_document()
@@ -0,0 +1,170 @@
+"""
+日志配置模块
+
+转换器的调试信息通过 ``mddocx`` 命名空间下的模块日志记录器输出
+（``logging.getLogger(__name__)``），不再直接打印。调用方可以像配置
+其他库一样配置这些日志；这里提供三个常用的辅助函数：
+
+- ``enable_debug_output``：调试模式下、且调用方没有配置任何日志时，
+  把调试信息输出到标准错误；
+- ``debug_output``：只在 with 块内开启调试输出，结束后恢复日志记录器的
+  级别并移除添加的处理器，转换器以调试模式转换时使用；
+- ``add_debug_file_handler``：把调试信息写入文件，供 Web 界面和批量转换使用。
+
+日志记录器的级别是进程内共用的，``debug_output`` 另外用上下文变量标记
+调试范围：图片预取、磁盘缓存和优化等没有转换器调试开关的模块只在调试
+范围内（``debug_enabled``）记录调试信息，``debug_output`` 添加的处理器也
+只输出调试范围内的调试记录，同时进行的非调试转换既不产生也不输出调试信息。
+线程池中的任务用 ``with_debug_scope`` 包装后沿用提交线程的调试范围。
+"""
+
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import IO, Any, Callable, Iterator, Optional, TypeVar
+
+LOGGER_NAME = "mddocx"
+
+# 调试日志文件的默认格式
+DEBUG_FILE_FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s"
+
+# debug_output 的嵌套计数以及进入前的日志配置，多个线程同时调试转换时
+# 由最后一个退出的恢复
+_debug_lock = threading.Lock()
+_debug_depth = 0
+_saved_level = logging.NOTSET
+_debug_handler: Optional[logging.Handler] = None
+
+# 当前上下文（线程或任务）是否处于 debug_output 的范围内
+_debug_scope: ContextVar[bool] = ContextVar("mddocx_debug_scope", default=False)
+
+T = TypeVar("T")
+
+
+def get_logger() -> logging.Logger:
+    """获取 mddocx 的顶层日志记录器"""
+    return logging.getLogger(LOGGER_NAME)
+
+
+def debug_enabled() -> bool:
+    """当前上下文是否处于调试范围内（以调试模式进行的转换中）
+
+    用于没有转换器调试开关的模块在记录调试信息前判断，非调试转换不必
+    构造日志记录。
+
+    Returns:
+        bool: 是否记录调试信息
+    """
+    return _debug_scope.get()
+
+
+def with_debug_scope(func: Callable[..., T]) -> Callable[..., T]:
+    """包装提交到线程池的函数，使其在工作线程中沿用当前的调试范围
+
+    Args:
+        func: 要在其他线程中执行的函数
+
+    Returns:
+        Callable[..., T]: 当前不在调试范围内时原样返回 func
+    """
+    if not _debug_scope.get():
+        return func
+    return partial(_run_in_debug_scope, func)
+
+
+def _run_in_debug_scope(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    token = _debug_scope.set(True)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _debug_scope.reset(token)
+
+
+class _DebugScopeFilter(logging.Filter):
+    """只放行调试范围内的调试记录，其他级别的记录不受影响"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or _debug_scope.get()
+
+
+def enable_debug_output(stream: Optional[IO[str]] = None) -> Optional[logging.Handler]:
+    """开启调试日志，没有任何日志配置时输出到控制台
+
+    调用方已经配置了日志处理器（例如 ``logging.basicConfig``）时，
+    只把 mddocx 日志记录器的级别调整为 DEBUG，输出位置由调用方决定。
+
+    Args:
+        stream: 控制台输出流，默认为标准错误
+
+    Returns:
+        Optional[logging.Handler]: 新添加的处理器，未添加时返回 None
+    """
+    logger = get_logger()
+    if logger.getEffectiveLevel() > logging.DEBUG:
+        logger.setLevel(logging.DEBUG)
+    if logger.hasHandlers():
+        return None
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    return handler
+
+
+@contextmanager
+def debug_output(stream: Optional[IO[str]] = None) -> Iterator[None]:
+    """在 with 块内开启调试日志（同 ``enable_debug_output``），结束后恢复
+
+    with 块所在的上下文进入调试范围；添加的控制台处理器只输出调试范围内的
+    调试记录，其他线程中同时进行的非调试转换不会输出调试信息。
+
+    Args:
+        stream: 控制台输出流，默认为标准错误
+    """
+    global _debug_depth, _saved_level, _debug_handler
+    logger = get_logger()
+    with _debug_lock:
+        if _debug_depth == 0:
+            _saved_level = logger.level
+            _debug_handler = enable_debug_output(stream)
+            if _debug_handler is not None:
+                _debug_handler.addFilter(_DebugScopeFilter())
+        _debug_depth += 1
+    token = _debug_scope.set(True)
+    try:
+        yield
+    finally:
+        _debug_scope.reset(token)
+        with _debug_lock:
+            _debug_depth -= 1
+            if _debug_depth == 0:
+                if _debug_handler is not None:
+                    logger.removeHandler(_debug_handler)
+                    _debug_handler = None
+                logger.setLevel(_saved_level)
+
+
+def add_debug_file_handler(
+    path: str, fmt: str = DEBUG_FILE_FORMAT, propagate: bool = True
+) -> logging.Handler:
+    """把 mddocx 的调试日志写入文件
+
+    Args:
+        path: 日志文件路径
+        fmt: 日志格式
+        propagate: 是否继续传递给上层（根）日志记录器，关闭后调试信息只写入该文件
+
+    Returns:
+        logging.Handler: 新添加的文件处理器，可传给 ``logging.Logger.removeHandler``
+    """
+    logger = get_logger()
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setLevel(logging.DEBUG)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = propagate
+    return handler
@@ -6,12 +6,20 @@ Flask Web应用
 # 标准库导入
 import logging
 import mimetypes
-import os
 import sys
+import threading
 from pathlib import Path
 
 # 第三方库导入
-from flask import Flask, flash, redirect, render_template, request, send_file, url_for
+from flask import (
+    Flask,
+    Response,
+    flash,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 from werkzeug.utils import secure_filename
 
 # 添加项目根目录到Python路径
@@ -19,14 +27,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # 本地模块导入
-from ..converter import BaseConverter
+from ..converter import COMPRESSION_PROFILES, BaseConverter, iter_docx
+from ..log import add_debug_file_handler
 from .config import get_config
 
-# 导入markdown解析器
+# 导入markdown解析器（与转换器共享进程内的解析器缓存）
 try:
-    from markdown_it import MarkdownIt
+    from ..converter.parser import get_parser
 
-    md = MarkdownIt()
+    md = get_parser()
 except ImportError:
     # 如果没有安装markdown-it-py，使用简单的解析
     md = None
@@ -44,8 +53,28 @@ app.config.from_object(config)
 # 设置应用日志
 app.logger.setLevel(logging.INFO if not config.DEBUG else logging.DEBUG)
 
-# 初始化转换器
-converter = BaseConverter()
+# 转换器调试日志单独写入文件，不输出到控制台
+if config.CONVERTER_DEBUG_LOG:
+    add_debug_file_handler(config.CONVERTER_DEBUG_LOG, propagate=False)
+
+# 每个线程复用一个转换器，每次请求开始新文档
+_local = threading.local()
+
+
+def get_converter():
+    """获取当前线程的转换器，并为本次请求准备新文档"""
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        converter = _local.converter = BaseConverter(
+            debug=bool(config.CONVERTER_DEBUG_LOG),
+            image_cache_dir=config.IMAGE_CACHE_DIR,
+            image_cache_max_bytes=config.IMAGE_CACHE_SIZE_MB * 1024 * 1024,
+            image_memory_max_bytes=config.IMAGE_MEMORY_CACHE_SIZE_MB * 1024 * 1024,
+            optimize_images=config.OPTIMIZE_IMAGES,
+        )
+    else:
+        converter.reset()
+    return converter
 
 
 def allowed_file(filename, file_obj=None):
@@ -79,7 +108,8 @@ def allowed_file(filename, file_obj=None):
 @app.route("/")
 def index():
     """主页"""
-    return render_template("index.html")
+    # 压缩方式下拉框默认选中服务器配置的压缩方式
+    return render_template("index.html", compression=config.DOCX_COMPRESSION)
 
 
 @app.route("/convert", methods=["POST"])
@@ -122,47 +152,21 @@ def convert():
             flash("内容过大，请分批处理", "error")
             return redirect(url_for("index"))
 
+        # 压缩配置：表单字段优先，其次是配置中的默认值
+        compression = request.form.get("compression") or config.DOCX_COMPRESSION
+        if compression not in COMPRESSION_PROFILES:
+            flash("不支持的压缩配置", "error")
+            return redirect(url_for("index"))
+
         # 执行转换
-        doc = converter.convert(markdown_content)
-
-        # 保存到临时文件 - 使用更安全的方式
-        import tempfile
-        import uuid
-
-        temp_filename = f"md2docx_{uuid.uuid4().hex}.docx"
-        temp_dir = tempfile.gettempdir()
-        docx_file_path = os.path.join(temp_dir, temp_filename)
-
-        try:
-            doc.save(docx_file_path)
-
-            # 返回文件下载
-            response = send_file(
-                docx_file_path,
-                as_attachment=True,
-                download_name="converted.docx",
-                mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            )
-
-            # 设置清理回调
-            @response.call_on_close
-            def cleanup():
-                try:
-                    if os.path.exists(docx_file_path):
-                        os.unlink(docx_file_path)
-                except (OSError, IOError) as e:
-                    app.logger.warning(f"清理临时文件失败: {e}")
-
-            return response
-
-        except Exception as save_error:
-            # 清理可能已创建的文件
-            try:
-                if os.path.exists(docx_file_path):
-                    os.unlink(docx_file_path)
-            except (OSError, IOError):
-                pass
-            raise save_error
+        doc = get_converter().convert(markdown_content)
+
+        # 流式打包并直接写入响应体，不再经过临时文件
+        return Response(
+            iter_docx(doc, compression=compression),
+            mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            headers={"Content-Disposition": "attachment; filename=converted.docx"},
+        )
 
     except UnicodeDecodeError:
         flash("文件编码错误，请使用UTF-8编码", "error")
@@ -28,6 +28,26 @@ class Config:
     PORT = int(os.environ.get("PORT", 5000))
     DEBUG = os.environ.get("FLASK_DEBUG", "False").lower() == "true"
 
+    # 转换器调试日志文件，设置后开启转换器调试模式并把调试信息写入该文件
+    CONVERTER_DEBUG_LOG = os.environ.get("MDDOCX_DEBUG_LOG")
+
+    # 下载文件的默认压缩配置（default、store、fast、max、store-media），
+    # 表单中的 compression 字段可以覆盖
+    DOCX_COMPRESSION = os.environ.get("MDDOCX_COMPRESSION", "default")
+
+    # 在线图片的磁盘缓存目录，未设置时不使用磁盘缓存；可与命令行工具共用同一目录
+    IMAGE_CACHE_DIR = os.environ.get("MDDOCX_IMAGE_CACHE")
+    # 磁盘缓存的大小上限（MB），超过时淘汰最久未用的图片
+    IMAGE_CACHE_SIZE_MB = int(os.environ.get("MDDOCX_IMAGE_CACHE_SIZE", 256))
+    # 每个转换器的图片内存缓存大小上限（MB），长期运行时内存占用不超过此大小
+    IMAGE_MEMORY_CACHE_SIZE_MB = int(
+        os.environ.get("MDDOCX_IMAGE_MEMORY_CACHE_SIZE", 64)
+    )
+    # 是否在嵌入之前按显示尺寸缩小并重新压缩图片（需要安装 Pillow）
+    OPTIMIZE_IMAGES = (
+        os.environ.get("MDDOCX_OPTIMIZE_IMAGES", "False").lower() == "true"
+    )
+
 
 class DevelopmentConfig(Config):
     """开发环境配置"""
@@ -19,6 +19,21 @@ from mddocx.webui.app import allowed_file, app
 from mddocx.webui.config import get_config
 
 
+@pytest.fixture
+def reload_config(monkeypatch):
+    """按当前环境变量重新加载配置模块，测试结束后恢复环境变量和配置"""
+    import importlib
+
+    import mddocx.webui.config as config_module
+
+    def reload():
+        return importlib.reload(config_module).get_config("development")
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(config_module)
+
+
 class TestConfig:
     """配置测试"""
 
@@ -34,6 +49,44 @@ class TestConfig:
         assert config.DEBUG is True
         assert config.MAX_CONTENT_LENGTH == 16 * 1024 * 1024
 
+    def test_image_cache_config_defaults(self, monkeypatch, reload_config):
+        """测试默认不使用图片磁盘缓存，缓存大小使用默认值"""
+        for name in (
+            "MDDOCX_IMAGE_CACHE",
+            "MDDOCX_IMAGE_CACHE_SIZE",
+            "MDDOCX_IMAGE_MEMORY_CACHE_SIZE",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        config = reload_config()
+        assert config.IMAGE_CACHE_DIR is None
+        assert config.IMAGE_CACHE_SIZE_MB == 256
+        assert config.IMAGE_MEMORY_CACHE_SIZE_MB == 64
+
+    def test_image_cache_config_from_env(self, monkeypatch, reload_config, tmp_path):
+        """测试从环境变量读取图片缓存设置，并传给 Web 界面的转换器"""
+        import threading
+
+        import mddocx.webui.app as app_module
+
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("MDDOCX_IMAGE_CACHE", str(cache_dir))
+        monkeypatch.setenv("MDDOCX_IMAGE_CACHE_SIZE", "32")
+        monkeypatch.setenv("MDDOCX_IMAGE_MEMORY_CACHE_SIZE", "8")
+
+        config = reload_config()
+        assert config.IMAGE_CACHE_DIR == str(cache_dir)
+        assert config.IMAGE_CACHE_SIZE_MB == 32
+        assert config.IMAGE_MEMORY_CACHE_SIZE_MB == 8
+
+        monkeypatch.setattr(app_module, "config", config)
+        monkeypatch.setattr(app_module, "_local", threading.local())
+        converter = app_module.get_converter()
+        assert converter.image_cache.directory == cache_dir
+        assert converter.image_cache.max_bytes == 32 * 1024 * 1024
+        assert converter.prefetcher.cache is converter.image_cache
+        assert converter.converters["image"].memory_cache.max_bytes == 8 * 1024 * 1024
+
     def test_production_config_requires_secret_key(self):
         """测试生产环境需要SECRET_KEY"""
         # 移除环境变量
@@ -137,6 +190,62 @@ class TestAppRoutes:
         # 由于实际转换需要文件系统权限，这里主要测试路由是否工作
         assert response.status_code in [200, 302]  # 可能成功或重定向
 
+    def test_convert_streams_docx(self):
+        """测试转换结果以流式响应返回，内容是完整的 DOCX"""
+        from io import BytesIO
+
+        from docx import Document
+
+        response = self.client.post("/convert", data={"markdown": "# Test\n\n正文"})
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert "converted.docx" in response.headers["Content-Disposition"]
+        document = Document(BytesIO(response.data))
+        assert [p.text for p in document.paragraphs] == ["Test", "正文"]
+
+    def test_convert_compression(self):
+        """测试表单中的压缩配置"""
+        import zipfile
+        from io import BytesIO
+
+        response = self.client.post(
+            "/convert", data={"markdown": "# Test", "compression": "store"}
+        )
+        assert response.status_code == 200
+        with zipfile.ZipFile(BytesIO(response.data)) as zf:
+            types = {info.compress_type for info in zf.infolist()}
+        assert types == {zipfile.ZIP_STORED}
+
+        response = self.client.post(
+            "/convert", data={"markdown": "# Test", "compression": "zstd"}
+        )
+        assert response.status_code == 302
+
+    def test_compression_default_from_env(self, monkeypatch, reload_config):
+        """测试页面表单默认选中 MDDOCX_COMPRESSION 配置的压缩方式"""
+        import re
+        import zipfile
+        from io import BytesIO
+
+        import mddocx.webui.app as app_module
+
+        monkeypatch.setenv("MDDOCX_COMPRESSION", "store")
+        monkeypatch.setattr(app_module, "config", reload_config())
+
+        # 按浏览器的方式提交页面上的表单：下拉框取选中的选项
+        page = self.client.get("/").get_data(as_text=True)
+        select = re.search(r'<select name="compression".*?</select>', page, re.S)
+        selected = re.findall(r'<option value="([^"]+)" selected>', select.group())
+        assert selected == ["store"]
+
+        response = self.client.post(
+            "/convert", data={"markdown": "# Test", "compression": selected[0]}
+        )
+        assert response.status_code == 200
+        with zipfile.ZipFile(BytesIO(response.data)) as zf:
+            types = {info.compress_type for info in zf.infolist()}
+        assert types == {zipfile.ZIP_STORED}
+
     def test_error_handling(self):
         """测试错误处理"""
         # 测试无效的Markdown内容
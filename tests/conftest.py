@@ -2,7 +2,9 @@
 测试配置文件
 """
 
+import struct
 import sys
+import zlib
 from pathlib import Path
 
 import pytest
@@ -25,6 +27,39 @@ from mddocx.converter.elements import (
 )
 
 
+def png_bytes(width, height=1, raw=None, level=-1):
+    """生成 PNG 图片数据，测试和基准测试共用
+
+    Args:
+        width: 宽度（像素）
+        height: 高度（像素）
+        raw: 未压缩的图像数据（每行以过滤类型字节开头），默认为纯色
+        level: zlib 压缩级别
+
+    Returns:
+        bytes: PNG 文件内容
+    """
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    if raw is None:
+        raw = (b"\x00" + b"\x33\x66\x99" * width) * height
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw, level))
+        + chunk(b"IEND", b"")
+    )
+
+
+@pytest.fixture
+def make_png():
+    """生成纯色 PNG 图片数据的函数，参数见 png_bytes"""
+    return png_bytes
+
+
 @pytest.fixture
 def base_converter():
     """创建基础转换器实例"""
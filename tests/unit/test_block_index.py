@@ -0,0 +1,71 @@
+"""
+块级索引测试
+"""
+
+from markdown_it import MarkdownIt
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.block_index import BlockIndex
+
+
+def _parse(text):
+    return MarkdownIt("commonmark").parse(text)
+
+
+def test_quote_depth():
+    """测试引用块深度预处理"""
+    tokens = _parse("> 外层\n>> 内层\n\n正文\n")
+    index = BlockIndex(tokens)
+
+    depths = {
+        t.content: index.quote_depth[i]
+        for i, t in enumerate(tokens)
+        if t.type == "inline"
+    }
+    assert depths == {"外层": 1, "内层": 2, "正文": 0}
+
+    # 开始和结束标记计入其所开启的层级
+    opens = [
+        index.quote_depth[i]
+        for i, t in enumerate(tokens)
+        if t.type == "blockquote_open"
+    ]
+    closes = [
+        index.quote_depth[i]
+        for i, t in enumerate(tokens)
+        if t.type == "blockquote_close"
+    ]
+    assert opens == [1, 2]
+    assert closes == [2, 1]
+
+
+def test_separate_quotes_use_own_depth():
+    """测试相互独立的引用块各自从第一层开始"""
+    converter = BaseConverter()
+    doc = converter.convert("> 第一个\n>> 嵌套\n\n正文\n\n> 第二个\n")
+
+    styles = [p.style.name for p in doc.paragraphs]
+    assert styles == ["Quote", "Quote2", "Normal", "Quote"]
+
+
+def test_close_index():
+    """测试开始标记到结束标记的匹配"""
+    tokens = _parse("- a\n  - b\n\n> q\n")
+    index = BlockIndex(tokens)
+
+    for i, token in enumerate(tokens):
+        if token.nesting == 1:
+            end = index.close[i]
+            assert tokens[end].type == token.type.replace("_open", "_close")
+            assert tokens[end].level == token.level
+        else:
+            assert index.close[i] == -1
+
+
+def test_list_item_paragraph_not_repeated():
+    """测试列表项使用的段落不会再作为普通段落输出"""
+    converter = BaseConverter()
+    doc = converter.convert("- 第一项\n\n  第二段\n- 第二项\n")
+
+    texts = [p.text for p in doc.paragraphs]
+    assert texts == ["第一项", "第二段", "第二项"]
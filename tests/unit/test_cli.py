@@ -2,13 +2,20 @@
 CLI模块单元测试
 """
 
+import io
 import os
+import subprocess
+import sys
 import tempfile
+import zipfile
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from docx import Document
 
 from mddocx.cli import convert_file, main
+from mddocx.converter.base import BaseConverter
 
 
 class TestCLI:
@@ -162,3 +169,163 @@ class TestCLI:
             for path in [md_path, docx_path]:
                 if os.path.exists(path):
                     os.unlink(path)
+
+    def test_convert_file_to_stdout(self, tmp_path):
+        """测试输出为 "-" 时把文档写到标准输出（管道）"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text("# 测试标题\n\n正文", encoding="utf-8")
+        env = dict(
+            os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2] / "src")
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-m", "mddocx.cli", str(md_path), "-"],
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+
+        document = Document(io.BytesIO(result.stdout))
+        assert [p.text for p in document.paragraphs] == ["测试标题", "正文"]
+        assert "转换完成" in result.stderr.decode("utf-8")
+
+    def test_debug_to_stdout(self, tmp_path):
+        """测试输出为 "-" 时调试信息写到标准错误，标准输出只有 DOCX 数据"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text("# 测试标题\n\n正文", encoding="utf-8")
+        env = dict(
+            os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2] / "src")
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-m", "mddocx.cli", "--debug", str(md_path), "-"],
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+
+        assert result.stdout.startswith(b"PK\x03\x04")
+        with zipfile.ZipFile(io.BytesIO(result.stdout)) as zf:
+            assert zf.testzip() is None
+        stderr = result.stderr.decode("utf-8")
+        assert "Processing token" in stderr
+        assert "转换完成" in stderr
+
+    def test_error_to_stderr_when_output_is_stdout(self, tmp_path, capsys):
+        """测试输出为 "-" 时错误信息写到标准错误"""
+        with patch("sys.argv", ["mddocx", str(tmp_path / "missing.md"), "-"]):
+            with pytest.raises(SystemExit):
+                main()
+
+        captured = capsys.readouterr()
+        assert "错误" in captured.err
+        assert captured.out == ""
+
+    def test_convert_file_compression(self, tmp_path):
+        """测试指定压缩配置"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text("# 测试标题", encoding="utf-8")
+        docx_path = tmp_path / "output.docx"
+
+        convert_file(str(md_path), str(docx_path), compression="store")
+
+        with zipfile.ZipFile(docx_path) as zf:
+            types = {info.compress_type for info in zf.infolist()}
+        assert types == {zipfile.ZIP_STORED}
+        with pytest.raises(ValueError):
+            convert_file(str(md_path), str(docx_path), compression="zstd")
+
+    @patch("mddocx.cli.convert_file")
+    @patch("pathlib.Path.exists", return_value=True)
+    def test_main_image_cache(self, mock_exists, mock_convert):
+        """测试图片磁盘缓存目录和大小上限（MB）传给转换"""
+        test_args = [
+            "md2docx",
+            "--image-cache",
+            "cache",
+            "--image-cache-size",
+            "64",
+            "input.md",
+            "output.docx",
+        ]
+
+        with patch("sys.argv", test_args):
+            main()
+
+        mock_convert.assert_called_once_with(
+            "input.md",
+            "output.docx",
+            False,
+            image_cache="cache",
+            image_cache_max_bytes=64 * 1024 * 1024,
+        )
+
+    @patch("mddocx.cli.convert_file")
+    def test_main_image_cache_size_requires_cache(self, mock_convert, capsys):
+        """测试只指定磁盘缓存大小而没有缓存目录时报错"""
+        test_args = ["md2docx", "--image-cache-size", "5", "input.md", "output.docx"]
+
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+        assert "--image-cache" in capsys.readouterr().err
+        mock_convert.assert_not_called()
+
+    @patch("mddocx.cli.convert_file")
+    @patch("pathlib.Path.exists", return_value=True)
+    def test_main_optimize_images(self, mock_exists, mock_convert):
+        """测试图片优化选项传给转换"""
+        test_args = [
+            "md2docx",
+            "--optimize-images",
+            "--image-dpi",
+            "96",
+            "input.md",
+            "output.docx",
+        ]
+
+        with patch("sys.argv", test_args):
+            main()
+
+        mock_convert.assert_called_once_with(
+            "input.md",
+            "output.docx",
+            False,
+            optimize_images=True,
+            image_dpi=96,
+            image_quality=85,
+        )
+
+    @pytest.mark.parametrize("option", ["--image-dpi", "--image-quality"])
+    @patch("mddocx.cli.convert_file")
+    def test_main_image_options_require_optimize(self, mock_convert, option, capsys):
+        """测试没有开启图片优化时指定分辨率或质量报错"""
+        test_args = ["md2docx", option, "90", "input.md", "output.docx"]
+
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+        assert "--optimize-images" in capsys.readouterr().err
+        mock_convert.assert_not_called()
+
+    def test_convert_file_image_cache(self, tmp_path):
+        """测试复用的转换器使用指定的图片磁盘缓存"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text("# 测试标题", encoding="utf-8")
+        converter = BaseConverter()
+
+        convert_file(
+            str(md_path),
+            str(tmp_path / "output.docx"),
+            converter=converter,
+            image_cache=str(tmp_path / "cache"),
+            image_cache_max_bytes=1024,
+        )
+
+        assert converter.prefetcher.cache is converter.image_cache
+        assert converter.image_cache.max_bytes == 1024
+        assert (tmp_path / "cache" / "objects").is_dir()
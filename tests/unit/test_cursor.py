@@ -0,0 +1,92 @@
+"""
+正文游标测试
+"""
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.cursor import BodyCursor, get_body_cursor
+from mddocx.converter.parser import get_converter_parser
+
+
+def test_cursor_attached_to_document():
+    """测试每个文档只有一个正文游标"""
+    document = Document()
+    cursor = get_body_cursor(document)
+
+    assert isinstance(cursor, BodyCursor)
+    assert get_body_cursor(document) is cursor
+    assert get_body_cursor(Document()) is not cursor
+
+
+def test_last_paragraph_matches_paragraphs():
+    """测试最后一个段落与 document.paragraphs[-1] 相同，末尾的表格被跳过"""
+    document = Document()
+    cursor = get_body_cursor(document)
+    assert cursor.last_paragraph() is None
+
+    document.add_paragraph("一")
+    document.add_paragraph("二")
+    assert cursor.last_paragraph()._p is document.paragraphs[-1]._p
+
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "单元格"
+    assert cursor.last_paragraph().text == "二"
+    assert cursor.last_paragraph()._p is document.paragraphs[-1]._p
+
+
+def test_add_paragraph_before_section():
+    """测试追加的段落与 document.add_paragraph 相同，位于分节属性之前"""
+    expected = Document()
+    actual = Document()
+    cursor = get_body_cursor(actual)
+    for k in range(3):
+        expected.add_paragraph()
+        cursor.add_paragraph()
+        # 通过 python-docx 追加的元素也能正确排在后面
+        expected.add_paragraph(str(k))
+        actual.add_paragraph(str(k))
+
+    assert actual.element.body.xml == expected.element.body.xml
+    assert actual.element.body[-1].tag == qn("w:sectPr")
+
+
+def test_add_table_matches_document():
+    """测试追加的表格与 document.add_table 相同，按最后一节计算宽度"""
+    expected = Document()
+    actual = Document()
+    for document in (expected, actual):
+        document.sections[-1].left_margin = 0
+    expected.add_table(rows=2, cols=3)
+    table = get_body_cursor(actual).add_table(2, 3)
+
+    assert actual.element.body.xml == expected.element.body.xml
+    assert len(table.rows) == 2 and len(table.columns) == 3
+
+
+def test_html_list_returns_last_item():
+    """测试 HTML 列表返回最后一个列表项，两种输出方式结果相同"""
+    text = "<ul>\n<li>a</li>\n<li><strong>b</strong></li>\n</ul>\n"
+    results = []
+    for fast_xml in (False, True):
+        converter = BaseConverter(fast_xml=fast_xml)
+        document = converter.convert("前文\n")
+        token = get_converter_parser().parse(text)[0]
+        paragraph = converter.converters["html"].convert(token)
+        assert paragraph.text == "b"
+        assert paragraph.style.name == "List Bullet"
+        assert paragraph._p is document.paragraphs[-1]._p
+        results.append(document.element.body.xml)
+
+    assert results[0] == results[1]
+
+
+def test_standalone_link_appends_to_last_paragraph():
+    """测试单独转换的链接添加到最后一个段落"""
+    converter = BaseConverter()
+    document = converter.convert("前文\n\n| a |\n| - |\n| b |\n")
+    tokens = get_converter_parser().parse("[链接](https://a.example)")[1].children
+    converter.converters["link"].convert((tokens[0], tokens[1]))
+
+    assert len(document.paragraphs) == 1
+    assert document.paragraphs[0]._p.xpath("string(.)") == "前文链接"
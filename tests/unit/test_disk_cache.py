@@ -0,0 +1,124 @@
+"""
+图片磁盘缓存测试
+"""
+
+import errno
+import mmap
+import os
+
+import pytest
+
+from mddocx.converter import disk_cache
+from mddocx.converter.disk_cache import DiskImageCache
+
+
+def objects(directory):
+    """缓存目录中的图片文件（不含临时文件）"""
+    return sorted(
+        p.name
+        for p in (directory / "objects").glob("*/*")
+        if not p.name.startswith(".")
+    )
+
+
+def test_store_and_lookup_across_instances(tmp_path):
+    """测试缓存内容保存在磁盘上，新的实例（其他进程）可以读取"""
+    DiskImageCache(tmp_path).store("https://a.example/1.png", b"image", '"v1"', "date")
+    cache = DiskImageCache(tmp_path)
+    entry = cache.lookup("https://a.example/1.png")
+
+    assert entry.etag == '"v1"'
+    assert entry.size == 5
+    assert cache.read(entry) == b"image"
+    assert cache.validators(entry) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "date",
+    }
+    assert cache.lookup("https://a.example/2.png") is None
+
+
+def test_content_addressed(tmp_path):
+    """测试内容相同的图片只保存一份，没有遗留临时文件"""
+    cache = DiskImageCache(tmp_path)
+    first = cache.store("https://a.example/1.png", b"same")
+    second = cache.store("https://b.example/2.png", b"same")
+
+    assert first.digest == second.digest
+    assert objects(tmp_path) == [first.digest]
+    assert not [p for p in tmp_path.rglob(".tmp-*")]
+    assert cache.validators(first) == {}
+
+
+def test_lru_eviction(tmp_path):
+    """测试超过大小上限时淘汰最久未用的图片，淘汰后的地址视为未缓存"""
+    cache = DiskImageCache(tmp_path, max_bytes=25)
+    a = cache.store("a", b"a" * 10)
+    b = cache.store("b", b"b" * 10)
+    # 让 a、b 看起来都是很久以前使用的，再读取 a
+    for entry in (a, b):
+        os.utime(cache._object_path(entry.digest), (1, 1))
+    assert cache.read(a) == b"a" * 10
+    c = cache.store("c", b"c" * 10)
+
+    assert objects(tmp_path) == sorted([a.digest, c.digest])
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == a
+
+
+def test_eviction_prunes_index(tmp_path):
+    """测试淘汰图片时删除对应的地址记录，记录数量不会无限增长"""
+    cache = DiskImageCache(tmp_path)
+    for k in range(10):
+        entry = cache.store(f"https://a.example/{k}.png", bytes([k]) * 10)
+        os.utime(cache._object_path(entry.digest), (k + 1, k + 1))
+    assert len(list((tmp_path / "index").glob("*.json"))) == 10
+
+    cache.max_bytes = 25
+    assert cache.evict() == 8
+
+    assert len(list((tmp_path / "index").glob("*.json"))) == 2
+    assert cache.lookup("https://a.example/9.png") is not None
+    assert cache.lookup("https://a.example/0.png") is None
+
+
+def test_corrupt_index_is_a_miss(tmp_path):
+    """测试损坏的记录文件按未缓存处理"""
+    cache = DiskImageCache(tmp_path)
+    cache.store("a", b"data")
+    cache._index_path("a").write_text("{", encoding="utf-8")
+
+    assert cache.lookup("a") is None
+
+
+def test_invalid_size():
+    """测试大小上限不能为负数"""
+    with pytest.raises(ValueError):
+        DiskImageCache("unused", max_bytes=-1)
+
+
+def test_map_small_files_without_descriptors(tmp_path):
+    """测试较小的图片直接读入内存，缓存的视图不占用文件描述符"""
+    cache = DiskImageCache(tmp_path)
+    entries = [cache.store(f"https://a.example/{k}", b"image%d" % k) for k in range(50)]
+    views = [cache.map(entry) for entry in entries]
+
+    assert all(isinstance(view.obj, bytes) for view in views)
+    assert bytes(views[7]) == b"image7"
+
+
+def test_map_large_files(tmp_path, monkeypatch):
+    """测试较大的图片映射文件，无法映射时改为读取"""
+    monkeypatch.setattr(disk_cache, "MMAP_MIN_BYTES", 4)
+    cache = DiskImageCache(tmp_path)
+    entry = cache.store("https://a.example/1.png", b"image")
+    assert isinstance(cache.map(entry).obj, mmap.mmap)
+
+    def exhausted(*args, **kwargs):
+        raise OSError(errno.EMFILE, "Too many open files")
+
+    monkeypatch.setattr(disk_cache.mmap, "mmap", exhausted)
+    view = cache.map(entry)
+    assert isinstance(view.obj, bytes) and bytes(view) == b"image"
+
+    monkeypatch.setattr(disk_cache, "open", exhausted, raising=False)
+    assert cache.map(entry) is None
@@ -0,0 +1,79 @@
+"""
+Token 分发表测试
+"""
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.dispatch import TokenDispatcher
+
+
+def test_register_and_get():
+    """测试注册和查找处理函数"""
+    dispatcher = TokenDispatcher()
+
+    def handler(tokens, i):
+        return i + 1
+
+    dispatcher.register("list", ("bullet_list_open", "ordered_list_open"), handler)
+
+    assert dispatcher.get("bullet_list_open") is handler
+    assert dispatcher.get("ordered_list_open") is handler
+    assert dispatcher.get("paragraph_open") is None
+    # 未开启统计时不包装
+    assert dispatcher.stats == {}
+
+
+def test_instrumentation_counts_calls():
+    """测试开启统计后记录调用次数和耗时"""
+    dispatcher = TokenDispatcher(instrument=True)
+    dispatcher.register("hr", ("hr",), lambda tokens, i: i + 1)
+
+    handler = dispatcher.get("hr")
+    assert handler([], 0) == 1
+    assert handler([], 3) == 4
+
+    stat = dispatcher.stats["hr"]
+    assert stat.calls == 2
+    assert stat.total_time >= 0
+    assert stat.to_dict()["calls"] == 2
+
+    dispatcher.reset_stats()
+    assert stat.calls == 0
+
+
+def test_set_instrument_rewraps_handlers():
+    """测试运行时切换统计开关"""
+    dispatcher = TokenDispatcher()
+
+    def handler(tokens, i):
+        return i + 1
+
+    dispatcher.register("hr", ("hr",), handler)
+    dispatcher.set_instrument(True)
+    assert dispatcher.get("hr") is not handler
+    dispatcher.get("hr")([], 0)
+    assert dispatcher.stats["hr"].calls == 1
+
+    dispatcher.set_instrument(False)
+    assert dispatcher.get("hr") is handler
+
+
+def test_base_converter_profile():
+    """测试基础转换器的处理函数统计"""
+    converter = BaseConverter(profile=True)
+    converter.convert("# 标题\n\n段落一\n\n段落二\n\n- 列表项\n\n---\n")
+
+    stats = converter.dispatcher.stats
+    assert stats["heading"].calls == 1
+    # 列表项内的段落由列表项处理函数直接跳过
+    assert stats["paragraph"].calls == 2
+    assert stats["list_item"].calls == 1
+    assert stats["hr"].calls == 1
+
+
+def test_missing_converter_does_not_hang():
+    """测试缺少转换器时跳过对应 token"""
+    converter = BaseConverter()
+    del converter.converters["heading"]
+
+    doc = converter.convert("# 标题\n\n正文")
+    assert [p.text for p in doc.paragraphs] == ["正文"]
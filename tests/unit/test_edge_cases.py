@@ -258,20 +258,20 @@ ___
             except ParseError as e:
                 assert "Markdown解析失败" in str(e)
 
-    def test_base_converter_debug_mode(self):
+    def test_base_converter_debug_mode(self, caplog):
         """测试基础转换器调试模式"""
-        from unittest.mock import patch
+        import logging
 
         from mddocx.converter.base import BaseConverter
 
         # 测试启用调试模式
         converter = BaseConverter(debug=True)
 
-        with patch("builtins.print") as mock_print:
+        with caplog.at_level(logging.DEBUG, logger="mddocx"):
             result = converter.convert("# 测试标题")
             assert result is not None
-            # 调试模式应该有输出
-            assert mock_print.called
+            # 调试模式应该有日志输出
+            assert any(r.name.startswith("mddocx.") for r in caplog.records)
 
     def test_base_converter_empty_document_handling(self):
         """测试基础转换器空文档处理"""
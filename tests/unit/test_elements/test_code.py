@@ -2,6 +2,9 @@
 test code 测试
 """
 
+from docx.oxml.ns import qn
+from docx.shared import RGBColor
+
 
 def test_basic_code_block(base_converter):
     """测试基本代码块的转换"""
@@ -82,3 +85,26 @@ def special_chars():
         paragraphs[0].text
         == 'def special_chars():\n    # 这是一个注释\n    print("特殊字符：!@#$%^&*()")'
     )
+
+
+def test_code_block_single_run(base_converter):
+    """测试代码块输出为一个文本块，行之间使用换行元素"""
+    lines = [f"line_{i} = {i}" for i in range(500)]
+    markdown = "```python\n" + "\n".join(lines) + "\n\n    indented\n```"
+    doc = base_converter.convert(markdown)
+    paragraph = doc.paragraphs[0]
+
+    assert len(paragraph.runs) == 1
+    run = paragraph.runs[0]._r
+    assert run.rPr is None
+    assert len(run.findall(qn("w:br"))) == 501
+    assert paragraph.text == "\n".join(lines) + "\n\n    indented"
+
+
+def test_code_style_formatting(base_converter):
+    """测试代码块的字体和颜色来自 Code 样式"""
+    doc = base_converter.convert("```\ncode\n```")
+    style = doc.paragraphs[0].style
+    assert style.name == "Code"
+    assert style.font.name == "Consolas"
+    assert style.font.color.rgb == RGBColor(51, 51, 51)
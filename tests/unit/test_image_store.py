@@ -0,0 +1,97 @@
+"""
+图片存储测试
+"""
+
+from io import BytesIO
+
+from docx import Document
+from docx.shared import Pt
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.elements.image import ImageConverter
+from mddocx.converter.image_store import ImageStore, get_image_store
+
+
+def test_store_attached_to_document():
+    """测试每个文档只有一个图片存储"""
+    document = Document()
+    store = get_image_store(document)
+
+    assert isinstance(store, ImageStore)
+    assert get_image_store(document) is store
+    assert get_image_store(Document()) is not store
+
+
+def test_matches_add_picture(make_png):
+    """测试插入结果（正文、关系和图片部件）与 run.add_picture 完全相同"""
+    images = [make_png(1), make_png(2), make_png(1), make_png(3), make_png(2)]
+    expected = Document()
+    actual = Document()
+    store = get_image_store(actual)
+    for k, blob in enumerate(images):
+        width = Pt(20 + k) if k % 2 else None
+        expected.add_paragraph().add_run().add_picture(BytesIO(blob), width=width)
+        entry = store.add(blob)
+        store.add_picture(actual.add_paragraph().add_run(), entry, width=width)
+
+    assert actual.element.body.xml == expected.element.body.xml
+    assert actual.part.rels.xml == expected.part.rels.xml
+    assert [p.partname for p in actual.part.package.image_parts] == [
+        p.partname for p in expected.part.package.image_parts
+    ]
+
+
+def test_duplicate_content_shares_part(make_png):
+    """测试来源不同但内容相同的图片共用同一个图片部件并计入节省的字节"""
+    blob = make_png(4)
+    store = get_image_store(Document())
+    first = store.add(blob, "a.png")
+    second = store.add(BytesIO(blob), "b.png")
+    other = store.add(make_png(5), "c.png")
+
+    assert first.r_id == second.r_id != other.r_id
+    assert len(store.part.package.image_parts) == 2
+    assert store.get("b.png") == second
+    assert store.get("missing.png") is None
+    assert (store.duplicates, store.duplicate_bytes) == (2, 2 * len(blob))
+
+
+def test_existing_images_are_indexed(make_png):
+    """测试建立存储前已插入的图片会被识别，不再新增部件"""
+    blob = make_png(6)
+    document = Document()
+    document.add_paragraph().add_run().add_picture(BytesIO(blob))
+    store = get_image_store(document)
+    entry = store.add(blob)
+    store.add_picture(document.add_paragraph().add_run(), entry)
+
+    assert len(document.part.package.image_parts) == 1
+    assert len(document.inline_shapes) == 2
+    ids = {shape._inline.docPr.id for shape in document.inline_shapes}
+    assert len(ids) == 2
+
+
+def test_converter_loads_each_source_once(tmp_path, monkeypatch, make_png):
+    """测试转换器对同一来源的图片只读取一次，统计中记录重复图片"""
+    blob = make_png(8)
+    (tmp_path / "a.png").write_bytes(blob)
+    (tmp_path / "b.png").write_bytes(blob)
+    monkeypatch.chdir(tmp_path)
+    loaded = []
+    original = ImageConverter._get_image_data
+
+    def spy(self, src):
+        loaded.append(src)
+        return original(self, src)
+
+    monkeypatch.setattr(ImageConverter, "_get_image_data", spy)
+    converter = BaseConverter(profile=True)
+    document = converter.convert("![a](a.png)\n\n![a](a.png)\n\n文字 ![b](b.png)\n")
+    stats = converter.get_stats()
+
+    assert loaded == ["a.png", "b.png"]
+    assert len(document.inline_shapes) == 3
+    assert len(document.part.package.image_parts) == 1
+    assert stats.images_deduplicated == 2
+    assert stats.image_bytes_deduplicated == 2 * len(blob)
+    assert stats.to_dict()["images_deduplicated"] == 2
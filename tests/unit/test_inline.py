@@ -0,0 +1,139 @@
+"""
+内联渲染测试
+"""
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+from docx.text.run import Run
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.elements.text import TextConverter
+from mddocx.converter.inline import (
+    BOLD,
+    CODE,
+    ITALIC,
+    LINK,
+    STRIKE,
+    apply_format,
+    format_run,
+    run_properties,
+)
+from mddocx.converter.parser import get_converter_parser
+
+
+def runs(paragraph):
+    """段落中文本块（包括超链接中的）的文本和格式"""
+    return [
+        (run.text, bool(run.bold), bool(run.italic))
+        for run in (Run(r, paragraph) for r in paragraph._p.iter(qn("w:r")))
+    ]
+
+
+def convert(text, fast_xml=False):
+    return BaseConverter(fast_xml=fast_xml).convert(text)
+
+
+def test_style_stack_restores_outer_format():
+    """测试嵌套强调结束后恢复外层格式"""
+    document = convert("*斜 **粗斜** 斜* 普通")
+
+    assert runs(document.paragraphs[0]) == [
+        ("斜 ", False, True),
+        ("粗斜", True, True),
+        (" 斜", False, True),
+        (" 普通", False, False),
+    ]
+
+
+def test_spaces_around_inline_elements_are_kept():
+    """测试强调和行内代码前后的空格不会丢失"""
+    document = convert("a **b** `c` d")
+
+    assert document.paragraphs[0].text == "a b c d"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "- 前 **粗 *斜* 粗** [链接](https://a.example) `code` ~~删~~",
+        "> 前 **粗 *斜* 粗** [链接](https://a.example) `code` ~~删~~",
+        "| 列 |\n| - |\n| 前 **粗 *斜* 粗** [链接](https://a.example) `code` ~~删~~ |",
+    ],
+    ids=["list", "blockquote", "table"],
+)
+def test_block_converters_share_renderer(text):
+    """测试列表、引用块和表格单元格的内联内容与普通段落输出相同"""
+    inline = "前 **粗 *斜* 粗** [链接](https://a.example) `code` ~~删~~"
+    expected = convert(inline).paragraphs[0]._p
+    document = convert(text)
+    if document.tables:
+        actual = document.tables[0].cell(1, 0).paragraphs[0]._p
+    else:
+        actual = document.paragraphs[0]._p
+
+    assert [r.xml for r in actual.iter(qn("w:r"))] == [
+        r.xml for r in expected.iter(qn("w:r"))
+    ]
+    assert actual.xpath("string(.)") == expected.xpath("string(.)")
+
+
+def test_marked_link_format():
+    """测试解析器未识别、紧贴链接的强调标记按对应格式输出链接"""
+    document = convert("中文**[链接](https://a.example)**中文")
+    paragraph = document.paragraphs[0]
+
+    assert paragraph._p.xpath("string(.)") == "中文链接中文"
+    assert runs(paragraph) == [
+        ("中文", False, False),
+        ("链接", True, False),
+        ("中文", False, False),
+    ]
+
+
+def test_fast_xml_matches():
+    """测试快速输出时内联内容的 XML 相同"""
+    text = "*斜 **粗斜*** `c` [l](https://a.example)\n\n- **a** `b`\n"
+
+    assert convert(text, True).element.body.xml == convert(text).element.body.xml
+
+
+def test_renderer_without_base_converter():
+    """测试没有基础转换器时链接按普通文本输出"""
+    converter = TextConverter()
+    converter.set_document(Document())
+    tokens = get_converter_parser().parse("**a** [b](https://a.example)")
+    paragraph = converter.convert((tokens[0], tokens[1]))
+
+    assert paragraph.text == "a b"
+    assert [run.bold for run in paragraph.runs] == [True, False]
+
+
+@pytest.mark.parametrize("mask", range((BOLD | ITALIC | STRIKE | CODE | LINK) + 1))
+def test_format_run_matches_apply_format(mask):
+    """测试复制 rPr 模板与逐个设置属性的结果相同"""
+    paragraph = Document().add_paragraph()
+    expected = paragraph.add_run("文本")
+    apply_format(expected, mask)
+    actual = paragraph.add_run("文本")
+    format_run(actual, mask)
+
+    assert actual._r.xml == expected._r.xml
+
+
+def test_run_properties_are_copied():
+    """测试每种格式位只生成一次模板，文本块得到的是副本"""
+    mask = BOLD | CODE
+    template = run_properties(mask)
+    paragraph = Document().add_paragraph()
+    first = paragraph.add_run()
+    second = paragraph.add_run()
+    format_run(first, mask)
+    format_run(second, mask)
+
+    assert run_properties(mask) is template
+    assert run_properties(LINK) is None
+    assert first._r.rPr is not template
+    assert first._r.rPr is not second._r.rPr
+    first.bold = False
+    assert second.bold is True
@@ -0,0 +1,150 @@
+"""
+调试日志测试
+"""
+
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from mddocx.converter.base import BaseConverter
+from mddocx.log import (
+    LOGGER_NAME,
+    add_debug_file_handler,
+    debug_enabled,
+    debug_output,
+    enable_debug_output,
+    with_debug_scope,
+)
+
+CONTENT = "# 标题\n\n段落 **加粗** [链接](https://example.com)\n\n- 列表\n"
+
+
+@pytest.fixture
+def mddocx_logger():
+    """测试结束后恢复 mddocx 日志记录器的配置"""
+    logger = logging.getLogger(LOGGER_NAME)
+    handlers = list(logger.handlers)
+    level = logger.level
+    propagate = logger.propagate
+    yield logger
+    for handler in logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    logger.handlers = handlers
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+class TestDebugLogging:
+    """调试日志测试"""
+
+    def test_no_logging_without_debug(self, mddocx_logger, caplog):
+        """测试非调试模式即使日志级别为 DEBUG 也不产生调试记录"""
+        converter = BaseConverter()
+        with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+            with patch("mddocx.converter.elements.text.logger.debug") as text_debug:
+                converter.convert(CONTENT)
+
+        assert not text_debug.called
+        assert not [r for r in caplog.records if r.name.startswith(LOGGER_NAME)]
+
+    def test_debug_flag_resolved_per_conversion(self, mddocx_logger, caplog):
+        """测试调试开关在每次转换开始时同步到元素转换器"""
+        converter = BaseConverter(debug=True)
+        with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+            converter.convert(CONTENT)
+        assert all(c.debug for c in converter.converters.values())
+        names = {r.name for r in caplog.records}
+        assert "mddocx.converter.base" in names
+        assert "mddocx.converter.elements.text" in names
+
+        converter.debug = False
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+            converter.convert(CONTENT)
+        assert not any(c.debug for c in converter.converters.values())
+        assert not caplog.records
+
+    def test_enable_debug_output_without_config(self, mddocx_logger):
+        """测试没有任何日志配置时调试信息输出到控制台"""
+        stream = io.StringIO()
+        with patch.object(logging.Logger, "hasHandlers", return_value=False):
+            handler = enable_debug_output(stream)
+        assert handler in mddocx_logger.handlers
+
+        BaseConverter(debug=True).convert("# 标题")
+        assert "Processing token" in stream.getvalue()
+
+    def test_debug_file_handler(self, mddocx_logger, tmp_path):
+        """测试调试日志写入文件"""
+        path = tmp_path / "debug.log"
+        handler = add_debug_file_handler(str(path), propagate=False)
+        assert mddocx_logger.propagate is False
+
+        BaseConverter(debug=True).convert(CONTENT)
+        handler.flush()
+
+        text = path.read_text(encoding="utf-8")
+        assert "mddocx.converter.base" in text
+        assert "处理段落" in text
+
+    def test_debug_output_is_scoped(self, mddocx_logger, capsys):
+        """测试调试信息默认输出到标准错误，转换结束后恢复日志配置"""
+        handlers = list(mddocx_logger.handlers)
+        level = mddocx_logger.level
+        with patch.object(logging.Logger, "hasHandlers", return_value=False):
+            converter = BaseConverter(debug=True)
+            converter.convert("# 标题")
+
+        captured = capsys.readouterr()
+        assert "Processing token" in captured.err
+        assert "Processing token" not in captured.out
+        assert mddocx_logger.handlers == handlers
+        assert mddocx_logger.level == level
+
+        # 之后的非调试转换不再产生 mddocx 的调试记录
+        with patch.object(logging.Logger, "hasHandlers", return_value=False):
+            BaseConverter().convert("# 标题")
+        assert not capsys.readouterr().err
+
+    def test_debug_scope_per_context(self, mddocx_logger):
+        """测试调试范围只作用于当前上下文，线程池任务包装后沿用"""
+        stream = io.StringIO()
+        cache_logger = logging.getLogger("mddocx.converter.disk_cache")
+        seen = {}
+
+        def other():
+            seen["other"] = debug_enabled()
+            cache_logger.debug("其他线程")
+
+        with patch.object(logging.Logger, "hasHandlers", return_value=False):
+            with debug_output(stream):
+                thread = threading.Thread(target=other)
+                thread.start()
+                thread.join()
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    seen["pool"] = executor.submit(
+                        with_debug_scope(debug_enabled)
+                    ).result()
+                cache_logger.debug("调试范围内")
+
+        assert seen == {"other": False, "pool": True}
+        assert "调试范围内" in stream.getvalue()
+        assert "其他线程" not in stream.getvalue()
+        assert not debug_enabled()
+
+    def test_prefetch_threads_log_in_debug_conversion(self, mddocx_logger):
+        """测试只有调试模式的转换输出预取线程中的调试信息"""
+        stream = io.StringIO()
+        text = "![图](http://127.0.0.1:9/missing.png)\n"
+        mddocx_logger.addHandler(logging.StreamHandler(stream))
+        mddocx_logger.setLevel(logging.DEBUG)
+
+        BaseConverter().convert(text)
+        assert "下载图片失败" not in stream.getvalue()
+        BaseConverter(debug=True).convert(text)
+        assert "下载图片失败" in stream.getvalue()
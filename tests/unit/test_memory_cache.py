@@ -0,0 +1,88 @@
+"""
+图片内存缓存测试
+"""
+
+import pytest
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.disk_cache import DiskImageCache
+from mddocx.converter.memory_cache import ImageMemoryCache
+
+
+def test_lru_within_budget():
+    """测试超过大小上限时淘汰最久未用的图片"""
+    cache = ImageMemoryCache(max_bytes=25)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    assert cache.get("a") == b"a" * 10
+    cache.put("c", b"c" * 10)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.nbytes == 20
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+
+def test_replace_and_oversize():
+    """测试替换已有图片时更新占用字节数，超过上限的单张图片不缓存"""
+    cache = ImageMemoryCache(max_bytes=10)
+    cache.put("a", b"a" * 4)
+    cache.put("a", b"a" * 6)
+    assert cache.nbytes == 6
+
+    assert not cache.put("big", b"x" * 11)
+    assert "big" not in cache
+    assert cache.get("a") == b"a" * 6
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+    assert cache.hits == 1
+    cache.reset_counters()
+    assert cache.hits == 0
+
+
+def test_invalid_size():
+    """测试大小上限不能为负数"""
+    with pytest.raises(ValueError):
+        ImageMemoryCache(max_bytes=-1)
+
+
+def test_mapped_entries(tmp_path):
+    """测试缓存映射磁盘缓存文件的只读视图"""
+    disk = DiskImageCache(tmp_path)
+    entry = disk.store("https://a.example/1.png", b"image")
+    view = disk.map(entry)
+    cache = ImageMemoryCache()
+    cache.put(entry.url, view)
+
+    assert isinstance(view, memoryview) and view.readonly
+    assert cache.nbytes == 5
+    assert bytes(cache.get(entry.url)) == b"image"
+    assert disk.map(disk.store("empty", b"")) == b""
+
+
+def test_reused_converter_stays_within_budget(tmp_path, make_png):
+    """测试复用转换器时图片内存缓存不超过上限，命中和淘汰次数计入统计"""
+    paths = []
+    for k in range(3):
+        path = tmp_path / f"{k}.png"
+        path.write_bytes(make_png(k + 1))
+        paths.append(path)
+    budget = path.stat().st_size * 2
+    converter = BaseConverter(profile=True, image_memory_max_bytes=budget)
+    converter.convert("".join(f"![{p.name}]({p})\n\n" for p in paths))
+    first = converter.get_stats()
+    assert first.memory_cache_misses == 3
+    assert first.memory_cache_evictions == 1
+    assert first.memory_cache_bytes <= budget
+
+    converter.reset()
+    document = converter.convert(f"![a]({paths[2]})\n\n![b]({paths[0]})\n")
+    stats = converter.get_stats()
+
+    assert len(document.inline_shapes) == 2
+    assert (stats.memory_cache_hits, stats.memory_cache_misses) == (1, 1)
+    assert stats.memory_cache_bytes <= budget
+    assert stats.to_dict()["memory_cache_hits"] == 1
+    assert "内存缓存命中 1 次" in stats.format()
@@ -0,0 +1,153 @@
+"""
+OOXML 快速输出测试
+"""
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.ooxml import OoxmlWriter, RunCoalescer, append_text
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+# 图片示例包含在线图片，不参与比较
+SAMPLES = sorted(
+    path for path in SAMPLES_DIR.glob("**/*.md") if path.name != "image.md"
+)
+
+
+def convert(text, fast_xml):
+    return BaseConverter(fast_xml=fast_xml).convert(text)
+
+
+@pytest.mark.parametrize("path", SAMPLES, ids=lambda p: p.name)
+def test_matches_python_docx_output(path):
+    """测试快速输出与 python-docx 输出的 XML 完全相同"""
+    text = path.read_text(encoding="utf-8")
+    expected = convert(text, fast_xml=False)
+    actual = convert(text, fast_xml=True)
+
+    assert actual.element.body.xml == expected.element.body.xml
+    assert [s.name for s in actual.styles] == [s.name for s in expected.styles]
+
+
+def test_mixed_content_order():
+    """测试快速输出与其他转换器交替输出时顺序正确，分节属性保持在最后"""
+    text = "# 标题\n\n段落 **粗体** `code`\n\n| a | b |\n| - | - |\n| 1 | 2 |\n\n结尾\n"
+    expected = convert(text, fast_xml=False)
+    actual = convert(text, fast_xml=True)
+
+    assert actual.element.body.xml == expected.element.body.xml
+    assert actual.element.body[-1].tag.endswith("sectPr")
+
+
+def test_run_text_special_characters():
+    """测试文本中的空白和制表符与 python-docx 的处理一致"""
+    expected = Document()
+    writer = OoxmlWriter(Document())
+    for text in ["普通文本", " 前后空格 ", "a\tb", "第一行\n第二行", ""]:
+        expected.add_paragraph().add_run(text)
+        writer.add_run(writer.add_paragraph(), text)
+
+    assert writer.document.element.body.xml == expected.element.body.xml
+
+
+def test_run_templates_are_copied():
+    """测试同一格式的文本块互不共享元素"""
+    writer = OoxmlWriter(Document())
+    paragraph = writer.add_paragraph()
+
+    def bold(run):
+        run.bold = True
+
+    first = writer.add_run(paragraph, "一", ("test_bold",), bold)
+    second = writer.add_run(paragraph, "二", ("test_bold",), bold)
+
+    assert first.rPr is not second.rPr
+    assert [run.bold for run in paragraph.runs] == [True, True]
+    assert paragraph.text == "一二"
+
+
+def test_paragraph_style_id():
+    """测试段落样式 ID 与 python-docx 的解析结果一致"""
+    document = Document()
+    writer = OoxmlWriter(document)
+
+    assert writer.paragraph_style_id("Heading 1") == "Heading1"
+    assert writer.paragraph_style_id("Normal") is None
+    paragraph = writer.add_paragraph(writer.paragraph_style_id("Heading 2"))
+    assert paragraph.style.name == "Heading 2"
+
+
+def test_reset_creates_new_writer():
+    """测试 reset 后快速输出器绑定到新文档"""
+    converter = BaseConverter(fast_xml=True)
+    converter.convert("第一篇")
+    writer = converter.writer
+
+    document = converter.reset()
+    assert converter.writer is not writer
+    assert converter.writer.document is document
+    converter.convert("第二篇")
+    assert [p.text for p in document.paragraphs] == ["第二篇"]
+    assert BaseConverter().writer is None
+
+
+@pytest.mark.parametrize(
+    "text", ["abc", " 首尾空格 ", "a\tb\tc", "第一行\n\n第三行\r\n", "\n", "\t x"]
+)
+def test_append_text_matches_run_text(text):
+    """测试 append_text 与 python-docx 设置 Run.text 的结果相同"""
+    paragraph = Document().add_paragraph()
+    expected = paragraph.add_run(text)._r
+    actual = paragraph.add_run()._r
+    append_text(actual, text)
+
+    assert actual.xml == expected.xml
+
+
+class TestRunCoalescer:
+    """相邻同格式文本块合并测试"""
+
+    def test_merges_same_key(self):
+        """测试相同格式键的相邻文本合并到同一个文本块"""
+        paragraph = Document().add_paragraph()
+        runs = RunCoalescer()
+        runs.record("plain", paragraph.add_run("a ")._r)
+
+        assert runs.extend(paragraph, "plain", "b")
+        assert len(paragraph.runs) == 1
+        t = paragraph.runs[0]._r[-1]
+        assert t.text == "a b"
+        # 合并后首尾不再有空白，不需要保留空白属性
+        assert t.get(qn("xml:space")) is None
+
+    def test_keeps_different_key(self):
+        """测试格式键不同时不合并"""
+        paragraph = Document().add_paragraph()
+        runs = RunCoalescer()
+        runs.record("plain", paragraph.add_run("a")._r)
+        assert not runs.extend(paragraph, "bold", "b")
+
+    def test_stops_at_other_content(self):
+        """测试文本块之后插入了其他内容或换了段落时不合并"""
+        document = Document()
+        paragraph = document.add_paragraph()
+        runs = RunCoalescer()
+        runs.record("plain", paragraph.add_run("a")._r)
+        paragraph.add_run("b")
+
+        assert not runs.extend(paragraph, "plain", "c")
+        assert not runs.extend(document.add_paragraph(), "plain", "c")
+
+    def test_converter_merges_adjacent_runs(self):
+        """测试转换器输出时合并相邻的同格式文本"""
+        for fast_xml in (False, True):
+            doc = convert("**加粗**__同样加粗__ 普通", fast_xml)
+            runs = doc.paragraphs[0].runs
+            assert [(run.text, run.bold) for run in runs] == [
+                ("加粗同样加粗", True),
+                (" 普通", False),
+            ]
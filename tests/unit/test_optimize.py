@@ -0,0 +1,151 @@
+"""
+图片优化测试，需要安装 Pillow
+"""
+
+import os
+from io import BytesIO
+
+import pytest
+
+from mddocx.converter import optimize
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.optimize import ImageOptimizer
+
+PILImage = pytest.importorskip("PIL.Image")
+
+
+def make_jpeg(width, height, dpi=(72, 72), exif=None):
+    """生成像素为随机噪声的 JPEG，模拟相机拍摄的照片"""
+    image = PILImage.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    out = BytesIO()
+    options = {"exif": exif} if exif else {}
+    image.save(out, "JPEG", quality=95, dpi=dpi, **options)
+    return out.getvalue()
+
+
+def test_target_size():
+    """测试按显示尺寸和分辨率计算像素尺寸，只缩小不放大并保持宽高比"""
+    optimizer = ImageOptimizer(dpi=144)
+
+    # 72 磅 = 1 英寸 = 144 像素
+    assert optimizer.target_size((1440, 960), 72) == (144, 96)
+    assert optimizer.target_size((1440, 960), None, 72) == (216, 144)
+    # 宽高比不同时，两边都不少于需要的像素数
+    assert optimizer.target_size((1440, 960), 72, 72) == (216, 144)
+    assert optimizer.target_size((100, 50), 72) == (100, 50)
+    assert optimizer.target_size((1440, 960)) == (1440, 960)
+
+
+def test_downscale_jpeg():
+    """测试缩小 JPEG，按比例调整分辨率并保留 EXIF"""
+    exif = PILImage.Exif()
+    exif[0x0112] = 6
+    data = make_jpeg(800, 600, dpi=(300, 300), exif=exif.tobytes())
+    optimizer = ImageOptimizer(dpi=100, quality=80)
+
+    result = optimizer.optimize(data, 72)
+
+    assert result.saved == len(data) - len(result.data) > 0
+    with PILImage.open(BytesIO(result.data)) as image:
+        assert image.format == "JPEG"
+        assert image.size == (100, 75)
+        assert round(image.info["dpi"][0]) == round(300 * 100 / 800)
+        assert image.getexif()[0x0112] == 6
+
+
+def test_passthrough():
+    """测试无法处理的数据和不能变小的图片原样返回"""
+    optimizer = ImageOptimizer()
+    gif = BytesIO()
+    PILImage.new("RGB", (400, 400)).save(gif, "GIF")
+
+    for data in (b"not an image", gif.getvalue()):
+        assert optimizer.optimize(data, 10) == (data, 0)
+    png = BytesIO()
+    PILImage.frombytes("RGB", (16, 16), os.urandom(768)).save(png, "PNG", optimize=True)
+    data = png.getvalue()
+    assert optimizer.optimize(data).data is data
+
+
+def test_results_cached():
+    """测试结果按内容、目标尺寸和质量缓存"""
+    data = make_jpeg(400, 300)
+    optimizer = ImageOptimizer(dpi=72)
+
+    first = optimizer.optimize(data, 100)
+    second = optimizer.optimize(bytes(data), 100)
+    optimizer.optimize(data, 50)
+
+    assert second.data is first.data
+    assert (optimizer._cache.hits, optimizer._cache.misses) == (1, 2)
+
+
+def test_optimize_many():
+    """测试线程池按键返回全部结果"""
+    images = [make_jpeg(300 + k, 200) for k in range(6)]
+    optimizer = ImageOptimizer(dpi=72, max_workers=2)
+
+    results = optimizer.optimize_many(
+        (k, data, 50, None) for k, data in enumerate(images)
+    )
+
+    assert sorted(results) == list(range(6))
+    assert all(results[k].saved > 0 for k in range(6))
+
+
+def test_convert_with_optimization(tmp_path):
+    """测试转换时按显示尺寸优化图片，显示尺寸不变，统计节省的字节数"""
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(1200, 900))
+    text = f"![a|120x90]({path})\n\n![b]({path})\n\n文字 ![a|120x90]({path})\n"
+    plain = BaseConverter().convert(text)
+    converter = BaseConverter(profile=True, optimize_images=True)
+    document = converter.convert(text)
+    stats = converter.get_stats()
+
+    shapes = [(s.width, s.height) for s in document.inline_shapes]
+    assert (
+        shapes[0]
+        == shapes[2]
+        == (plain.inline_shapes[0].width, plain.inline_shapes[0].height)
+    )
+    assert shapes[1][0] == plain.inline_shapes[1].width
+    # 两个显示尺寸各优化一次，相同尺寸的图片共用图片部件
+    assert stats.images_optimized == 2
+    assert stats.image_bytes_saved > path.stat().st_size
+    assert len(document.part.package.image_parts) == 2
+    assert stats.to_dict()["image_bytes_saved"] == stats.image_bytes_saved
+
+
+def test_requires_pillow(monkeypatch):
+    """测试没有安装 Pillow 时开启优化报错"""
+    monkeypatch.setattr(optimize, "PIL_AVAILABLE", False)
+    with pytest.raises(ImportError):
+        BaseConverter(optimize_images=True)
+
+
+def test_invalid_settings():
+    """测试无效的分辨率和质量"""
+    with pytest.raises(ValueError):
+        ImageOptimizer(dpi=0)
+    with pytest.raises(ValueError):
+        ImageOptimizer(quality=100)
+
+
+def test_block_image_uses_prefetched_result(tmp_path):
+    """测试独立图片生成时使用生成之前优化的结果，不再重复优化"""
+    from markdown_it.token import Token
+
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(make_jpeg(600, 400))
+    token = Token("image", "img", 0, attrs={"src": str(path)}, content="图")
+    converter = BaseConverter(optimize_images=True)
+    image_converter = converter.converters["image"]
+    optimizer = converter.image_optimizer
+
+    assert image_converter.optimize([token], optimizer) == 1
+    image_converter.convert((token, token))
+
+    assert image_converter._optimized == {}
+    assert (optimizer._cache.hits, optimizer._cache.misses) == (0, 1)
+    assert len(converter.document.inline_shapes) == 1
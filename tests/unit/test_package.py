@@ -0,0 +1,191 @@
+"""
+DOCX 流式打包测试
+"""
+
+import io
+import os
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.package import COMPRESSION_PROFILES, iter_docx, save_docx
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+SAMPLES = sorted(SAMPLES_DIR.glob("**/*.md"))
+
+# 1x1 像素 PNG
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c63f8cfc0f01f0005000201a5f2d6f0"
+    "0000000049454e44ae426082"
+)
+
+
+class WriteOnly:
+    """只有 write 方法的输出流，模拟管道、套接字等不可 seek 的目标"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def entries(data):
+    """按顺序读出 ZIP 中的所有条目"""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return [(name, zf.read(name)) for name in zf.namelist()]
+
+
+def python_docx_bytes(document):
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("path", SAMPLES, ids=lambda p: p.name)
+def test_entries_match_python_docx(path):
+    """测试各个条目的内容和顺序与 Document.save 完全相同"""
+    document = BaseConverter().convert(path.read_text(encoding="utf-8"))
+    stream = io.BytesIO()
+    save_docx(document, stream)
+
+    assert entries(stream.getvalue()) == entries(python_docx_bytes(document))
+
+
+def test_images_and_reopen(tmp_path):
+    """测试包含图片的文档流式保存后能被重新打开"""
+    image = tmp_path / "pixel.png"
+    image.write_bytes(PNG)
+    text = "\n\n".join(f"段落 {k}\n\n![图]({image.as_posix()})" for k in range(3))
+    document = BaseConverter().convert(text)
+    target = tmp_path / "out.docx"
+    save_docx(document, str(target))
+
+    assert entries(target.read_bytes()) == entries(python_docx_bytes(document))
+    reopened = Document(str(target))
+    assert len(reopened.inline_shapes) == 3
+    assert reopened.paragraphs[0].text == "段落 0"
+
+
+def test_non_seekable_target():
+    """测试目标流不支持 seek/tell 时仍能生成有效文件"""
+    document = BaseConverter().convert("# 标题\n\n正文")
+    stream = WriteOnly()
+    save_docx(document, stream)
+
+    assert entries(bytes(stream.data)) == entries(python_docx_bytes(document))
+
+
+def test_pipe_target():
+    """测试写入管道"""
+    document = BaseConverter().convert("- 一\n- 二\n")
+    read_fd, write_fd = os.pipe()
+    received = []
+    reader = threading.Thread(
+        target=lambda: received.append(os.fdopen(read_fd, "rb").read())
+    )
+    reader.start()
+    with os.fdopen(write_fd, "wb") as pipe:
+        save_docx(document, pipe)
+    reader.join()
+
+    assert Document(io.BytesIO(received[0])).paragraphs[1].text == "二"
+
+
+def test_iter_docx_chunks():
+    """测试逐块生成的数据拼接后是完整文件，除最后一块外不小于 chunk_size"""
+    document = BaseConverter().convert("\n\n".join(f"段落 {k}" for k in range(2000)))
+    chunks = list(iter_docx(document, chunk_size=4096))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 4096 for chunk in chunks[:-1])
+    data = b"".join(chunks)
+    assert entries(data) == entries(python_docx_bytes(document))
+
+
+def test_converter_save_uses_streaming_writer():
+    """测试 BaseConverter.save 可以写入不可 seek 的流"""
+    converter = BaseConverter()
+    converter.convert("**加粗** 文本")
+    stream = WriteOnly()
+    converter.save(stream)
+
+    assert Document(io.BytesIO(bytes(stream.data))).paragraphs[0].text == "加粗 文本"
+
+
+class TestCompressionProfiles:
+    """压缩配置测试"""
+
+    @staticmethod
+    def image_document(tmp_path):
+        image = tmp_path / "pixel.png"
+        image.write_bytes(PNG)
+        text = "\n\n".join(["# 标题", "正文 " * 200, f"![图]({image.as_posix()})"])
+        return BaseConverter().convert(text)
+
+    @staticmethod
+    def compress_types(data):
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            return {info.filename: info.compress_type for info in zf.infolist()}
+
+    @pytest.mark.parametrize("name", sorted(COMPRESSION_PROFILES))
+    def test_profiles_keep_content(self, tmp_path, name):
+        """测试各个压缩配置只改变压缩方式，不改变条目内容"""
+        document = self.image_document(tmp_path)
+        stream = io.BytesIO()
+        save_docx(document, stream, name)
+
+        assert entries(stream.getvalue()) == entries(python_docx_bytes(document))
+        assert b"".join(iter_docx(document, compression=name)) != b""
+
+    def test_store_and_store_media(self, tmp_path):
+        """测试 store 不压缩任何条目，store-media 只不压缩图片"""
+        document = self.image_document(tmp_path)
+        stored = io.BytesIO()
+        save_docx(document, stored, "store")
+        media = io.BytesIO()
+        save_docx(document, media, "store-media")
+
+        assert set(self.compress_types(stored.getvalue()).values()) == {
+            zipfile.ZIP_STORED
+        }
+        types = self.compress_types(media.getvalue())
+        assert types["word/media/image1.png"] == zipfile.ZIP_STORED
+        assert types["word/document.xml"] == zipfile.ZIP_DEFLATED
+
+    def test_sizes_follow_profiles(self, tmp_path):
+        """测试输出大小：不压缩最大，最大压缩不大于默认"""
+        document = self.image_document(tmp_path)
+        sizes = {}
+        for name in ("store", "default", "max"):
+            stream = io.BytesIO()
+            save_docx(document, stream, name)
+            sizes[name] = len(stream.getvalue())
+
+        assert sizes["store"] > sizes["default"] >= sizes["max"]
+
+    def test_unknown_profile(self):
+        """测试未知的压缩配置"""
+        with pytest.raises(ValueError):
+            save_docx(Document(), io.BytesIO(), "zstd")
+        with pytest.raises(ValueError):
+            BaseConverter(compression="zstd")
+
+    def test_converter_compression(self):
+        """测试 BaseConverter.save 使用转换器的压缩配置"""
+        converter = BaseConverter(compression="store")
+        converter.convert("正文")
+        stream = io.BytesIO()
+        converter.save(stream)
+
+        types = set(self.compress_types(stream.getvalue()).values())
+        assert types == {zipfile.ZIP_STORED}
@@ -0,0 +1,115 @@
+"""
+多进程转换测试
+"""
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from mddocx.cli import convert_file
+from mddocx.converter.base import BaseConverter
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+# 图片示例包含在线图片，不参与逐块比较
+PARALLEL_SAMPLES = sorted(
+    path for path in SAMPLES_DIR.glob("basic/*.md") if path.name != "image.md"
+)
+
+
+def package_state(doc):
+    """正文、关系和样式，用于比较两个文档"""
+    rels = [
+        (r_id, rel.target_ref if rel.is_external else str(rel.target_part.partname))
+        for r_id, rel in doc.part.rels.items()
+    ]
+    styles = [style.styleId for style in doc.styles.element.style_lst]
+    return doc.element.body.xml, rels, styles
+
+
+class TestConvertParallel:
+    """多进程转换测试"""
+
+    @pytest.mark.parametrize(
+        "sample", PARALLEL_SAMPLES, ids=[path.name for path in PARALLEL_SAMPLES]
+    )
+    def test_matches_serial_conversion(self, sample):
+        """测试多进程转换的结果与串行转换一致"""
+        text = sample.read_text(encoding="utf-8")
+        expected = package_state(BaseConverter().convert(text))
+
+        doc = BaseConverter().convert_parallel(text, workers=2, chunk_size=512)
+
+        assert package_state(doc) == expected
+
+    def test_relationships_renumbered(self, tmp_path, make_png):
+        """测试各块中的超链接和图片关系被重新编号"""
+        red = tmp_path / "red.png"
+        blue = tmp_path / "blue.png"
+        red.write_bytes(make_png(4, 2))
+        blue.write_bytes(make_png(2, 2))
+        text = (
+            f"[甲](https://a.example)\n\n![红]({red})\n\n"
+            f"[乙](https://b.example) 和 [甲](https://a.example)\n\n"
+            f"![蓝|20x20]({blue})\n\n行内 ![红]({red}) 图片\n"
+        )
+        expected = package_state(BaseConverter().convert(text))
+
+        doc = BaseConverter().convert_parallel(text, workers=2, chunk_size=1)
+
+        assert package_state(doc) == expected
+        doc_pr_ids = doc.element.body.xpath("//wp:docPr/@id")
+        assert len(doc_pr_ids) == 3
+        assert len(set(doc_pr_ids)) == 3
+
+    def test_mixed_serial_and_parallel_shape_ids(self, tmp_path, make_png):
+        """测试同一文档交替串行和多进程转换时图片编号不重复"""
+        image = tmp_path / "red.png"
+        image.write_bytes(make_png(4, 2))
+        text = f"![甲]({image})\n\n![乙]({image})\n"
+
+        converter = BaseConverter()
+        converter.convert(text)
+        converter.convert_parallel(text, workers=2, chunk_size=1)
+        doc = converter.convert(text)
+
+        doc_pr_ids = doc.element.body.xpath("//wp:docPr/@id")
+        assert doc_pr_ids == ["1", "2", "3", "4", "5", "6"]
+
+    def test_code_block_spacing_across_chunks(self):
+        """测试跨块的代码块之间保留空段落"""
+        text = "```\na\n```\n\n段落\n\n```\nb\n```\n\n```\nc\n```\n"
+        expected = package_state(BaseConverter().convert(text))
+
+        converter = BaseConverter()
+        doc = converter.convert_parallel(text, workers=2, chunk_size=1)
+
+        assert package_state(doc) == expected
+        assert converter.converters["code"]._last_was_code
+
+    def test_reference_definitions_across_chunks(self):
+        """测试引用式链接的定义随每个块发送给工作进程"""
+        text = "[链接][1]\n\n段落\n\n[1]: https://example.com\n\n[又一个][1]\n"
+        expected = package_state(BaseConverter().convert(text))
+
+        doc = BaseConverter().convert_parallel(text, workers=2, chunk_size=1)
+
+        assert package_state(doc) == expected
+        assert doc.paragraphs[0].text == "链接"
+
+    def test_single_worker_converts_in_process(self):
+        """测试单个工作进程时直接在当前进程中逐块转换"""
+        doc = BaseConverter().convert_parallel("# 标题\n\n段落\n", workers=1)
+        assert [p.text for p in doc.paragraphs] == ["标题", "段落"]
+
+
+def test_cli_workers(tmp_path):
+    """测试命令行的并行转换"""
+    md_path = tmp_path / "input.md"
+    docx_path = tmp_path / "output.docx"
+    md_path.write_text("# 标题\n\n段落\n\n- 列表\n", encoding="utf-8")
+
+    convert_file(str(md_path), str(docx_path), workers=2)
+
+    texts = [p.text for p in Document(str(docx_path)).paragraphs]
+    assert texts == ["标题", "段落", "列表"]
@@ -0,0 +1,63 @@
+"""
+解析器缓存测试
+"""
+
+from markdown_it import MarkdownIt
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.parser import (
+    clear_parser_cache,
+    get_converter_parser,
+    get_parser,
+)
+
+
+def test_same_config_returns_cached_parser():
+    """测试相同配置返回同一个解析器"""
+    first = get_parser("commonmark", {"html": True}, ("table", "strikethrough"))
+    second = get_parser("commonmark", {"html": True}, ("strikethrough", "table"))
+    assert first is second
+
+
+def test_different_config_returns_different_parser():
+    """测试不同配置返回不同的解析器"""
+    assert get_parser() is not get_parser("commonmark", {"breaks": True})
+    assert get_parser() is not get_parser("commonmark", enable=("table",))
+
+
+def test_plugins_are_part_of_key():
+    """测试插件参与缓存键"""
+    calls = []
+
+    def plugin(md):
+        calls.append(md)
+
+    parser = get_parser(plugins=(plugin,))
+    assert get_parser(plugins=(plugin,)) is parser
+    assert calls == [parser]
+    assert get_parser() is not parser
+
+
+def test_converter_parser_matches_previous_chain():
+    """测试转换器解析器与原先的构建方式等价"""
+    expected = (
+        MarkdownIt("commonmark", {"breaks": True, "html": True})
+        .enable("strikethrough")
+        .enable("emphasis")
+        .enable("table")
+    )
+    parser = get_converter_parser()
+    assert parser.get_active_rules() == expected.get_active_rules()
+    assert parser.options == expected.options
+
+
+def test_converters_share_parser():
+    """测试多个转换器共享解析器"""
+    assert BaseConverter().md is BaseConverter().md
+
+
+def test_clear_parser_cache():
+    """测试清空缓存后重新构建"""
+    parser = get_converter_parser()
+    clear_parser_cache()
+    assert get_converter_parser() is not parser
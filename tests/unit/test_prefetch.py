@@ -0,0 +1,212 @@
+"""
+在线图片预取测试，使用本地 HTTP 服务器代替真实的图片服务
+"""
+
+import errno
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mddocx.converter import disk_cache
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.parser import get_converter_parser
+from mddocx.converter.prefetch import Fetched, ImagePrefetcher, remote_image_sources
+
+
+class ImageServer(ThreadingHTTPServer):
+    """提供 /<n>.png 图片的本地服务器，记录请求路径和客户端连接"""
+
+    daemon_threads = True
+
+    def __init__(self, make_png):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.images = {f"/{k}.png": make_png(k + 1) for k in range(8)}
+        self.paths = []
+        self.clients = set()
+        # 每个请求的 If-None-Match 请求头
+        self.conditional = []
+        # 设置后每个请求都要等到指定数量的请求同时到达才返回
+        self.barrier = None
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 保持连接，客户端可以复用
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            server.clients.add(self.client_address)
+        if server.barrier is not None:
+            server.barrier.wait()
+        with server.lock:
+            server.conditional.append(self.headers.get("If-None-Match"))
+        data = server.images.get(self.path)
+        etag = f'"{zlib.crc32(data)}"' if data else None
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200 if data else 404)
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data or b"")))
+        self.end_headers()
+        self.wfile.write(data or b"")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(make_png):
+    server = ImageServer(make_png)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_remote_image_sources():
+    """测试按首次出现顺序收集在线图片地址，忽略本地图片"""
+    text = (
+        "![a](https://a.example/1.png) ![b](local.png)\n\n"
+        "- ![c](http://a.example/2.png)\n\n"
+        "| 图 |\n| - |\n| ![d](https://a.example/1.png) |\n"
+    )
+    tokens = get_converter_parser().parse(text)
+
+    assert remote_image_sources(tokens) == [
+        "https://a.example/1.png",
+        "http://a.example/2.png",
+    ]
+
+
+def test_fetch_concurrently(server):
+    """测试图片并发下载：服务器要求两个请求同时到达才返回"""
+    server.barrier = threading.Barrier(2, timeout=5)
+    urls = [server.url("/0.png"), server.url("/1.png")]
+
+    result = ImagePrefetcher(max_workers=2).fetch(urls)
+
+    assert result == {
+        urls[0]: Fetched(server.images["/0.png"]),
+        urls[1]: Fetched(server.images["/1.png"]),
+    }
+
+
+def test_connections_reused(server):
+    """测试下载线程共用连接池，连接数不超过线程数"""
+    prefetcher = ImagePrefetcher(max_workers=2)
+    urls = [server.url(f"/{k}.png") for k in range(8)]
+
+    result = prefetcher.fetch(urls)
+    prefetcher.close()
+
+    assert all(
+        result[url].data == server.images[f"/{k}.png"] for k, url in enumerate(urls)
+    )
+    assert len(server.clients) <= 2
+
+
+def test_convert_reads_prefetched_images(server, monkeypatch):
+    """测试转换时图片在生成之前下载完毕，失败的图片不会在生成阶段重试"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("生成阶段不应下载图片")
+
+    monkeypatch.setattr("mddocx.converter.elements.image.requests.get", fail)
+    text = (
+        f"![a]({server.url('/0.png')})\n\n"
+        f"文字 ![b]({server.url('/1.png')}) ![a]({server.url('/0.png')})\n\n"
+        f"![missing]({server.url('/missing.png')})\n"
+    )
+    converter = BaseConverter(profile=True)
+    document = converter.convert(text)
+    stats = converter.get_stats()
+
+    assert sorted(server.paths) == ["/0.png", "/1.png", "/missing.png"]
+    assert len(document.inline_shapes) == 3
+    assert stats.bytes_fetched == len(server.images["/0.png"]) + len(
+        server.images["/1.png"]
+    )
+    assert stats.fetch_time > 0
+    assert stats.to_dict()["fetch_time"] == stats.fetch_time
+
+
+def test_prefetch_disabled(server):
+    """测试关闭预取时在生成阶段逐个下载"""
+    converter = BaseConverter(prefetch_images=False)
+    document = converter.convert(f"![a]({server.url('/2.png')})\n")
+
+    assert converter.prefetcher is None
+    assert server.paths == ["/2.png"]
+    assert len(document.inline_shapes) == 1
+
+
+def test_disk_cache_revalidation(server, tmp_path, make_png):
+    """测试磁盘缓存在转换器之间共用，再次使用时发送条件请求，未修改时不再下载"""
+    text = f"![a]({server.url('/3.png')})\n\n![b]({server.url('/4.png')})\n"
+    first = BaseConverter(profile=True, image_cache_dir=tmp_path)
+    first.convert(text)
+    server.images["/4.png"] = make_png(40)
+    second = BaseConverter(profile=True, image_cache_dir=tmp_path)
+    document = second.convert(text)
+    stats = second.get_stats()
+
+    assert len(document.inline_shapes) == 2
+    # 第一次没有缓存；第二次两张都带 ETag，其中 /4.png 已修改，重新下载
+    assert server.conditional[:2] == [None, None]
+    assert all(server.conditional[2:])
+    assert stats.image_cache_hits == 1
+    assert stats.bytes_fetched == len(server.images["/4.png"])
+    assert second.image_cache.lookup(server.url("/4.png")).size == len(
+        server.images["/4.png"]
+    )
+
+
+def test_disk_cache_used_when_offline(server, tmp_path):
+    """测试无法连接服务器时使用磁盘缓存中的图片"""
+    url = server.url("/5.png")
+    BaseConverter(image_cache_dir=tmp_path).convert(f"![a]({url})\n")
+    server.shutdown()
+    server.server_close()
+    converter = BaseConverter(profile=True, image_cache_dir=tmp_path)
+    document = converter.convert(f"![a]({url})\n")
+
+    assert len(document.inline_shapes) == 1
+    assert converter.get_stats().image_cache_hits == 1
+
+
+def test_invalid_workers():
+    """测试下载线程数必须大于 0"""
+    with pytest.raises(ValueError):
+        BaseConverter(image_workers=0)
+
+
+def test_disk_cache_read_error_downloads_again(server, tmp_path, monkeypatch):
+    """测试无法读取缓存的图片（例如文件描述符耗尽）时重新下载"""
+    url = server.url("/6.png")
+    BaseConverter(image_cache_dir=tmp_path).convert(f"![a]({url})\n")
+
+    def exhausted(*args, **kwargs):
+        raise OSError(errno.EMFILE, "Too many open files")
+
+    monkeypatch.setattr(disk_cache, "open", exhausted, raising=False)
+    converter = BaseConverter(profile=True, image_cache_dir=tmp_path)
+    document = converter.convert(f"![a]({url})\n")
+
+    assert len(document.inline_shapes) == 1
+    assert converter.get_stats().image_cache_hits == 0
+    assert converter.get_stats().bytes_fetched == len(server.images["/6.png"])
@@ -0,0 +1,80 @@
+"""
+关系索引测试
+"""
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.relations import RelationshipIndex, get_relationship_index
+
+
+def test_index_attached_to_document():
+    """测试每个文档只有一个索引"""
+    document = Document()
+    index = get_relationship_index(document)
+
+    assert isinstance(index, RelationshipIndex)
+    assert get_relationship_index(document) is index
+    assert get_relationship_index(Document()) is not index
+
+
+def test_matches_relate_to():
+    """测试得到的 rId 与 python-docx 的 relate_to 完全相同"""
+    urls = ["https://a.example", "https://b.example", "https://a.example", "mailto:x"]
+    expected = Document()
+    actual = Document()
+    index = get_relationship_index(actual)
+
+    expected_ids = [
+        expected.part.relate_to(url, RT.HYPERLINK, is_external=True) for url in urls
+    ]
+    actual_ids = [index.external(url) for url in urls]
+
+    assert actual_ids == expected_ids
+    assert actual_ids[0] == actual_ids[2]
+    assert actual.part.rels.xml == expected.part.rels.xml
+
+
+def test_relationships_added_elsewhere():
+    """测试通过 python-docx 直接添加的关系会被索引识别，rId 不冲突"""
+    document = Document()
+    part = document.part
+    index = get_relationship_index(document)
+    first = index.external("https://a.example")
+
+    other = part.relate_to("https://b.example", RT.HYPERLINK, is_external=True)
+    assert index.external("https://b.example") == other
+    new = index.external("https://c.example")
+    assert len({first, other, new}) == 3
+    assert part.relate_to("https://c.example", RT.HYPERLINK, is_external=True) == new
+
+
+def test_converter_reuses_relationships():
+    """测试转换器对相同地址的链接只建立一个关系"""
+    text = "[a](https://a.example) [b](https://a.example) [c](https://c.example)"
+    document = BaseConverter().convert(text)
+    targets = [rel.target_ref for rel in document.part.rels.values() if rel.is_external]
+
+    assert sorted(targets) == ["https://a.example", "https://c.example"]
+
+
+def test_internal_matches_relate_to():
+    """测试指向包内部件的关系与 relate_to 的 rId 相同，已有关系直接复用"""
+    expected = Document()
+    actual = Document()
+    index = get_relationship_index(actual)
+
+    assert index.internal(actual.part._styles_part, RT.STYLES) == (
+        expected.part.relate_to(expected.part._styles_part, RT.STYLES)
+    )
+    actual.part.relate_to("https://a.example", RT.HYPERLINK, is_external=True)
+    expected.part.relate_to("https://a.example", RT.HYPERLINK, is_external=True)
+    # 以正文部件自身作为目标，模拟一个新部件
+    assert index.internal(actual.part, RT.IMAGE) == (
+        expected.part.relate_to(expected.part, RT.IMAGE)
+    )
+    assert index.internal(actual.part, RT.IMAGE) == index.internal(
+        actual.part, RT.IMAGE
+    )
+    assert actual.part.rels.xml == expected.part.rels.xml
@@ -0,0 +1,75 @@
+"""
+转换器复用测试
+"""
+
+from mddocx.converter.base import BaseConverter
+
+
+class TestConverterReuse:
+    """转换器复用测试"""
+
+    def test_reset_starts_new_document(self):
+        """测试 reset 后内容不会在文档之间累积"""
+        converter = BaseConverter()
+        first = converter.convert("# 第一篇\n\n内容一")
+
+        second = converter.reset()
+        assert second is not first
+        assert converter.document is second
+
+        doc = converter.convert("# 第二篇")
+        assert doc is second
+        assert [p.text for p in doc.paragraphs] == ["第二篇"]
+        assert [p.text for p in first.paragraphs] == ["第一篇", "内容一"]
+
+    def test_reset_keeps_parser_and_converters(self):
+        """测试 reset 保留解析器和元素转换器"""
+        converter = BaseConverter()
+        md = converter.md
+        converters = dict(converter.converters)
+
+        converter.reset()
+
+        assert converter.md is md
+        assert converter.converters == converters
+        for element_converter in converter.converters.values():
+            assert element_converter.document is converter.document
+
+    def test_reset_clears_document_state(self):
+        """测试 reset 清除列表和代码块状态"""
+        converter = BaseConverter()
+        converter.convert("```\ncode\n```\n\n1. 一\n2. 二\n   - 嵌套")
+        assert converter.converters["code"]._last_was_code
+        assert converter.converters["list"]._current_lists
+
+        converter.reset()
+
+        assert converter._list_stack == []
+        assert not converter.converters["code"]._last_was_code
+        assert converter.converters["list"]._current_lists == []
+        assert converter.converters["list"]._current_numbers == {}
+
+    def test_reused_output_matches_fresh_converter(self):
+        """测试复用转换器的输出与新建转换器一致"""
+        content = "# 标题\n\n```\na\n```\n\n- 列表\n\n> 引用\n"
+        reused = BaseConverter()
+        reused.convert("```\nfirst\n```\n\n1. x\n")
+        reused.reset()
+
+        assert (
+            reused.convert(content).element.body.xml
+            == BaseConverter().convert(content).element.body.xml
+        )
+
+    def test_image_cache_policy(self):
+        """测试图片缓存策略"""
+        converter = BaseConverter()
+        image_converter = converter.converters["image"]
+        image_converter.memory_cache.put("a.png", b"data")
+
+        converter.reset()
+        assert "a.png" in image_converter.memory_cache
+
+        image_converter.keep_cache = False
+        converter.reset()
+        assert len(image_converter.memory_cache) == 0
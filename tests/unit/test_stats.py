@@ -0,0 +1,165 @@
+"""
+转换统计测试
+"""
+
+import io
+import json
+import zipfile
+from unittest.mock import patch
+
+from mddocx.cli import convert_file, main
+from mddocx.converter.base import BaseConverter
+
+CONTENT = """# 标题
+
+段落 **加粗** 和 [链接](https://example.com)
+
+| 列 1 | 列 2 |
+| --- | --- |
+| a | b |
+
+```
+code
+```
+"""
+
+
+class TestConversionStats:
+    """转换统计测试"""
+
+    def test_disabled_by_default(self):
+        """测试默认不收集统计"""
+        converter = BaseConverter()
+        converter.convert(CONTENT)
+        assert converter.get_stats() is None
+
+    def test_collects_stats(self):
+        """测试收集各阶段耗时、处理函数和文档内容统计"""
+        converter = BaseConverter(profile=True)
+        converter.convert(CONTENT)
+        buffer = io.BytesIO()
+        converter.save(buffer)
+
+        stats = converter.get_stats()
+        assert stats.parse_time > 0
+        assert stats.emit_time > 0
+        assert stats.save_time > 0
+        assert stats.total_time >= stats.parse_time + stats.emit_time
+        assert stats.handlers["heading"].calls == 1
+        assert stats.handlers["table"].calls == 1
+        assert stats.handlers["code"].calls == 1
+        assert stats.tables == 1
+        assert stats.images == 0
+        # 表格的 4 个单元格各有一个段落
+        assert stats.paragraphs == len(converter.document.paragraphs) + 4
+        assert stats.runs > stats.tables
+
+        data = stats.to_dict()
+        assert json.loads(json.dumps(data)) == data
+        assert data["handlers"]["heading"]["calls"] == 1
+        assert "解析" in stats.format()
+
+    def test_image_bytes(self, tmp_path):
+        """测试统计读取的图片字节数"""
+        image = tmp_path / "image.png"
+        image.write_bytes(b"not really a png")
+        converter = BaseConverter(profile=True)
+        converter.convert(f"![图]({image.as_posix()})")
+
+        stats = converter.get_stats()
+        assert stats.bytes_read == len(b"not really a png")
+        assert stats.bytes_fetched == 0
+
+    def test_reset_starts_new_stats(self):
+        """测试 reset 后统计重新开始"""
+        converter = BaseConverter(profile=True)
+        converter.convert(CONTENT)
+        first = converter.get_stats()
+
+        converter.reset()
+        converter.convert("# 只有标题")
+        second = converter.get_stats()
+
+        assert second is not first
+        assert second.handlers["heading"].calls == 1
+        assert "table" not in second.handlers or second.handlers["table"].calls == 0
+        assert first.handlers["table"].calls == 1
+
+    def test_set_profile(self):
+        """测试在已有转换器上开启统计"""
+        converter = BaseConverter()
+        converter.set_profile(True)
+        converter.convert(CONTENT)
+        assert converter.get_stats().handlers["paragraph"].calls == 1
+
+        converter.set_profile(False)
+        assert converter.get_stats() is None
+
+
+class TestStatsCLI:
+    """命令行统计输出测试"""
+
+    def test_convert_file_returns_stats(self, tmp_path):
+        """测试 convert_file 在开启统计时返回统计信息"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text(CONTENT, encoding="utf-8")
+        docx_path = tmp_path / "output.docx"
+
+        assert convert_file(str(md_path), str(docx_path)) is None
+        stats = convert_file(str(md_path), str(docx_path), profile=True)
+        assert stats.save_time > 0
+        assert stats.tables == 1
+
+    def test_stats_options(self, tmp_path, capsys):
+        """测试 --stats 和 --stats-json 选项"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text(CONTENT, encoding="utf-8")
+        docx_path = tmp_path / "output.docx"
+        json_path = tmp_path / "stats.json"
+
+        argv = [
+            "mddocx",
+            str(md_path),
+            str(docx_path),
+            "--stats",
+            "--stats-json",
+            str(json_path),
+        ]
+        with patch("sys.argv", argv):
+            main()
+
+        assert "转换统计" in capsys.readouterr().out
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        assert data["tables"] == 1
+        assert data["handlers"]["heading"]["calls"] == 1
+
+    def test_stats_json_before_positionals(self, tmp_path, capsys):
+        """测试 --stats-json 写在位置参数之前，PATH 为 - 时输出到标准输出"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text(CONTENT, encoding="utf-8")
+        docx_path = tmp_path / "output.docx"
+
+        argv = ["mddocx", "--stats-json", "-", str(md_path), str(docx_path)]
+        with patch("sys.argv", argv):
+            main()
+
+        out = capsys.readouterr().out
+        data = json.loads(out[out.index("{") :])
+        assert data["tables"] == 1
+        assert docx_path.exists()
+
+    def test_stats_json_to_stderr_with_stdout_output(self, tmp_path, capsys):
+        """测试文档写到标准输出时，--stats-json - 改为输出到标准错误"""
+        md_path = tmp_path / "input.md"
+        md_path.write_text(CONTENT, encoding="utf-8")
+
+        stdout = io.TextIOWrapper(io.BytesIO())
+
+        argv = ["mddocx", "--stats-json", "-", str(md_path), "-"]
+        with patch("sys.argv", argv), patch("sys.stdout", stdout):
+            main()
+
+        assert zipfile.is_zipfile(io.BytesIO(stdout.buffer.getvalue()))
+        err = capsys.readouterr().err
+        data = json.loads(err[err.index("{") :])
+        assert data["tables"] == 1
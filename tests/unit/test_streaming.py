@@ -0,0 +1,153 @@
+"""
+流式分块转换测试
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from mddocx.cli import convert_file
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.streaming import iter_chunks, scan_link_definitions
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+# 图片示例包含在线图片，不参与逐块比较
+STREAM_SAMPLES = sorted(
+    path for path in SAMPLES_DIR.glob("**/*.md") if path.name != "image.md"
+)
+
+
+def split(text, chunk_size=1):
+    """按最小块大小切分，返回所有块"""
+    return list(iter_chunks(text.splitlines(keepends=True), chunk_size))
+
+
+class TestIterChunks:
+    """分块规则测试"""
+
+    def test_split_at_blank_lines(self):
+        """测试在顶层块之间的空行处切分"""
+        chunks = split("# 标题\n\n段落一\n第二行\n\n段落二\n")
+        assert chunks == ["# 标题\n\n", "段落一\n第二行\n\n", "段落二\n"]
+        assert "".join(chunks) == "# 标题\n\n段落一\n第二行\n\n段落二\n"
+
+    def test_chunk_size(self):
+        """测试块在达到目标大小后才切分"""
+        text = "".join(f"段落{i}\n\n" for i in range(10))
+        chunks = split(text, chunk_size=20)
+        assert "".join(chunks) == text
+        assert len(chunks) < 10
+        assert all(len(chunk) >= 20 for chunk in chunks[:-1])
+
+    def test_fence_not_split(self):
+        """测试代码围栏内的空行不会被切分"""
+        text = "```python\na = 1\n\nb = 2\n\n~~~\n```\n\n后续\n"
+        assert split(text) == ["```python\na = 1\n\nb = 2\n\n~~~\n```\n\n", "后续\n"]
+
+    def test_longer_fence(self):
+        """测试较短的围栏不会结束较长的围栏"""
+        text = "````\n```\n\n文本\n````\n\n后续\n"
+        assert split(text) == ["````\n```\n\n文本\n````\n\n", "后续\n"]
+
+    def test_list_not_split(self):
+        """测试松散列表和缩进内容不会被切分"""
+        text = "- 一\n\n- 二\n\n  续行\n\n1. 三\n\n段落\n"
+        assert split(text) == ["- 一\n\n- 二\n\n  续行\n\n1. 三\n\n", "段落\n"]
+
+    def test_html_block_not_split(self):
+        """测试跨空行的 HTML 块不会被切分"""
+        text = "<!--\n注释\n\n仍是注释\n-->\n\n<pre>\n\n代码\n</pre>\n\n后续\n"
+        assert split(text) == [
+            "<!--\n注释\n\n仍是注释\n-->\n\n",
+            "<pre>\n\n代码\n</pre>\n\n",
+            "后续\n",
+        ]
+
+
+class TestScanLinkDefinitions:
+    """引用式链接定义扫描测试"""
+
+    def test_collect_definitions(self):
+        """测试收集顶层定义，同一标签只保留第一个"""
+        text = (
+            "[1]: https://a.example\n段落\n\n[2]: https://b.example\n"
+            '  [Foo  Bar]: https://c.example "标题"\n\n[foo bar]: https://d.example\n'
+        )
+        assert scan_link_definitions(text.splitlines(keepends=True)) == (
+            "[1]: https://a.example\n[2]: https://b.example\n"
+            '  [Foo  Bar]: https://c.example "标题"\n\n'
+        )
+
+    def test_skip_non_definitions(self):
+        """测试段落续行、代码围栏和 HTML 块中的内容不算定义"""
+        text = (
+            "段落\n[1]: https://a.example\n\n```\n\n[2]: https://b.example\n```\n\n"
+            "<!--\n\n[3]: https://c.example\n-->\n\n    [4]: https://d.example\n"
+        )
+        assert scan_link_definitions(text.splitlines(keepends=True)) == ""
+
+
+class TestConvertStream:
+    """流式转换测试"""
+
+    @pytest.mark.parametrize(
+        "sample", STREAM_SAMPLES, ids=[path.name for path in STREAM_SAMPLES]
+    )
+    def test_matches_full_conversion(self, sample):
+        """测试逐块转换的结果与整体转换一致"""
+        text = sample.read_text(encoding="utf-8")
+        expected = BaseConverter().convert(text).element.body.xml
+
+        with open(sample, "r", encoding="utf-8") as f:
+            doc = BaseConverter().convert_stream(f, chunk_size=1)
+
+        assert doc.element.body.xml == expected
+
+    def test_reference_definitions_across_chunks(self, tmp_path):
+        """测试引用式链接的定义在其他块中同样生效"""
+        text = "[链接][1]\n\n段落\n\n[1]: https://example.com\n\n[又一个][1]\n"
+        expected = BaseConverter().convert(text).element.body.xml
+        md_path = tmp_path / "input.md"
+        md_path.write_text(text, encoding="utf-8")
+
+        with open(md_path, "r", encoding="utf-8") as f:
+            doc = BaseConverter().convert_stream(f, chunk_size=1)
+
+        assert doc.element.body.xml == expected
+        assert doc.paragraphs[0].text == "链接"
+
+    def test_unseekable_input_definitions_chunk_local(self, caplog):
+        """测试只能读取一次的输入不预先扫描，定义只在所在的块内生效并记录警告"""
+        lines = iter(["[链接][1]\n", "\n", "[1]: https://example.com\n"])
+        with caplog.at_level("WARNING", logger="mddocx.converter.streaming"):
+            doc = BaseConverter().convert_stream(lines, chunk_size=1)
+
+        assert doc.paragraphs[0].text == "[链接][1]"
+        assert "引用式链接" in caplog.text
+
+    def test_accepts_string(self):
+        """测试直接传入字符串"""
+        doc = BaseConverter().convert_stream("# 标题\n\n段落\n", chunk_size=1)
+        assert [p.text for p in doc.paragraphs] == ["标题", "段落"]
+
+    def test_cli_stream(self):
+        """测试命令行的流式转换"""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".md", delete=False, encoding="utf-8"
+        ) as md_file:
+            md_file.write("# 标题\n\n```\na\n\nb\n```\n\n- 列表\n")
+            md_path = md_file.name
+        docx_path = md_path[:-3] + ".docx"
+
+        try:
+            convert_file(md_path, docx_path, stream=True)
+            texts = [p.text for p in Document(docx_path).paragraphs]
+            assert "标题" in texts
+            assert "a\n\nb" in "\n".join(texts)
+        finally:
+            for path in [md_path, docx_path]:
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,103 @@
+"""
+样式注册表测试
+"""
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.styles import StyleRegistry, get_style_registry
+
+
+def test_registry_attached_to_document():
+    """测试每个文档只有一个注册表，不同文档互不共享"""
+    document = Document()
+    registry = get_style_registry(document)
+
+    assert isinstance(registry, StyleRegistry)
+    assert get_style_registry(document) is registry
+    assert get_style_registry(Document()) is not registry
+
+
+def test_find_caches_style():
+    """测试样式查找结果被缓存，不存在的样式返回 None"""
+    registry = StyleRegistry(Document())
+
+    style = registry.find("Heading 1")
+    assert style.name == "Heading 1"
+    assert registry.find("Heading 1") is style
+    assert registry.find("不存在的样式") is None
+    assert "List Bullet" in registry
+    with pytest.raises(KeyError):
+        registry["不存在的样式"]
+
+
+def test_find_style_added_later():
+    """测试未命中不被缓存，之后添加的样式仍能找到"""
+    document = Document()
+    registry = StyleRegistry(document)
+
+    assert "自定义" not in registry
+    document.styles.add_style("自定义", WD_STYLE_TYPE.PARAGRAPH)
+    assert "自定义" in registry
+
+
+def test_ensure_creates_once():
+    """测试 ensure 只在样式不存在时创建并设置格式"""
+    document = Document()
+    registry = StyleRegistry(document)
+    calls = []
+
+    registry.ensure("Quote9", WD_STYLE_TYPE.PARAGRAPH, calls.append)
+    registry.ensure("Quote9", WD_STYLE_TYPE.PARAGRAPH, calls.append)
+
+    assert calls == [registry.find("Quote9")]
+    assert [s.name for s in document.styles].count("Quote9") == 1
+
+
+def test_style_id_matches_python_docx():
+    """测试样式 ID 与 python-docx 的解析结果一致"""
+    document = Document()
+    registry = StyleRegistry(document)
+
+    for name, style_type in [
+        ("Heading 1", WD_STYLE_TYPE.PARAGRAPH),
+        ("Normal", WD_STYLE_TYPE.PARAGRAPH),
+        ("Default Paragraph Font", WD_STYLE_TYPE.CHARACTER),
+        ("Table Grid", WD_STYLE_TYPE.TABLE),
+    ]:
+        expected = document.styles.get_style_id(name, style_type)
+        assert registry.style_id(name, style_type) == expected
+    with pytest.raises(ValueError):
+        registry.style_id("Heading 1", WD_STYLE_TYPE.CHARACTER)
+
+
+def test_apply_matches_python_docx():
+    """测试 apply_* 与设置 .style 属性的结果相同"""
+    expected = Document()
+    actual = Document()
+    registry = get_style_registry(actual)
+
+    for name in ["List Bullet 2", "Normal", "Heading 3"]:
+        expected.add_paragraph().style = name
+        registry.apply_paragraph_style(actual.add_paragraph(), name)
+    expected.add_paragraph().add_run("a").style = "Emphasis"
+    registry.apply_run_style(actual.add_paragraph().add_run("a"), "Emphasis")
+    expected.add_table(rows=1, cols=1).style = "Table Grid"
+    registry.apply_table_style(actual.add_table(rows=1, cols=1), "Table Grid")
+
+    assert actual.element.body.xml == expected.element.body.xml
+
+
+def test_reset_uses_new_registry():
+    """测试转换器 reset 后使用新文档的注册表"""
+    converter = BaseConverter()
+    converter.convert("> 引用\n\n- 列表\n")
+    first = get_style_registry(converter.document)
+
+    document = converter.reset()
+    converter.convert("> 引用\n")
+    expected = BaseConverter().convert("> 引用\n")
+    assert get_style_registry(document) is not first
+    assert document.element.body.xml == expected.element.body.xml
@@ -0,0 +1,94 @@
+"""
+文档模板缓存测试
+"""
+
+from io import BytesIO
+
+from docx import Document
+
+from mddocx.converter.base import BaseConverter
+from mddocx.converter.template import (
+    DocumentTemplate,
+    get_default_template,
+    new_document,
+)
+
+
+def _style_names(document):
+    return [style.name for style in document.styles]
+
+
+def test_default_template_is_shared():
+    """测试默认模板在进程内只构建一次"""
+    assert get_default_template() is get_default_template()
+    assert BaseConverter().template is get_default_template()
+
+
+def test_new_document_matches_fresh_document():
+    """测试复制的文档与 Document() 加转换器样式后的文档一致"""
+    expected = BaseConverter(template=DocumentTemplate()).document
+    reference = Document()
+    copied = new_document()
+
+    assert _style_names(copied) == _style_names(reference) + ["Code", "Hyperlink"]
+    assert _style_names(copied) == _style_names(expected)
+    assert copied.element.body.xml == reference.element.body.xml
+    assert [p.partname for p in copied.part.package.iter_parts()] == [
+        p.partname for p in reference.part.package.iter_parts()
+    ]
+
+
+def test_new_documents_are_independent():
+    """测试副本之间以及副本与模板之间互不影响"""
+    first = new_document()
+    second = new_document()
+    first.add_paragraph("第一篇")
+    first.styles.add_style("Only First", 1)
+
+    assert [p.text for p in first.paragraphs] == ["第一篇"]
+    assert second.paragraphs == []
+    assert "Only First" not in second.styles
+    assert "Only First" not in new_document().styles
+
+
+def test_copied_document_saves_and_reopens():
+    """测试副本可以保存并重新打开"""
+    document = new_document()
+    document.add_paragraph("内容")
+    stream = BytesIO()
+    document.save(stream)
+
+    reopened = Document(BytesIO(stream.getvalue()))
+    assert [p.text for p in reopened.paragraphs] == ["内容"]
+    assert "Code" in reopened.styles
+
+
+def test_custom_template_source(tmp_path):
+    """测试使用自定义 .docx 作为模板"""
+    source = Document()
+    source.add_paragraph("封面")
+    path = tmp_path / "template.docx"
+    source.save(str(path))
+
+    template = DocumentTemplate(str(path))
+    converter = BaseConverter(template=template)
+    converter.convert("# 标题")
+    assert [p.text for p in converter.document.paragraphs] == ["封面", "标题"]
+
+    converter.reset()
+    assert [p.text for p in converter.document.paragraphs] == ["封面"]
+
+
+def test_styles_copied_on_write():
+    """测试样式表在添加样式前与模板共用，保存时直接使用模板的内容"""
+    template = DocumentTemplate()
+    converter = BaseConverter(template=template)
+    styles_part = converter.document.part._styles_part
+    converter.convert("# 标题\n\n段落 [链接](https://example.com)\n\n- 列表\n")
+    assert styles_part._own is None
+    assert styles_part.blob is styles_part._shared_blob
+
+    converter.convert("> 一\n>\n> > 二\n")
+    assert styles_part._own is not None
+    assert "Quote2" in converter.document.styles
+    assert "Quote2" not in template.new_document().styles